@@ -0,0 +1,522 @@
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, TextIO
+import logging
+
+from app.config import AppConfig
+from app.core.json_to_pdf import JsonToPdfConverter
+from app.core.pdf_to_json import PdfToJsonConverter
+from app.utils.file_utils import FileUtils, FolderWatcher, ScannedFile
+from app.utils.logging_config import LoggingConfig
+from app.utils.serializers import OUTPUT_FORMATS
+
+JSON_TO_PDF = "json-to-pdf"
+PDF_TO_JSON = "pdf-to-json"
+
+
+def _convert_file(
+    input_path: str,
+    output_path: str,
+    direction: str,
+    engine: str,
+    long_table: bool = True,
+    max_pages: Optional[int] = None,
+    sanitize: bool = False,
+    artifacts: Optional[tuple[str, ...]] = None,
+    max_rss_mb: Optional[int] = None,
+    output_format: str = "json",
+    serializer: str = "auto"
+) -> tuple[str, bool, float]:
+    """
+    Convert a single file in a worker process
+
+    Args:
+        input_path: Source file path
+        output_path: Destination file path
+        direction: JSON_TO_PDF or PDF_TO_JSON
+        engine: Text extraction engine for PDF input
+        long_table: Render JSON input in long-table mode
+        max_pages: Optional cap on the pages extracted from PDF input
+        sanitize: Sanitize JSONL records before rendering them
+        artifacts: Per-page artifacts extracted from PDF input
+        max_rss_mb: Optional RSS ceiling for PDF extraction
+        output_format: Layout of JSON output ("json", "compact" or "ndjson")
+        serializer: JSON encoder backend for PDF to JSON output
+
+    Returns:
+        Input path, success flag and elapsed seconds
+    """
+    start = time.perf_counter()
+    try:
+        if direction == JSON_TO_PDF and input_path.lower().endswith(".jsonl"):
+            success = JsonToPdfConverter.convert_jsonl(input_path, output_path, sanitize=sanitize)
+        elif direction == JSON_TO_PDF:
+            data = Path(input_path).read_text(encoding="utf-8")
+            success = JsonToPdfConverter.convert(data, output_path, long_table=long_table)
+        else:
+            success = PdfToJsonConverter.convert(
+                input_path,
+                output_path,
+                stream=True,
+                engine=engine,
+                max_pages=max_pages,
+                artifacts=artifacts,
+                max_rss_mb=max_rss_mb,
+                output_format=output_format,
+                serializer=serializer
+            )
+    except Exception as e:
+        logging.error(f"Batch conversion error for {input_path}: {e}")
+        success = False
+    return input_path, success, time.perf_counter() - start
+
+
+class BatchManifest:
+    """
+    Append-only JSONL record of finished conversions.
+
+    Each line stores the input path with the size and modification time it
+    had when converted, so a rerun skips inputs that are done and unchanged.
+    """
+    def __init__(self, manifest_path: Path):
+        self.manifest_path = manifest_path
+        self._completed: dict[str, tuple[int, int]] = {}
+        self._file: Optional[TextIO] = None
+
+    def load(self) -> int:
+        """
+        Read previously completed entries
+
+        Returns:
+            Number of completed entries found
+        """
+        if not self.manifest_path.exists():
+            return 0
+
+        with open(self.manifest_path, encoding="utf-8") as manifest_file:
+            for line in manifest_file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn last line from an interrupted run
+                    continue
+                if entry.get("status") == "done":
+                    self._completed[entry["input"]] = (entry["size"], entry["mtime_ns"])
+        return len(self._completed)
+
+    def is_done(self, input_path: Path, signature: Optional[tuple[int, int]] = None) -> bool:
+        """
+        Check whether an unchanged input was already converted
+
+        Args:
+            input_path: Input file path
+            signature: (size, mtime_ns) already read by a scan, to avoid
+                another stat call
+        """
+        if signature is None:
+            stat = input_path.stat()
+            signature = (stat.st_size, stat.st_mtime_ns)
+        return self._completed.get(str(input_path)) == signature
+
+    def record(
+        self,
+        input_path: Path,
+        output_path: Path,
+        success: bool,
+        signature: tuple[int, int]
+    ) -> None:
+        """
+        Append a finished conversion and flush it to disk
+
+        Args:
+            input_path: Input file path
+            output_path: Output file path
+            success: Whether the conversion succeeded
+            signature: (size, mtime_ns) read when the input was scanned,
+                so an input changed during the conversion is converted
+                again and a deleted one cannot fail the batch
+        """
+        if self._file is None:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.manifest_path, "a", encoding="utf-8")
+
+        size, mtime_ns = signature
+        self._file.write(json.dumps({
+            "input": str(input_path),
+            "output": str(output_path),
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "status": "done" if success else "failed"
+        }) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ProgressReporter:
+    """
+    Throttled throughput and ETA reporting on a text stream.
+    """
+    def __init__(self, total: int, stream: TextIO = sys.stderr, interval: float = 0.5):
+        self.total = total
+        self.stream = stream
+        self.interval = interval
+        self.completed = 0
+        self.failed = 0
+        self._start = time.perf_counter()
+        self._last_report = 0.0
+
+    def update(self, success: bool) -> None:
+        self.completed += 1
+        self.failed += 0 if success else 1
+        now = time.perf_counter()
+        if now - self._last_report >= self.interval or self.completed == self.total:
+            self._last_report = now
+            self.stream.write(f"\r{self.format_line(now - self._start)}")
+            self.stream.flush()
+
+    def format_line(self, elapsed: float) -> str:
+        rate = self.completed / elapsed if elapsed > 0 else 0.0
+        remaining = self.total - self.completed
+        eta = remaining / rate if rate > 0 else 0.0
+        return (
+            f"[{self.completed}/{self.total}] {rate:.1f} files/s "
+            f"ETA {time.strftime('%H:%M:%S', time.gmtime(eta))} "
+            f"failed {self.failed}"
+        )
+
+    def finish(self) -> None:
+        self.stream.write("\n")
+        self.stream.flush()
+
+
+class BatchConverter:
+    """
+    Headless, parallel conversion of every supported file in a directory.
+
+    Outputs mirror the input tree under `output_dir`. `run` converts what
+    is there once; `watch` keeps polling and converts files as they appear
+    or change.
+    """
+    def __init__(
+        self,
+        config: AppConfig,
+        output_dir: Path,
+        manifest_path: Path,
+        workers: int,
+        engine: str,
+        max_pages: Optional[int] = None,
+        sanitize: bool = False,
+        artifacts: Optional[tuple[str, ...]] = None,
+        output_format: Optional[str] = None,
+        recursive: bool = False
+    ):
+        self.config = config
+        self.output_dir = output_dir
+        self.manifest = BatchManifest(manifest_path)
+        self.workers = workers
+        self.engine = engine
+        self.max_pages = max_pages
+        self.sanitize = sanitize
+        self.artifacts = artifacts
+        self.output_format = output_format or config.output_format
+        self.recursive = recursive
+        self.json_extensions = config.supported_extenstions["json"]
+        self.pdf_extensions = config.supported_extenstions["pdf"]
+
+    def plan(self, input_dir: Path) -> list[tuple[Path, Path, str, tuple[int, int]]]:
+        """
+        Discover inputs and derive their output paths and directions
+
+        Args:
+            input_dir: Directory to scan
+
+        Returns:
+            (input path, output path, direction, scanned signature) for
+            each pending input
+        """
+        files = list(FileUtils.scan_files(
+            input_dir,
+            self.json_extensions + self.pdf_extensions,
+            max_size_mb=self.config.max_file_size_mb,
+            recursive=self.recursive,
+            exclude=[self.output_dir]
+        ))
+        stems = Counter((scanned.path.parent, scanned.path.stem) for scanned in files)
+        return self._plan_files(input_dir, files, stems)
+
+    def run(self, input_dir: Path, progress_stream: TextIO = sys.stderr) -> int:
+        """
+        Convert all pending inputs on a process pool
+
+        Args:
+            input_dir: Directory to scan
+            progress_stream: Stream receiving progress lines
+
+        Returns:
+            Number of failed conversions
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        skipped = self.manifest.load()
+        jobs = self.plan(input_dir)
+        progress_stream.write(f"{len(jobs)} files to convert, {skipped} done in manifest\n")
+        if not jobs:
+            return 0
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                **LoggingConfig.worker_pool_options()
+            ) as pool:
+                return self._convert_jobs(pool, jobs, progress_stream)
+        finally:
+            self.manifest.close()
+
+    def watch(
+        self,
+        input_dir: Path,
+        interval: float = 2.0,
+        stop_event: Optional[threading.Event] = None,
+        progress_stream: TextIO = sys.stderr
+    ) -> int:
+        """
+        Poll a directory and convert new or changed inputs until stopped
+
+        Inputs already recorded as done in the manifest are skipped, so a
+        restarted watch picks up where it left off.
+
+        Args:
+            input_dir: Directory to watch
+            interval: Seconds between polls
+            stop_event: Optional event that ends the watch when set
+            progress_stream: Stream receiving progress lines
+
+        Returns:
+            Number of failed conversions
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        skipped = self.manifest.load()
+        progress_stream.write(f"Watching {input_dir}, {skipped} done in manifest\n")
+        watcher = FolderWatcher(
+            input_dir,
+            self.json_extensions + self.pdf_extensions,
+            max_size_mb=self.config.max_file_size_mb,
+            recursive=self.recursive,
+            exclude=[self.output_dir]
+        )
+        stop_event = stop_event or threading.Event()
+        stems: Counter = Counter()
+        seen: set[Path] = set()
+        failed = 0
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                **LoggingConfig.worker_pool_options()
+            ) as pool:
+                while True:
+                    ready = watcher.poll()
+                    for scanned in ready:
+                        if scanned.path not in seen:
+                            seen.add(scanned.path)
+                            stems[(scanned.path.parent, scanned.path.stem)] += 1
+                    jobs = self._plan_files(input_dir, ready, stems)
+                    if jobs:
+                        failed += self._convert_jobs(pool, jobs, progress_stream)
+                    if stop_event.wait(interval):
+                        return failed
+        finally:
+            self.manifest.close()
+
+    def _plan_files(
+        self,
+        input_dir: Path,
+        files: Iterable[ScannedFile],
+        stems: Counter
+    ) -> list[tuple[Path, Path, str, tuple[int, int]]]:
+        jobs = []
+        for scanned in files:
+            file = scanned.path
+            extension = file.suffix.lstrip(".").lower()
+            direction = JSON_TO_PDF if extension in self.json_extensions else PDF_TO_JSON
+            if direction == JSON_TO_PDF:
+                output_extension = "pdf"
+            else:
+                output_extension = "jsonl" if self.output_format == "ndjson" else "json"
+            # Keep the full name when two inputs share a stem (report.json, report.jsonl)
+            output_name = file.stem if stems[(file.parent, file.stem)] == 1 else file.name
+            relative_dir = file.parent.relative_to(input_dir)
+            output_path = self.output_dir / relative_dir / f"{output_name}.{output_extension}"
+            if not self.manifest.is_done(file, scanned.signature):
+                jobs.append((file, output_path, direction, scanned.signature))
+        return jobs
+
+    def _convert_jobs(
+        self,
+        pool: ProcessPoolExecutor,
+        jobs: list[tuple[Path, Path, str, tuple[int, int]]],
+        progress_stream: TextIO
+    ) -> int:
+        progress = ProgressReporter(len(jobs), progress_stream)
+        outputs = {str(job[0]): job for job in jobs}
+        try:
+            for input_path, success, _ in self._iter_results(pool, jobs):
+                source, destination, _, signature = outputs.pop(input_path)
+                self.manifest.record(source, destination, success, signature)
+                progress.update(success)
+        finally:
+            progress.finish()
+        return progress.failed
+
+    def _iter_results(
+        self,
+        pool: ProcessPoolExecutor,
+        jobs: list[tuple[Path, Path, str, tuple[int, int]]]
+    ) -> Iterator[tuple[str, bool, float]]:
+        # Bound in-flight work so huge directories do not queue every job up front
+        max_in_flight = self.workers * 4
+        pending: set[Future] = set()
+        output_dirs: set[Path] = set()
+        for input_path, output_path, direction, _ in jobs:
+            if output_path.parent not in output_dirs:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_dirs.add(output_path.parent)
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(pool.submit(
+                _convert_file,
+                str(input_path),
+                str(output_path),
+                direction,
+                self.engine,
+                self.config.long_table,
+                self.max_pages,
+                self.sanitize,
+                self.artifacts,
+                self.config.extraction_max_rss_mb,
+                self.output_format,
+                self.config.json_serializer
+            ))
+
+        for future in wait(pending).done:
+            yield future.result()
+
+
+def build_parser(config: AppConfig) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="docubridge-batch",
+        description="Convert every JSON/PDF file in a directory without the GUI."
+    )
+    parser.add_argument("input_dir", type=Path, help="directory containing files to convert")
+    parser.add_argument(
+        "-o", "--output-dir", type=Path, default=config.output_dir,
+        help="directory for converted files (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=config.batch_workers,
+        help="number of worker processes (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--manifest", type=Path,
+        help="manifest used to resume interrupted runs (default: OUTPUT_DIR/manifest.jsonl)"
+    )
+    parser.add_argument(
+        "--engine", default=config.extraction_engine,
+        help="PDF text extraction engine (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--artifacts", type=lambda value: tuple(value.split(",")),
+        default=config.extraction_artifacts,
+        help="comma-separated PDF artifacts to extract: text, tables, words, images (default: text)"
+    )
+    parser.add_argument(
+        "--output-format", choices=OUTPUT_FORMATS, default=config.output_format,
+        help="layout of JSON output: indented json, compact json or one ndjson line per page (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--max-pages", type=int,
+        help="only extract the first N pages of each PDF"
+    )
+    parser.add_argument(
+        "--sanitize", action="store_true", default=config.sanitize_jsonl,
+        help="drop secret keys and truncate long strings in JSONL records"
+    )
+    parser.add_argument(
+        "--restart", action="store_true",
+        help="ignore the existing manifest and convert everything again"
+    )
+    parser.add_argument(
+        "-r", "--recursive", action="store_true",
+        help="also convert files in subdirectories, mirroring them under OUTPUT_DIR"
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="keep running and convert files as they are added or changed"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=config.watch_interval,
+        help="seconds between polls in watch mode (default: %(default)s)"
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point for headless batch conversion.
+
+    Returns:
+        Exit code: 0 when every file converted, 1 otherwise.
+    """
+    config = AppConfig()
+    args = build_parser(config).parse_args(argv)
+    LoggingConfig.configure_logging(
+        config.log_dir,
+        logging.WARNING,
+        queued=config.log_queued,
+        page_log_level=config.page_log_level,
+        page_log_sample_every=config.page_log_sample_every
+    )
+
+    if not args.input_dir.is_dir():
+        logging.error(f"Input directory not found: {args.input_dir}")
+        return 1
+
+    manifest_path = args.manifest or args.output_dir / "manifest.jsonl"
+    if args.restart:
+        manifest_path.unlink(missing_ok=True)
+
+    batch = BatchConverter(
+        config,
+        args.output_dir,
+        manifest_path,
+        max(1, args.workers),
+        args.engine,
+        args.max_pages,
+        args.sanitize,
+        args.artifacts,
+        args.output_format,
+        args.recursive
+    )
+    try:
+        if args.watch:
+            failed = batch.watch(args.input_dir, args.interval)
+        else:
+            failed = batch.run(args.input_dir)
+    except KeyboardInterrupt:
+        sys.stderr.write("Interrupted; rerun the same command to resume.\n")
+        return 130
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,11 @@
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
+import logging
 import os
 
+from app.utils.file_utils import OutputAllocator
+
 @dataclass
 class AppConfig:
     """
@@ -11,6 +15,8 @@ class AppConfig:
     base_dir: Path = field(default_factory=lambda: Path(__file__).parent.parent)
     log_dir: Path = field(init=False)
     output_dir: Path = field(init=False)
+    cache_dir: Path = field(init=False)
+    output_allocator: OutputAllocator = field(init=False, repr=False, compare=False)
 
     max_file_size_mb: int = 100
     supported_extenstions: dict[str, list[str]] = field(default_factory=lambda: {
@@ -18,12 +24,56 @@ class AppConfig:
         "pdf": ["pdf", "pdfa"]
     })
 
+    # Parallel PDF extraction
+    extraction_workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    extraction_pages_per_shard: int = 50
+    stream_pdf_to_json: bool = True
+    extraction_engine: str = "pdfplumber"
+    extraction_artifacts: tuple[str, ...] = ("text",)
+    extraction_max_rss_mb: Optional[int] = None
+    # PDF to JSON output: "json", "compact" or "ndjson"; serializer "auto",
+    # "orjson" or "stdlib"
+    output_format: str = "json"
+    json_serializer: str = "auto"
+
+    # JSON to PDF rendering
+    long_table: bool = True
+    table_column_ratios: Optional[tuple[float, float]] = None
+    sanitize_jsonl: bool = False
+
+    # Concurrent conversions started from the GUI
+    gui_workers: int = 2
+
+    # Headless batch conversion
+    batch_workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    watch_interval: float = 2.0
+
+    # Local conversion service
+    service_host: str = "127.0.0.1"
+    service_port: int = 8765
+    service_workers: int = 2
+    service_queue_size: int = 100
+    service_job_retention: int = 1000
+    # Run service jobs on worker processes; False keeps them on threads
+    service_use_processes: bool = True
+
+    # Conversion cache
+    cache_enabled: bool = True
+    cache_max_size_mb: int = 512
+
+    # Logging; per-page stage events are DEBUG records on their own logger
+    log_queued: bool = True
+    page_log_level: int = logging.INFO
+    page_log_sample_every: int = 100
+
     def __post_init__(self):
         """
         Initialize derived paths and ensure directory existence.
         """
         self.log_dir = self.base_dir / "logs"
         self.output_dir = self.base_dir / "output"
+        self.cache_dir = self.output_dir / ".cache"
+        self.output_allocator = OutputAllocator(self.output_dir)
 
         # Create necessary directories
         for directory in [self.log_dir, self.output_dir]:
@@ -33,6 +83,9 @@ class AppConfig:
         """
         Generate a unique output file path
 
+        Names are allocated in constant time without probing the output
+        directory (see `OutputAllocator`).
+
         Args:
             filename: Base filename
             extension: File extension
@@ -40,11 +93,4 @@ class AppConfig:
         Returns:
             Unique file path
         """
-        counter = 1
-        output_path = self.output_dir / f"{filename}.{extension}"
-
-        while output_path.exists():
-            output_path = self.output_dir / f"{filename}_{counter}.{extension}"
-            counter += 1
-
-        return output_path
+        return self.output_allocator.allocate(extension, prefix=filename)
@@ -0,0 +1,218 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Event
+from typing import Any, Optional
+
+from app.core.json_to_pdf import JsonToPdfConverter
+from app.core.pdf_to_json import PdfToJsonConverter
+from app.utils.logging_config import LoggingConfig
+
+# Converter entry points callable through the executor
+_CONVERTERS = {
+    "json_to_pdf": JsonToPdfConverter.convert,
+    "jsonl_to_pdf": JsonToPdfConverter.convert_jsonl,
+    "pdf_to_json": PdfToJsonConverter.convert,
+}
+
+
+@dataclass
+class ConversionResult:
+    """
+    Outcome of an asynchronous conversion.
+    """
+    direction: str
+    output_path: Path
+    success: bool = False
+    error: Optional[str] = None
+    queued_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        JSON-compatible view of the result
+        """
+        return {
+            "direction": self.direction,
+            "output_path": str(self.output_path),
+            "success": self.success,
+            "error": self.error,
+            "queued_seconds": self.queued_seconds,
+            "elapsed_seconds": self.elapsed_seconds,
+        }
+
+
+def _run_conversion(direction: str, args: tuple, kwargs: dict[str, Any]) -> tuple[bool, float]:
+    """
+    Run one converter call and time it
+
+    Module level so process executors can pickle it.
+
+    Returns:
+        Converter result and the wall time spent in the converter
+    """
+    started = time.perf_counter()
+    success = _CONVERTERS[direction](*args, **kwargs)
+    return success, time.perf_counter() - started
+
+
+class AsyncConverter:
+    """
+    asyncio entry points for both converters.
+
+    Conversions run on an executor, so reportlab and pdfminer never block
+    the event loop. At most `max_concurrency` conversions run at once;
+    pass the same `semaphore` to several AsyncConverter instances to share
+    one limit between them. Cancelling the awaiting task (directly or via
+    asyncio.timeout) sets the converter's cancel event and re-raises
+    CancelledError; the slot is held until the converter has actually
+    stopped so the limit stays accurate.
+
+    Thread executors are the default: converters are imported once and
+    results stay in-process. With `use_processes=True`, conversions run in
+    a process pool for true CPU parallelism; cancel events then go through
+    a multiprocessing manager, and progress callbacks are not supported.
+    """
+    def __init__(
+        self,
+        max_concurrency: int = 2,
+        executor: Optional[Executor] = None,
+        use_processes: bool = False,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.use_processes = use_processes or isinstance(executor, ProcessPoolExecutor)
+        self._semaphore = semaphore or asyncio.Semaphore(self.max_concurrency)
+        self._owns_executor = executor is None
+        if executor is not None:
+            self.executor = executor
+        elif use_processes:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_concurrency,
+                **LoggingConfig.worker_pool_options()
+            )
+        else:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="docubridge-async"
+            )
+        self._manager = None
+
+    async def __aenter__(self) -> "AsyncConverter":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def json_to_pdf(
+        self,
+        data: str | dict[str, Any],
+        output_path: str | Path,
+        **options: Any
+    ) -> ConversionResult:
+        """
+        Convert JSON data to PDF
+
+        Args:
+            data: JSON data (string or dictionary)
+            output_path: Destination PDF file path
+            options: Keyword arguments for JsonToPdfConverter.convert
+
+        Returns:
+            Structured conversion result
+        """
+        return await self._run("json_to_pdf", (data, str(output_path)), output_path, options)
+
+    async def jsonl_to_pdf(
+        self,
+        input_path: str | Path,
+        output_path: str | Path,
+        **options: Any
+    ) -> ConversionResult:
+        """
+        Convert a JSON Lines file to PDF
+
+        Args:
+            input_path: Source JSONL file path
+            output_path: Destination PDF file path
+            options: Keyword arguments for JsonToPdfConverter.convert_jsonl
+
+        Returns:
+            Structured conversion result
+        """
+        return await self._run("jsonl_to_pdf", (str(input_path), str(output_path)), output_path, options)
+
+    async def pdf_to_json(
+        self,
+        pdf_path: str | Path,
+        output_path: str | Path,
+        **options: Any
+    ) -> ConversionResult:
+        """
+        Convert a PDF file to JSON
+
+        Args:
+            pdf_path: Source PDF file path
+            output_path: Destination JSON file path
+            options: Keyword arguments for PdfToJsonConverter.convert
+
+        Returns:
+            Structured conversion result
+        """
+        return await self._run("pdf_to_json", (str(pdf_path), str(output_path)), output_path, options)
+
+    async def aclose(self) -> None:
+        """
+        Shut down the executor without blocking the event loop
+        """
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    def _new_cancel_event(self) -> Event:
+        if not self.use_processes:
+            return Event()
+        if self._manager is None:
+            import multiprocessing
+
+            self._manager = multiprocessing.Manager()
+        return self._manager.Event()
+
+    async def _run(
+        self,
+        direction: str,
+        args: tuple,
+        output_path: str | Path,
+        options: dict[str, Any]
+    ) -> ConversionResult:
+        if "cancel_event" in options:
+            raise ValueError("cancel_event is managed by AsyncConverter; cancel the task instead")
+        if self.use_processes and options.get("progress_callback") is not None:
+            raise ValueError("progress_callback is not supported with a process executor")
+
+        result = ConversionResult(direction=direction, output_path=Path(output_path))
+        queued_at = time.perf_counter()
+        async with self._semaphore:
+            result.queued_seconds = time.perf_counter() - queued_at
+            cancel_event = self._new_cancel_event()
+            future = self.executor.submit(
+                _run_conversion, direction, args, {**options, "cancel_event": cancel_event}
+            )
+            try:
+                result.success, result.elapsed_seconds = await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                cancel_event.set()
+                if not future.cancel():
+                    # Already running: keep the slot until the converter
+                    # notices the event and returns
+                    await asyncio.wait([asyncio.wrap_future(future)])
+                raise
+            except Exception as e:
+                result.error = str(e)
+        if not result.success and result.error is None:
+            result.error = "conversion failed, see the log"
+        return result
@@ -1,10 +1,147 @@
-from typing import Any
+from itertools import chain, islice
+from threading import Event
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterable, Iterator, Optional
+import io
 import json
 import logging
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib import colors
+import os
+
+from app.core.progress import (
+    ConversionCancelled,
+    ProgressCallback,
+    check_cancelled,
+    report_progress
+)
+from app.utils.cache_utils import ConversionCache
+from app.utils.file_utils import BUFFER_TYPES, FileUtils, InputSource, OutputTarget
+from app.utils.json_utils import JsonSanitizer
+from app.utils.metrics import METRICS
+from app.utils.serializers import get_serializer
+
+# reportlab takes a few hundred milliseconds to import, so it is loaded on
+# first use rather than when this module is imported
+if TYPE_CHECKING:
+    from reportlab.platypus import TableStyle
+
+TABLE_HEADER = ["Key", "Value"]
+
+# reportlab's `letter`, in points
+PAGE_SIZE = (612.0, 792.0)
+
+# Matches the SimpleDocTemplate defaults used by `convert`
+PAGE_MARGIN = 72
+
+# Body cell font and default horizontal cell padding, used to fit text up front
+BODY_FONT = "Helvetica"
+BODY_FONT_SIZE = 10
+CELL_PADDING = 12
+
+# Rows sampled to size the key column in long-table mode
+COLUMN_SAMPLE_ROWS = 200
+
+
+def _table_style_commands() -> list[tuple]:
+    """
+    TableStyle commands shared by every rendering mode
+    """
+    from reportlab.lib import colors
+
+    return [
+        ('BACKGROUND', (0,0), (-1,0), colors.grey),
+        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
+        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0,0), (-1,0), 12),
+        ('BOTTOMPADDING', (0,0), (-1,0), 12),
+        ('BACKGROUND', (0,1), (-1,-1), colors.beige),
+        ('TEXTCOLOR', (0,1), (-1,-1), colors.black),
+        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+        ('FONTNAME', (0,1), (-1,-1), 'Helvetica'),
+        ('FONTSIZE', (0,1), (-1,-1), 10),
+        ('GRID', (0,0), (-1,-1), 1, colors.black)
+    ]
+
+
+class RenderTemplate:
+    """
+    Rendering setup shared by many conversions.
+
+    Building the table style, measuring the rows that fit on a page and
+    looking up font metrics costs more than rendering a small document,
+    so batch callers build one template and pass it to every conversion.
+    Templates are read-only after construction and safe to share between
+    threads.
+    """
+    def __init__(
+        self,
+        page_size: tuple[float, float] = PAGE_SIZE,
+        margin: float = PAGE_MARGIN,
+        column_ratios: Optional[tuple[float, float]] = None
+    ):
+        """
+        Args:
+            page_size: Page (width, height) in points
+            margin: Margin on every side in points
+            column_ratios: Fixed (key, value) column width fractions for
+                long-table mode, sampled per document when omitted
+        """
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        from reportlab.platypus import TableStyle
+
+        self.page_size = page_size
+        self.margin = margin
+        self.column_ratios = column_ratios
+        self.available_width = page_size[0] - 2 * margin
+        self.available_height = page_size[1] - 2 * margin
+        self.table_style = TableStyle(_table_style_commands())
+        self.ellipsis_width = stringWidth("…", BODY_FONT, BODY_FONT_SIZE)
+        # Cells are single lines, so the row height does not depend on the
+        # column widths and one measurement serves every layout
+        self.rows_per_page = JsonToPdfConverter._fit_rows_per_page(
+            [self.available_width / 2] * 2,
+            self.table_style,
+            self.available_height
+        )
+
+    @property
+    def cache_options(self) -> dict[str, Any]:
+        """
+        Template settings that change the rendered output
+        """
+        return {
+            "page_size": self.page_size,
+            "margin": self.margin,
+            "column_ratios": self.column_ratios,
+        }
+
+    def column_layout(self, column_ratios: tuple[float, float]) -> tuple[list[float], list[float]]:
+        """
+        Column and text widths for a pair of column ratios
+
+        Args:
+            column_ratios: (key, value) column width fractions
+
+        Returns:
+            Column widths and the text widths inside their padding
+        """
+        col_widths = [self.available_width * ratio for ratio in column_ratios]
+        return col_widths, [width - CELL_PADDING for width in col_widths]
+
+
+_default_template: Optional[RenderTemplate] = None
+
+
+def default_template() -> RenderTemplate:
+    """
+    Shared template with the default page setup, built on first use
+
+    Returns:
+        Default render template
+    """
+    global _default_template
+    if _default_template is None:
+        _default_template = RenderTemplate()
+    return _default_template
 
 
 class JsonToPdfConverter:
@@ -14,97 +151,583 @@ class JsonToPdfConverter:
     @classmethod
     def convert(
         cls,
-        data: str | dict[str, Any],
-        output_path: str
+        data: str | dict[str, Any] | InputSource,
+        output_path: OutputTarget,
+        cache: Optional[ConversionCache] = None,
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None,
+        long_table: bool = False,
+        column_ratios: Optional[tuple[float, float]] = None,
+        template: Optional[RenderTemplate] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        cancel_event: Optional[Event] = None
     ) -> bool:
         """
         Comprehensive JSON to PDF conversion
 
+        In long-table mode, rows are fitted to precomputed column widths
+        and drawn as page-sized tables, so render time grows linearly with
+        the row count instead of reportlab sizing one huge table.
+
         Args:
-            data: JSON data (string or dictionary)
-            output_path: Destination PDF file path
+            data: JSON data as a string or dictionary, or encoded JSON in a
+                buffer (bytes, memoryview, mmap), a binary file-like object
+                or a file given as a path-like object (a plain str is
+                always parsed as JSON text)
+            output_path: Destination PDF file path or writable binary stream
+            cache: Optional conversion cache consulted before rendering
+            max_depth: Nesting levels to expand before serializing the rest
+            max_items: Maximum elements kept per array
+            long_table: Render page-sized table chunks with fitted cells
+            column_ratios: Fixed (key, value) column width fractions for
+                long-table mode, taken from the template or sampled from
+                the rows when omitted
+            template: Reusable render setup, the shared default when omitted
+            progress_callback: Optional callback receiving (rows rendered, total)
+            cancel_event: Optional event that cancels the conversion when set
 
         Returns:
             Boolean indicating successful conversion
         """
         try:
+            if not isinstance(data, (str, dict, list, *BUFFER_TYPES)):
+                # A path-like object names a JSON file; a plain str is JSON text
+                with FileUtils.open_input(data) as json_file:
+                    data = json_file.read()
+
+            cache_key = None
+            # Buffer outputs are not cached; they never touch the disk
+            if cache is not None and FileUtils.is_path(output_path):
+                try:
+                    if isinstance(data, BUFFER_TYPES):
+                        payload = data
+                    elif isinstance(data, str):
+                        payload = data.encode("utf-8")
+                    else:
+                        # Rows are rendered in document order, so the key
+                        # must not sort keys; str() matches how leaves render
+                        payload = json.dumps(data, default=str).encode("utf-8")
+                    cache_key = cache.key_for_bytes(
+                        payload,
+                        direction="json_to_pdf",
+                        max_depth=max_depth,
+                        max_items=max_items,
+                        long_table=long_table,
+                        column_ratios=column_ratios,
+                        template=template.cache_options if template else None
+                    )
+                except Exception as e:
+                    # The cache is an optimisation; convert without it
+                    logging.warning(f"JSON to PDF cache key error, not caching: {e}")
+                if cache_key and cache.get(cache_key, output_path):
+                    return True
+
+            template = template or default_template()
+
             # Parse string input if necessary
             if isinstance(data, str):
-                data = json.loads(data)
+                with METRICS.span("json_to_pdf.parse", chars=len(data)):
+                    data = json.loads(data)
+            elif isinstance(data, BUFFER_TYPES):
+                with METRICS.span("json_to_pdf.parse", bytes=len(data)), memoryview(data) as view:
+                    data = get_serializer().loads(view)
 
-            # Create PDF document
-            doc = SimpleDocTemplate(output_path, pagesize=letter)
-            elements = []
+            if long_table:
+                with METRICS.span("json_to_pdf.flatten") as span:
+                    rows = [
+                        [key, value]
+                        for key, value in cls._iter_flattened(
+                            data,
+                            max_depth=max_depth,
+                            max_items=max_items
+                        )
+                    ]
+                    span["rows"] = len(rows)
+                with FileUtils.output_target(output_path) as partial_output:
+                    page_count = cls._render_row_pages(
+                        rows,
+                        partial_output,
+                        column_ratios=column_ratios,
+                        template=template,
+                        on_page=lambda rows_done: report_progress(progress_callback, rows_done, len(rows)),
+                        cancel_event=cancel_event
+                    )
+                    if page_count == 0:
+                        raise ValueError("No data to convert")
 
-            # get styles
-            styles = getSampleStyleSheet()
+                if cache_key:
+                    cache.put(cache_key, output_path)
+                return True
 
-            # Flatten and process JSON
-            flattened_data = cls._flatten_json(data)
+            from reportlab.platypus import SimpleDocTemplate, Table
 
-            # Create table data
-            table_data = [["Key", "Value"]]
-            table_data.extend([
-                [str(key), str(value)]
-                for key, value in flattened_data.items()
-            ])
+            # Flatten JSON straight into table rows
+            with METRICS.span("json_to_pdf.flatten") as span:
+                table_data = [TABLE_HEADER]
+                table_data.extend(
+                    [key, value]
+                    for key, value in cls._iter_flattened(
+                        data,
+                        max_depth=max_depth,
+                        max_items=max_items
+                    )
+                )
+                row_count = len(table_data) - 1
+                span["rows"] = row_count
+            if row_count == 0:
+                raise ValueError("No data to convert")
+            report_progress(progress_callback, 0, row_count)
 
             # Create table with styling
-            table = Table(table_data, repeatRows=1)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (-1,0), colors.grey),
-                ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-                ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-                ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0,0), (-1,0), 12),
-                ('BOTTOMPADDING', (0,0), (-1,0), 12),
-                ('BACKGROUND', (0,1), (-1,-1), colors.beige),
-                ('TEXTCOLOR', (0,1), (-1,-1), colors.black),
-                ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-                ('FONTNAME', (0,1), (-1,-1), 'Helvetica'),
-                ('FONTSIZE', (0,1), (-1,-1), 10),
-                ('GRID', (0,0), (-1,-1), 1, colors.black)
-            ]))
-
-            elements.append(table)
-
-            # Build PDF
-            doc.build(elements)
+            with METRICS.span("json_to_pdf.table_build", rows=row_count):
+                table = Table(table_data, repeatRows=1)
+                table.setStyle(template.table_style)
+
+            # Build PDF, checking for cancellation on every page break
+            check_cancelled(cancel_event)
+            with METRICS.span("json_to_pdf.doc_build", rows=row_count) as span:
+                with FileUtils.output_target(output_path) as partial_output:
+                    doc = SimpleDocTemplate(
+                        partial_output,
+                        pagesize=template.page_size,
+                        leftMargin=template.margin,
+                        rightMargin=template.margin,
+                        topMargin=template.margin,
+                        bottomMargin=template.margin
+                    )
+                    doc.build(
+                        [table],
+                        onLaterPages=lambda pdf_canvas, pdf_doc: check_cancelled(cancel_event)
+                    )
+                    span["pages"] = doc.page
+                    if FileUtils.is_path(partial_output):
+                        span["bytes"] = os.path.getsize(partial_output)
+            report_progress(progress_callback, row_count, row_count)
 
+            if cache_key:
+                cache.put(cache_key, output_path)
             return True
+        except ConversionCancelled:
+            logging.info("JSON to PDF conversion cancelled")
+            return False
         except Exception as e:
             logging.error(f"JSON to PDF conversion error: {e}")
             return False
         
+    @classmethod
+    def convert_jsonl(
+        cls,
+        input_path: InputSource,
+        output_path: OutputTarget,
+        rows_per_page: Optional[int] = None,
+        cache: Optional[ConversionCache] = None,
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None,
+        sanitize: bool = False,
+        template: Optional[RenderTemplate] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        cancel_event: Optional[Event] = None
+    ) -> bool:
+        """
+        Streaming JSONL / NDJSON to PDF conversion
+
+        Records are read line by line, flattened one at a time and drawn
+        as page-sized table chunks, so no more than one page of records is
+        held at a time. reportlab still keeps every finished page until the
+        document is saved, so peak memory grows with the page count
+        (`benchmarks/bench_memory.py` tracks the rate).
+
+        Args:
+            input_path: Source JSONL file path, buffer or binary file-like object
+            output_path: Destination PDF file path or writable binary stream
+            rows_per_page: Table rows per page, derived from the page
+                geometry when omitted
+            cache: Optional conversion cache consulted before rendering
+            max_depth: Nesting levels to expand before serializing the rest
+            max_items: Maximum elements kept per array
+            sanitize: Drop redacted keys and truncate long strings in each
+                record before rendering (see `JsonSanitizer`)
+            template: Reusable render setup, the shared default when omitted
+            progress_callback: Optional callback receiving (bytes read, input size)
+            cancel_event: Optional event that cancels the conversion when set
+
+        Returns:
+            Boolean indicating successful conversion
+        """
+        try:
+            with FileUtils.open_input(input_path) as jsonl_file:
+                cache_key = None
+                # Buffer outputs are not cached; they never touch the disk
+                if cache is not None and FileUtils.is_path(output_path):
+                    cache_key = cache.key_for_input(
+                        input_path if FileUtils.is_path(input_path) or isinstance(input_path, BUFFER_TYPES) else jsonl_file,
+                        direction="jsonl_to_pdf",
+                        rows_per_page=rows_per_page,
+                        max_depth=max_depth,
+                        max_items=max_items,
+                        sanitize=sanitize,
+                        template=template.cache_options if template else None
+                    )
+                    if cache.get(cache_key, output_path):
+                        return True
+
+                file_size = FileUtils.input_size(jsonl_file)
+                with FileUtils.output_target(output_path) as partial_output:
+                    with METRICS.span("json_to_pdf.jsonl", bytes=file_size) as span:
+                        page_count = cls._render_row_pages(
+                            cls._iter_jsonl_rows(
+                                jsonl_file,
+                                max_depth=max_depth,
+                                max_items=max_items,
+                                sanitizer=JsonSanitizer() if sanitize else None
+                            ),
+                            partial_output,
+                            rows_per_page,
+                            template=template,
+                            on_page=lambda rows_done: report_progress(
+                                progress_callback,
+                                jsonl_file.tell(),
+                                file_size
+                            ),
+                            cancel_event=cancel_event
+                        )
+                        span["pages"] = page_count
+                    if page_count == 0:
+                        raise ValueError(f"No records found in {FileUtils.describe(input_path)}")
+
+            if cache_key:
+                cache.put(cache_key, output_path)
+            return True
+        except ConversionCancelled:
+            logging.info(f"JSONL to PDF conversion cancelled: {FileUtils.describe(input_path)}")
+            return False
+        except Exception as e:
+            logging.error(f"JSONL to PDF conversion error: {e}")
+            return False
+
+    @classmethod
+    def convert_to_bytes(
+        cls,
+        data: str | dict[str, Any] | InputSource,
+        jsonl: bool = False,
+        **options: Any
+    ) -> Optional[bytes]:
+        """
+        Convert JSON or JSONL to a PDF held in memory
+
+        Args:
+            data: Input accepted by `convert`, or by `convert_jsonl` when jsonl is set
+            jsonl: Treat the input as JSON Lines
+            options: Keyword arguments for the underlying conversion
+
+        Returns:
+            Encoded PDF, or None if the conversion failed
+        """
+        output = io.BytesIO()
+        converter = cls.convert_jsonl if jsonl else cls.convert
+        if not converter(data, output, **options):
+            return None
+        return output.getvalue()
+
+    @classmethod
+    def _iter_jsonl_rows(
+        cls,
+        jsonl_file: BinaryIO,
+        sep: str = ".",
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None,
+        sanitizer: Optional[JsonSanitizer] = None
+    ) -> Iterator[list[str]]:
+        """
+        Lazily flatten JSONL records into single-line table rows
+
+        Keys are prefixed with the record's line number.
+
+        Args:
+            jsonl_file: Source JSONL file opened in binary mode
+            sep: Separator for nested keys
+            max_depth: Nesting levels to expand before serializing the rest
+            max_items: Maximum elements kept per array
+            sanitizer: Optional sanitizer applied to each record in place
+
+        Yields:
+            [key, value] table rows
+        """
+        for line_number, line in enumerate(jsonl_file, 1):
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+            if sanitizer is not None:
+                record = sanitizer.sanitize(record, in_place=True)
+            for key, value in cls._iter_flattened(
+                record,
+                parent_key=str(line_number),
+                sep=sep,
+                max_depth=max_depth,
+                max_items=max_items
+            ):
+                yield [key, value]
+
+    @staticmethod
+    def _render_row_pages(
+        rows: Iterable[list[str]],
+        output_path: str | BinaryIO,
+        rows_per_page: Optional[int] = None,
+        column_ratios: Optional[tuple[float, float]] = None,
+        template: Optional[RenderTemplate] = None,
+        on_page: Optional[Callable[[int], None]] = None,
+        cancel_event: Optional[Event] = None
+    ) -> int:
+        """
+        Draw rows as one table per page, repeating the header
+
+        Each page is drawn before the next chunk of rows is read, instead
+        of collecting one large flowable for `doc.build`. The canvas keeps
+        finished pages until `save`, so memory grows with the page count.
+        Column widths are fixed up front and every cell is truncated to a
+        single line that fits its column, so no cell needs measuring by
+        reportlab and every row has the same height.
+
+        Args:
+            rows: Iterable of [key, value] rows
+            output_path: Destination PDF file path or writable binary stream
+            rows_per_page: Table rows per page, taken from the template
+                when omitted
+            column_ratios: Fixed (key, value) column width fractions,
+                taken from the template or sampled from the first rows
+                when omitted
+            template: Reusable render setup, the shared default when omitted
+            on_page: Optional callback receiving the rows drawn so far
+                after every page
+            cancel_event: Optional event that aborts rendering when set
+
+        Returns:
+            Number of pages written
+        """
+        from reportlab.pdfgen import canvas
+        from reportlab.platypus import Table
+
+        template = template or default_template()
+        page_width, page_height = template.page_size
+        available_width = template.available_width
+        available_height = template.available_height
+        style = template.table_style
+        fit_cell = JsonToPdfConverter._fit_cell
+        ellipsis_width = template.ellipsis_width
+
+        rows = iter(rows)
+        column_ratios = column_ratios or template.column_ratios
+        if column_ratios is None:
+            sample = list(islice(rows, COLUMN_SAMPLE_ROWS))
+            column_ratios = JsonToPdfConverter._sample_column_ratios(sample, available_width)
+            rows = chain(sample, rows)
+        col_widths, text_widths = template.column_layout(column_ratios)
+        rows_per_page = rows_per_page or template.rows_per_page
+
+        pdf = canvas.Canvas(output_path, pagesize=template.page_size, pageCompression=1)
+        page_count = 0
+        rows_done = 0
+        while chunk := list(islice(rows, rows_per_page)):
+            check_cancelled(cancel_event)
+            with METRICS.span("json_to_pdf.table_build", rows=len(chunk)):
+                chunk = [
+                    [fit_cell(cell, width, ellipsis_width) for cell, width in zip(row, text_widths)]
+                    for row in chunk
+                ]
+                table = Table([TABLE_HEADER] + chunk, colWidths=col_widths, repeatRows=1)
+                table.setStyle(style)
+            with METRICS.span("json_to_pdf.page_draw", rows=len(chunk), pages=1):
+                table_width, table_height = table.wrapOn(pdf, available_width, available_height)
+                table.drawOn(
+                    pdf,
+                    (page_width - table_width) / 2,
+                    page_height - template.margin - table_height
+                )
+                pdf.showPage()
+            page_count += 1
+            rows_done += len(chunk)
+            if on_page is not None:
+                on_page(rows_done)
+
+        if page_count:
+            with METRICS.span("json_to_pdf.doc_build", pages=page_count) as span:
+                pdf.save()
+                if FileUtils.is_path(output_path):
+                    span["bytes"] = os.path.getsize(output_path)
+        return page_count
+
+    @staticmethod
+    def _sample_column_ratios(
+        sample: list[list[str]],
+        available_width: float
+    ) -> tuple[float, float]:
+        """
+        Size the key column from a sample of rows
+
+        The key column gets the 90th percentile key width, clamped to
+        between 20% and 50% of the table; the value column gets the rest.
+
+        Args:
+            sample: First rows of the table
+            available_width: Usable page width
+
+        Returns:
+            (key, value) column width fractions
+        """
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+
+        if not sample:
+            return (0.35, 0.65)
+
+        key_widths = sorted(
+            stringWidth(row[0], BODY_FONT, BODY_FONT_SIZE) + CELL_PADDING
+            for row in sample
+        )
+        key_width = key_widths[min(len(key_widths) - 1, int(len(key_widths) * 0.9))]
+        key_ratio = min(0.5, max(0.2, key_width / available_width))
+        return (key_ratio, 1 - key_ratio)
+
+    @staticmethod
+    def _fit_cell(text: str, width: float, ellipsis_width: Optional[float] = None) -> str:
+        """
+        Truncate cell text to a single line no wider than `width`
+
+        Args:
+            text: Cell text
+            width: Available text width in points
+            ellipsis_width: Precomputed width of "…", measured when omitted
+
+        Returns:
+            Text that fits, ending with "…" when truncated
+        """
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+
+        text = text.replace("\n", " ")
+        # No Helvetica glyph is narrower than 0.15 em, which bounds the
+        # characters that can possibly fit before measuring anything
+        text = text[:int(width / (0.15 * BODY_FONT_SIZE)) + 1]
+        text_width = stringWidth(text, BODY_FONT, BODY_FONT_SIZE)
+        if text_width <= width:
+            return text
+
+        if ellipsis_width is None:
+            ellipsis_width = stringWidth("…", BODY_FONT, BODY_FONT_SIZE)
+        cut = int(len(text) * (width - ellipsis_width) / text_width)
+        while cut > 0 and stringWidth(text[:cut], BODY_FONT, BODY_FONT_SIZE) + ellipsis_width > width:
+            cut -= 1
+        return text[:cut] + "…"
+
     @staticmethod
+    def _fit_rows_per_page(
+        col_widths: list[float],
+        style: "TableStyle",
+        available_height: float
+    ) -> int:
+        """
+        Measure how many single-line rows fit under the header on a page
+
+        Args:
+            col_widths: Table column widths
+            style: Table style applied to every chunk
+            available_height: Usable page height
+
+        Returns:
+            Number of body rows per page
+        """
+        from reportlab.platypus import Table
+
+        def _table_height(row_count: int) -> float:
+            table = Table([TABLE_HEADER] + [["x", "x"]] * row_count, colWidths=col_widths)
+            table.setStyle(style)
+            return table.wrap(sum(col_widths), available_height)[1]
+
+        row_height = _table_height(2) - _table_height(1)
+        header_height = _table_height(1) - row_height
+        return max(1, int((available_height - header_height) // row_height))
+
+    @classmethod
     def _flatten_json(
+        cls,
         data: dict[str, Any],
         parent_key: str = "",
-        sep: str = "."
+        sep: str = ".",
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None
     ) -> dict[str, str]:
         """
-        Recursive JSON flattening with advanced handling
+        JSON flattening into a key/value dictionary
 
         Args:
             data: JSON data to flatten
             parent_key: Parent key for nested structures
             sep: Separator for nested keys
-        
+            max_depth: Nesting levels to expand before serializing the rest
+            max_items: Maximum elements kept per array
+
         Returns:
             Flattened dictionary
         """
+        return dict(cls._iter_flattened(data, parent_key, sep, max_depth, max_items))
 
-        items = {}
+    @staticmethod
+    def _iter_flattened(
+        data: Any,
+        parent_key: str = "",
+        sep: str = ".",
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Iterative, lazy JSON flattening
 
-        def _flatten(x, name=""):
-            if isinstance(x, dict):
-                for k, v in x.items():
-                    _flatten(v, f"{name}{k}{sep}")
-            elif isinstance(x, list):
-                for i, v in enumerate(x):
-                    _flatten(v, f"{name}{i}{sep}")
-            else:
-                items[name[:-1]] = str(x)
+        Walks the document with an explicit stack of child iterators, so
+        stack depth stays constant however deeply the input is nested.
+        Every child key is built by appending to its parent's prefix, which
+        is computed once per container.
+
+        Args:
+            data: JSON data to flatten
+            parent_key: Parent key for nested structures
+            sep: Separator for nested keys
+            max_depth: Nesting levels to expand; deeper containers are
+                emitted as compact JSON strings
+            max_items: Maximum elements kept per array; the rest is
+                summarized in a single "…" row
 
-        _flatten(data)
-        return items
\ No newline at end of file
+        Yields:
+            (key, value) rows in document order
+        """
+        def _children(container):
+            if isinstance(container, dict):
+                return iter(container.items())
+            if max_items is not None:
+                return islice(enumerate(container), max_items)
+            return enumerate(container)
+
+        def _omitted(container):
+            if max_items is None or isinstance(container, dict):
+                return 0
+            return max(0, len(container) - max_items)
+
+        if not isinstance(data, (dict, list)):
+            yield parent_key, str(data)
+            return
+
+        root_prefix = f"{parent_key}{sep}" if parent_key else ""
+        stack = [(_children(data), root_prefix, 1, _omitted(data))]
+        while stack:
+            children, prefix, depth, omitted = stack[-1]
+            for key, value in children:
+                path = f"{prefix}{key}"
+                if not isinstance(value, (dict, list)):
+                    yield path, str(value)
+                elif max_depth is not None and depth >= max_depth:
+                    yield path, json.dumps(value, ensure_ascii=False, default=str)
+                elif value:
+                    stack.append((_children(value), f"{path}{sep}", depth + 1, _omitted(value)))
+                    break
+            else:
+                stack.pop()
+                if omitted:
+                    yield f"{prefix}…", f"<{omitted} more items>"
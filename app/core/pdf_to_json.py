@@ -1,8 +1,20 @@
-import json
-from typing import Any, Optional
+import io
+import os
+from threading import Event
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional
 import logging
 
-from app.utils.pdf_utils import PdfUtils
+from app.core.progress import (
+    ConversionCancelled,
+    ProgressCallback,
+    check_cancelled,
+    report_progress
+)
+from app.utils.cache_utils import ConversionCache
+from app.utils.file_utils import FileUtils, InputSource, OutputTarget
+from app.utils.metrics import METRICS
+from app.utils.pdf_utils import DEFAULT_ENGINE, PdfInput, PdfUtils, resolve_artifacts
+from app.utils.serializers import OUTPUT_FORMATS, JsonSerializer, get_serializer
 
 class PdfToJsonConverter:
     """
@@ -11,43 +23,296 @@ class PdfToJsonConverter:
     @classmethod
     def convert(
         cls,
-        pdf_path: str,
-        output_path: str,
-        extraction_strategy: Optional[str] = None
+        pdf_path: InputSource,
+        output_path: OutputTarget,
+        extraction_strategy: Optional[str] = None,
+        workers: int = 1,
+        pages_per_shard: int = 50,
+        stream: bool = False,
+        engine: str = DEFAULT_ENGINE,
+        page_range: Optional[tuple[int, int]] = None,
+        max_pages: Optional[int] = None,
+        artifacts: Optional[Iterable[str]] = None,
+        max_rss_mb: Optional[float] = None,
+        output_format: str = "json",
+        serializer: str = "auto",
+        cache: Optional[ConversionCache] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        cancel_event: Optional[Event] = None
     ) -> bool:
         """
         Comprehensive PDF to JSON conversion
 
+        In-memory PDFs (bytes, memoryview, mmap or a binary file-like
+        object) are parsed in place without a temporary file, in this
+        process. Writing to a stream skips the cache.
+
         Args:
-            pdf_path: Source PDF file path
-            output_path: Destination JSON file path
+            pdf_path: Source PDF file path, buffer or binary file-like object
+            output_path: Destination JSON file path or writable binary stream
             extraction_strategy: Optional custom extraction method
+            workers: Number of processes used for page extraction
+            pages_per_shard: Number of pages handed to a worker at a time
+            stream: Write each page as soon as it is extracted instead of
+                building the whole document in memory first
+            engine: Text extraction engine, "pdfplumber" (layout-aware)
+                or "pdfium" (fast path, falls back to pdfplumber on failure)
+            page_range: Optional (first, last) pages to extract, 1-based and
+                inclusive; pages outside it are never parsed
+            max_pages: Optional cap on the number of pages extracted
+            artifacts: Per-page artifacts to extract, any of "text",
+                "tables", "words" and "images" (default: text only); all
+                of them are produced from a single parse of each page
+            max_rss_mb: Optional RSS ceiling per extraction process; above
+                it parser caches are flushed and new shards are held back
+            output_format: "json" (indented document), "compact" (document
+                without whitespace) or "ndjson" (a metadata line followed by
+                one line per page)
+            serializer: JSON encoder, "auto" (orjson when installed),
+                "orjson" or "stdlib"
+            cache: Optional conversion cache consulted before extracting
+            progress_callback: Optional callback receiving (pages done, total)
+            cancel_event: Optional event that cancels the conversion when set
 
         Returns:
             Boolean indicating successful conversion
         """
         try:
-            # Extract text from PDF
-            extracted_data = PdfUtils.extract_text_from_pdf(pdf_path)
-
-            # Apply custom extraction strategy if provided
-            if extraction_strategy:
-                extracted_data = cls._apply_extraction_strategy(
-                    extracted_data,
-                    extraction_strategy
+            if output_format not in OUTPUT_FORMATS:
+                raise ValueError(f"Unknown output format: {output_format}")
+            artifacts = resolve_artifacts(artifacts)
+            encoder = get_serializer(serializer)
+            with PdfUtils.open_source(pdf_path) as pdf_source:
+                cache_key = None
+                # Buffer outputs are not cached; they never touch the disk
+                if cache is not None and FileUtils.is_path(output_path):
+                    cache_key = cache.key_for_input(
+                        pdf_source,
+                        direction="pdf_to_json",
+                        # The artifact records metadata.file_path, so identical
+                        # PDFs at different paths need their own entries
+                        file_path=pdf_source if isinstance(pdf_source, str) else None,
+                        extraction_strategy=extraction_strategy,
+                        engine=engine,
+                        stream=stream,
+                        page_range=page_range,
+                        max_pages=max_pages,
+                        artifacts=artifacts,
+                        output_format=output_format
+                    )
+                    if cache.get(cache_key, output_path):
+                        return True
+
+                metadata = {
+                    "total_pages": PdfUtils.get_pdf_page_count(pdf_source, raise_errors=True),
+                    "file_path": pdf_source if isinstance(pdf_source, str) else None
+                }
+                first_page, last_page = PdfUtils.resolve_page_range(
+                    metadata["total_pages"],
+                    page_range,
+                    max_pages
+                )
+                selected_pages = max(0, last_page - first_page + 1)
+                if page_range is not None or max_pages is not None:
+                    metadata["page_range"] = [first_page, last_page]
+
+                pages = cls._iter_pages(
+                    pdf_source,
+                    selected_pages,
+                    progress_callback,
+                    cancel_event,
+                    workers=workers,
+                    pages_per_shard=pages_per_shard,
+                    engine=engine,
+                    page_range=page_range,
+                    max_pages=max_pages,
+                    artifacts=artifacts,
+                    max_rss_mb=max_rss_mb
                 )
 
-            # Write to JSON
-            with open(output_path, "w", encoding="utf-8") as json_file:
-                json.dump(extracted_data, json_file, indent=2, ensure_ascii=False)
+                if stream:
+                    with METRICS.span("pdf_to_json.stream", pages=selected_pages) as span:
+                        with FileUtils.open_output(output_path) as json_file:
+                            cls._write_streaming(
+                                json_file,
+                                metadata,
+                                pages,
+                                cls._get_page_strategy(extraction_strategy),
+                                output_format,
+                                encoder
+                            )
+                        if FileUtils.is_path(output_path):
+                            span["bytes"] = os.path.getsize(output_path)
+                else:
+                    # Extract text from PDF
+                    with METRICS.span("pdf_to_json.extract", pages=selected_pages):
+                        extracted_data = {"metadata": metadata, "pages": list(pages)}
 
-            return True
+                    # Apply custom extraction strategy if provided
+                    if extraction_strategy:
+                        extracted_data = cls._apply_extraction_strategy(
+                            extracted_data,
+                            extraction_strategy
+                        )
+
+                    # Write to JSON
+                    with METRICS.span("pdf_to_json.write") as span:
+                        with FileUtils.open_output(output_path) as json_file:
+                            if output_format == "ndjson":
+                                cls._write_streaming(
+                                    json_file,
+                                    extracted_data["metadata"],
+                                    extracted_data["pages"],
+                                    lambda page: page,
+                                    output_format,
+                                    encoder
+                                )
+                            else:
+                                json_file.write(encoder.dumps(extracted_data, pretty=output_format == "json"))
+                        if FileUtils.is_path(output_path):
+                            span["bytes"] = os.path.getsize(output_path)
+
+                if cache_key:
+                    cache.put(cache_key, output_path)
+                return True
+        except ConversionCancelled:
+            logging.info(f"PDF to JSON conversion cancelled: {FileUtils.describe(pdf_path)}")
+            return False
         except Exception as e:
             logging.error(f"PDF to JSON conversion error: {e}")
             return False
-    
+
+    @classmethod
+    def convert_to_bytes(cls, pdf_path: InputSource, **options: Any) -> Optional[bytes]:
+        """
+        Convert a PDF to JSON held in memory
+
+        Args:
+            pdf_path: Source PDF file path, buffer or binary file-like object
+            options: Keyword arguments for `convert`
+
+        Returns:
+            Encoded JSON, or None if the conversion failed
+        """
+        output = io.BytesIO()
+        if not cls.convert(pdf_path, output, **options):
+            return None
+        return output.getvalue()
+
+    @staticmethod
+    def _iter_pages(
+        pdf_path: PdfInput,
+        total_pages: int,
+        progress_callback: Optional[ProgressCallback],
+        cancel_event: Optional[Event],
+        **extraction_options: Any
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Extract pages while reporting progress and honouring cancellation
+
+        Args:
+            pdf_path: Source PDF file path or seekable binary stream
+            total_pages: Number of pages to extract
+            progress_callback: Optional callback receiving (pages done, total)
+            cancel_event: Optional event that aborts extraction when set
+            extraction_options: Keyword arguments for `PdfUtils.iter_pages`
+
+        Yields:
+            Page records in page order
+        """
+        check_cancelled(cancel_event)
+        report_progress(progress_callback, 0, total_pages)
+        pages = PdfUtils.iter_pages(pdf_path, **extraction_options)
+        try:
+            for page_count, page in enumerate(pages, 1):
+                yield page
+                report_progress(progress_callback, page_count, total_pages)
+                check_cancelled(cancel_event)
+        finally:
+            # Stop pool workers promptly when the caller bails out early
+            pages.close()
+
     @staticmethod
+    def _write_streaming(
+        json_file: BinaryIO,
+        metadata: dict[str, Any],
+        pages: Iterable[dict[str, Any]],
+        transform_page: Callable[[dict[str, Any]], dict[str, Any]],
+        output_format: str = "json",
+        encoder: Optional[JsonSerializer] = None
+    ) -> None:
+        """
+        Write the extraction result page by page
+
+        The "json" and "compact" formats produce the same
+        `{"metadata", "pages"}` document as the in-memory path ("json"
+        with one page object per line); "ndjson" writes a metadata line
+        followed by one line per page. Memory use stays flat regardless of
+        page count.
+
+        Args:
+            json_file: Destination file opened in binary mode
+            metadata: Document metadata
+            pages: Page records in page order
+            transform_page: Per-page extraction strategy
+            output_format: One of OUTPUT_FORMATS
+            encoder: JSON serializer, the stdlib encoder when omitted
+        """
+        encoder = encoder or JsonSerializer()
+        if output_format == "ndjson":
+            json_file.write(encoder.dumps({"metadata": metadata}))
+            json_file.write(b"\n")
+            for page in pages:
+                json_file.write(encoder.dumps(transform_page(page)))
+                json_file.write(b"\n")
+            return
+
+        if output_format == "compact":
+            opening, separator, closing = b'{"metadata":', b',"pages":[', b"]}"
+            page_separator = b","
+        else:
+            opening, separator, closing = b'{\n  "metadata": ', b',\n  "pages": [', b"\n  ]\n}\n"
+            page_separator = b",\n    "
+
+        json_file.write(opening)
+        json_file.write(encoder.dumps(metadata))
+        json_file.write(separator)
+
+        leading = b"" if output_format == "compact" else b"\n    "
+        for page in pages:
+            json_file.write(leading)
+            json_file.write(encoder.dumps(transform_page(page)))
+            leading = page_separator
+
+        json_file.write(closing)
+
+    @staticmethod
+    def _get_page_strategy(
+        strategy: Optional[str]
+    ) -> Callable[[dict[str, Any]], dict[str, Any]]:
+        """
+        Look up the per-page transform for an extraction strategy
+
+        Args:
+            strategy: extraction strategy name
+
+        Returns:
+            Function applied to each page record
+        """
+        strategies = {
+            "clean_text": lambda page: {
+                **page, "content": page["content"].strip()
+            },
+            "extract_paragraphs": lambda page: {
+                **page, "paragraphs": page["content"].split("\n\n")
+            }
+        }
+
+        return strategies.get(strategy, lambda page: page)
+
+    @classmethod
     def _apply_extraction_strategy(
+        cls,
         data: dict[str, Any],
         strategy: str
     ) -> dict[str, Any]:
@@ -61,21 +326,11 @@ class PdfToJsonConverter:
         Returns:
             Processed data
         """
-        strategies = {
-            "clean_text": lambda d: {
-                **d,
-                "pages": [
-                    {**page, "content": page["content"].strip()}
-                    for page in d.get("pages", [])
-                ]
-            },
-            "extract_paragraphs": lambda d: {
-                **d,
-                "pages": [
-                    {**page, "paragraphs": page["content"].split("\n\n")}
-                    for page in d.get("pages", [])
-                ]
-            }
-        }
+        transform_page = cls._get_page_strategy(strategy)
+        if "pages" not in data:
+            return data
 
-        return strategies.get(strategy, lambda x: x)(data)
\ No newline at end of file
+        return {
+            **data,
+            "pages": [transform_page(page) for page in data["pages"]]
+        }
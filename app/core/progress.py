@@ -0,0 +1,42 @@
+from threading import Event
+from typing import Callable, Optional
+
+# Called with (units done, total units); total is 0 when unknown
+ProgressCallback = Callable[[int, int], None]
+
+
+class ConversionCancelled(Exception):
+    """
+    Raised inside a converter once its cancel event is set.
+    """
+
+
+def report_progress(
+    progress_callback: Optional[ProgressCallback],
+    done: int,
+    total: int
+) -> None:
+    """
+    Invoke a progress callback if one was provided
+
+    Args:
+        progress_callback: Optional progress callback
+        done: Units of work completed
+        total: Total units of work
+    """
+    if progress_callback is not None:
+        progress_callback(done, total)
+
+
+def check_cancelled(cancel_event: Optional[Event]) -> None:
+    """
+    Abort the current conversion if cancellation was requested
+
+    Args:
+        cancel_event: Optional event set by the caller to cancel
+
+    Raises:
+        ConversionCancelled: If the event is set
+    """
+    if cancel_event is not None and cancel_event.is_set():
+        raise ConversionCancelled()
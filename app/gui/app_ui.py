@@ -1,26 +1,64 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from tkinterdnd2 import TkinterDnD, DND_FILES
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import count
+from pathlib import Path
 from typing import Optional
-import os
+import queue
+import threading
 
 from app.config import AppConfig
 from app.core.json_to_pdf import JsonToPdfConverter
 from app.core.pdf_to_json import PdfToJsonConverter
+from app.utils.cache_utils import ConversionCache
+
+# Interval for draining worker events on the Tk main thread
+EVENT_POLL_MS = 100
+
+
+@dataclass
+class ConversionJob:
+    """
+    A queued or running conversion tracked by the GUI.
+    """
+    job_id: str
+    input_path: str
+    conversion_type: str
+    output_path: Path
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    future: Optional[Future] = None
+    progress: float = 0.0
+
 
 class DocuBridgeApp:
     def __init__(self, config: AppConfig):
         self.root = TkinterDnD.Tk()  # Use TkinterDnD for drag-and-drop support
         self.root.title("DocuBridge: JSON ↔ PDF Converter")
         self.config = config
+        self.cache = (
+            ConversionCache(config.cache_dir, config.cache_max_size_mb)
+            if config.cache_enabled else None
+        )
+
+        # Conversions run on worker threads; Tk widgets are only touched on
+        # the main thread, which drains `events` on a timer
+        self.executor = ThreadPoolExecutor(max_workers=config.gui_workers)
+        self.events: queue.Queue = queue.Queue()
+        self.jobs: dict[str, ConversionJob] = {}
+        self._job_ids = count(1)
+        self._finished = {"succeeded": 0, "failed": 0}
 
         self._setup_ui()
         self._create_widgets()
+        self.root.after(EVENT_POLL_MS, self._poll_events)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _setup_ui(self):
         self.root.geometry("800x600")
         self.root.configure(bg="#f0f0f0")
-        self.root.grid_rowconfigure(1, weight=1)
+        self.root.grid_rowconfigure(2, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
 
     def _create_widgets(self):
@@ -36,7 +74,7 @@ class DocuBridgeApp:
 
         # File selection and conversion
         file_frame = ttk.Frame(self.root)
-        file_frame.grid(row=1, column=0, padx=20, pady=20, sticky="nsew")
+        file_frame.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="ew")
 
         self.input_file_label = ttk.Label(file_frame, text="Input File:")
         self.input_file_label.pack(side="left", padx=(0, 10))
@@ -51,46 +89,191 @@ class DocuBridgeApp:
         self.convert_button = ttk.Button(file_frame, text="Convert", command=self._perform_conversion)
         self.convert_button.pack(side="left")
 
+        # Queued and running conversions
+        self.job_list = ttk.Treeview(self.root, columns=("file", "status"), show="headings")
+        self.job_list.heading("file", text="File")
+        self.job_list.heading("status", text="Status")
+        self.job_list.column("status", width=200, stretch=False)
+        self.job_list.grid(row=2, column=0, padx=20, sticky="nsew")
+
         # Conversion progress
+        progress_frame = ttk.Frame(self.root)
+        progress_frame.grid(row=3, column=0, padx=20, pady=20, sticky="ew")
+        progress_frame.grid_columnconfigure(0, weight=1)
+
         self.progress_var = tk.DoubleVar()
-        self.progress_bar = ttk.Progressbar(self.root, variable=self.progress_var, mode="indeterminate")
-        self.progress_bar.grid(row=2, column=0, padx=20, pady=(0, 20), sticky="ew")
+        self.progress_bar = ttk.Progressbar(progress_frame, variable=self.progress_var, mode="determinate", maximum=100)
+        self.progress_bar.grid(row=0, column=0, padx=(0, 10), sticky="ew")
+
+        self.cancel_button = ttk.Button(progress_frame, text="Cancel", command=self._cancel_jobs)
+        self.cancel_button.grid(row=0, column=1)
 
         # Drag and drop
         self.root.drop_target_register(DND_FILES)
         self.root.dnd_bind("<<Drop>>", self._handle_drop)
 
     def _select_input_file(self):
-        file_types = [("JSON Files", "*.json")] if self.conversion_var.get() == "JSON_TO_PDF" else [("PDF Files", "*.pdf")]
+        file_types = [("JSON Files", "*.json *.jsonl")] if self.conversion_var.get() == "JSON_TO_PDF" else [("PDF Files", "*.pdf")]
         file_path = filedialog.askopenfilename(filetypes=file_types)
         if file_path:
             self.input_file_path.set(file_path)
 
     def _perform_conversion(self):
+        input_path = self.input_file_path.get()
+        if not input_path:
+            messagebox.showerror("Conversion Error", "Select an input file first")
+            return
+        self._submit(input_path, self.conversion_var.get())
+
+    def _submit(self, input_path: str, conversion_type: str):
+        if conversion_type == "JSON_TO_PDF":
+            extension = "pdf"
+        else:
+            extension = "jsonl" if self.config.output_format == "ndjson" else "json"
+        output_path = self.config.get_unique_output_path("converted_file", extension)
+
+        job = ConversionJob(
+            job_id=str(next(self._job_ids)),
+            input_path=input_path,
+            conversion_type=conversion_type,
+            output_path=output_path
+        )
+        self.jobs[job.job_id] = job
+        self.job_list.insert("", "end", iid=job.job_id, values=(input_path, "Queued"))
+
+        job.future = self.executor.submit(self._run_job, job)
+        job.future.add_done_callback(lambda future: self.events.put(("done", job.job_id, future)))
+        self._update_progress()
+
+    def _run_job(self, job: ConversionJob) -> bool:
+        self.events.put(("status", job.job_id, "Converting"))
+
+        def on_progress(done: int, total: int):
+            self.events.put(("progress", job.job_id, done / total if total else 0.0))
+
+        if job.conversion_type == "JSON_TO_PDF":
+            if job.input_path.lower().endswith(".jsonl"):
+                return JsonToPdfConverter.convert_jsonl(
+                    job.input_path,
+                    str(job.output_path),
+                    cache=self.cache,
+                    sanitize=self.config.sanitize_jsonl,
+                    progress_callback=on_progress,
+                    cancel_event=job.cancel_event
+                )
+            with open(job.input_path, encoding="utf-8") as json_file:
+                return JsonToPdfConverter.convert(
+                    json_file.read(),
+                    str(job.output_path),
+                    cache=self.cache,
+                    long_table=self.config.long_table,
+                    column_ratios=self.config.table_column_ratios,
+                    progress_callback=on_progress,
+                    cancel_event=job.cancel_event
+                )
+
+        return PdfToJsonConverter.convert(
+            job.input_path,
+            str(job.output_path),
+            workers=self.config.extraction_workers,
+            pages_per_shard=self.config.extraction_pages_per_shard,
+            stream=self.config.stream_pdf_to_json,
+            engine=self.config.extraction_engine,
+            artifacts=self.config.extraction_artifacts,
+            max_rss_mb=self.config.extraction_max_rss_mb,
+            output_format=self.config.output_format,
+            serializer=self.config.json_serializer,
+            cache=self.cache,
+            progress_callback=on_progress,
+            cancel_event=job.cancel_event
+        )
+
+    def _poll_events(self):
         try:
-            self.progress_bar.start()
-            input_path = self.input_file_path.get()
-            conversion_type = self.conversion_var.get()
-
-            if conversion_type == "JSON_TO_PDF":
-                output_path = self.config.get_unique_output_path("converted_file", "pdf")
-                success = JsonToPdfConverter.convert(input_path, str(output_path))
-            else:
-                output_path = self.config.get_unique_output_path("converted_file", "json")
-                success = PdfToJsonConverter.convert(input_path, str(output_path))
-
-            if success:
-                messagebox.showinfo("Conversion Successful", f"File saved at {output_path}")
-            else:
-                messagebox.showerror("Conversion Failed", "Unable to complete the conversion process")
-        except Exception as e:
-            messagebox.showerror("Conversion Error", str(e))
-        finally:
-            self.progress_bar.stop()
+            while True:
+                kind, job_id, value = self.events.get_nowait()
+                job = self.jobs.get(job_id)
+                if job is None:
+                    continue
+                if kind == "status":
+                    self.job_list.set(job_id, "status", value)
+                elif kind == "progress":
+                    job.progress = value
+                    self.job_list.set(job_id, "status", f"Converting {value:.0%}")
+                elif kind == "done":
+                    self._finish_job(job, value)
+        except queue.Empty:
+            pass
+
+        self._update_progress()
+        self.root.after(EVENT_POLL_MS, self._poll_events)
+
+    def _finish_job(self, job: ConversionJob, future: Future):
+        del self.jobs[job.job_id]
+
+        if future.cancelled() or job.cancel_event.is_set():
+            status, success = "Cancelled", False
+        elif future.exception() is not None:
+            status, success = f"Error: {future.exception()}", False
+        elif future.result():
+            status, success = f"Saved to {job.output_path.name}", True
+        else:
+            status, success = "Failed", False
+
+        if not success:
+            job.output_path.unlink(missing_ok=True)
+        self.job_list.set(job.job_id, "status", status)
+        self._finished["succeeded" if success else "failed"] += 1
+
+        if not self.jobs:
+            self._show_summary()
+
+    def _show_summary(self):
+        succeeded, failed = self._finished["succeeded"], self._finished["failed"]
+        self._finished = {"succeeded": 0, "failed": 0}
+        if failed:
+            messagebox.showerror(
+                "Conversion Failed",
+                f"{failed} conversion(s) did not complete, {succeeded} succeeded"
+            )
+        elif succeeded:
+            messagebox.showinfo(
+                "Conversion Successful",
+                f"{succeeded} file(s) saved in {self.config.output_dir}"
+            )
+
+    def _update_progress(self):
+        if self.jobs:
+            overall = sum(job.progress for job in self.jobs.values()) / len(self.jobs)
+            self.progress_var.set(overall * 100)
+        else:
+            self.progress_var.set(0)
+
+    def _cancel_jobs(self):
+        # Cancel the selected jobs, or every job when nothing is selected
+        job_ids = self.job_list.selection() or tuple(self.jobs)
+        for job_id in job_ids:
+            job = self.jobs.get(job_id)
+            if job is None:
+                continue
+            job.cancel_event.set()
+            if job.future is not None:
+                job.future.cancel()
+            self.job_list.set(job_id, "status", "Cancelling")
 
     def _handle_drop(self, event):
-        file_path = event.data.strip('{').strip('}')
-        self.input_file_path.set(file_path)
+        json_extensions = self.config.supported_extenstions["json"]
+        for file_path in self.root.tk.splitlist(event.data):
+            extension = Path(file_path).suffix.lstrip(".").lower()
+            conversion_type = "JSON_TO_PDF" if extension in json_extensions else "PDF_TO_JSON"
+            self.input_file_path.set(file_path)
+            self._submit(file_path, conversion_type)
+
+    def _on_close(self):
+        for job in self.jobs.values():
+            job.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
     def run(self):
         self.root.mainloop()
@@ -0,0 +1,681 @@
+import argparse
+import json
+import logging
+import shutil
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from app.config import AppConfig
+from app.core.json_to_pdf import JsonToPdfConverter, RenderTemplate
+from app.core.pdf_to_json import PdfToJsonConverter
+from app.utils.cache_utils import ConversionCache
+from app.utils.logging_config import LoggingConfig
+from app.utils.metrics import METRICS
+from app.utils.serializers import OUTPUT_FORMATS
+
+# Input types accepted by the service
+INPUT_TYPES = ("json", "jsonl", "pdf")
+# Response content type per result file extension
+CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "json": "application/json",
+    "jsonl": "application/x-ndjson",
+}
+# How often a job thread copies a worker process's progress into its job
+PROGRESS_POLL_SECONDS = 0.2
+
+# Per-process state of the job pool workers, set up by _init_job_worker
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _convert_job(
+    input_type: str,
+    payload: bytes,
+    output_path: str,
+    options: dict[str, Any],
+    template: Optional[RenderTemplate],
+    cache: Optional[ConversionCache],
+    progress_callback: Callable[[int, int], None],
+    cancel_event: Any
+) -> bool:
+    """
+    Run the converter for one job
+
+    Args:
+        input_type: One of INPUT_TYPES
+        payload: Raw input file contents
+        output_path: Destination file path
+        options: Converter options derived from the job and the config
+        template: Render template for JSON and JSONL jobs
+        cache: Optional conversion cache
+        progress_callback: Callback receiving (done, total)
+        cancel_event: Event that cancels the conversion when set
+
+    Returns:
+        Boolean indicating successful conversion
+    """
+    common = {
+        "cache": cache,
+        "progress_callback": progress_callback,
+        "cancel_event": cancel_event,
+    }
+    if input_type == "jsonl":
+        return JsonToPdfConverter.convert_jsonl(payload, output_path, template=template, **options, **common)
+    if input_type == "json":
+        return JsonToPdfConverter.convert(payload, output_path, template=template, **options, **common)
+    return PdfToJsonConverter.convert(payload, output_path, **options, **common)
+
+
+def _init_job_worker(
+    column_ratios: Optional[tuple[float, float]],
+    cache_dir: Optional[Path],
+    cache_max_size_mb: int,
+    logging_options: dict[str, Any]
+) -> None:
+    """
+    Warm up a job pool worker: route its logging to the parent, import the
+    converters' libraries and build the render template and cache once
+    """
+    if logging_options:
+        logging_options["initializer"](*logging_options["initargs"])
+    import pdfplumber  # noqa: F401
+    import pypdfium2  # noqa: F401
+
+    _WORKER_STATE["template"] = RenderTemplate(column_ratios=column_ratios)
+    _WORKER_STATE["cache"] = (
+        ConversionCache(cache_dir, cache_max_size_mb) if cache_dir is not None else None
+    )
+
+
+def _run_pooled_job(
+    input_type: str,
+    payload: bytes,
+    output_path: str,
+    options: dict[str, Any],
+    cancel_event: Any,
+    progress: Any
+) -> tuple[bool, dict[str, Any]]:
+    """
+    Run one job in a pool worker
+
+    Module level so the process pool can pickle it. A worker runs one job
+    at a time, so the metrics collected since the reset belong to this job.
+
+    Returns:
+        Conversion result and the job's stage metrics
+    """
+    METRICS.reset()
+
+    def on_progress(done: int, total: int):
+        progress.value = done / total if total else 0.0
+
+    success = _convert_job(
+        input_type,
+        payload,
+        output_path,
+        options,
+        _WORKER_STATE.get("template"),
+        _WORKER_STATE.get("cache"),
+        on_progress,
+        cancel_event
+    )
+    return success, METRICS.snapshot()
+
+
+class QueueFullError(Exception):
+    """
+    Raised when a job is submitted while the service queue is full.
+    """
+
+
+@dataclass
+class ServiceJob:
+    """
+    A conversion submitted to the service.
+    """
+    job_id: str
+    input_type: str
+    output_path: Path
+    payload: Optional[bytes] = field(default=None, repr=False)
+    options: dict[str, Any] = field(default_factory=dict)
+    status: str = "queued"
+    progress: float = 0.0
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    # A multiprocessing manager Event when the service runs worker processes
+    cancel_event: Any = field(default_factory=threading.Event)
+    future: Optional[Future] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Public status of the job
+        """
+        return {
+            "job_id": self.job_id,
+            "input_type": self.input_type,
+            "status": self.status,
+            "progress": round(self.progress, 4),
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class ConversionService:
+    """
+    Long-running conversion service with a bounded job queue.
+
+    By default jobs run on a pool of `workers` long-lived processes, so
+    CPU-bound extraction and rendering use several cores. Each worker
+    imports reportlab, pdfplumber and pypdfium2 and builds its render
+    template once, when it starts. Cancel events and progress go through
+    a multiprocessing manager, and each job's stage metrics are merged into
+    this process for `/metrics`. With `use_processes=False` converters run
+    on threads of this process instead: cheaper to start, but jobs share
+    one core through the GIL.
+
+    At most `workers` jobs run at a time and at most `queue_size` more
+    wait; further submissions are rejected with QueueFullError. Finished
+    jobs are kept for retrieval until `retention` newer jobs have finished.
+    """
+    def __init__(
+        self,
+        config: AppConfig,
+        workers: int = 2,
+        queue_size: int = 100,
+        retention: int = 1000,
+        work_dir: Optional[Path] = None,
+        use_processes: Optional[bool] = None
+    ):
+        self.config = config
+        self.use_processes = config.service_use_processes if use_processes is None else use_processes
+        self.workers = workers
+        self.queue_size = queue_size
+        self.retention = retention
+        self.work_dir = Path(work_dir or config.output_dir / "service")
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.cache = (
+            ConversionCache(config.cache_dir, config.cache_max_size_mb)
+            if config.cache_enabled else None
+        )
+
+        self.template: Optional[RenderTemplate] = None
+        self.jobs: dict[str, ServiceJob] = {}
+        self._finished: deque[str] = deque()
+        self._active = 0
+        self._job_ids = count(1)
+        self._lock = threading.Lock()
+        # Job threads wait on the queue and, in process mode, on the pool
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="docubridge-job")
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._manager: Any = None
+
+    def warm_up(self) -> None:
+        """
+        Import the rendering and extraction libraries and build the render
+        template ahead of the first job, starting the worker processes in
+        process mode
+        """
+        if self.use_processes:
+            pool = self._get_process_pool()
+            # Each submission starts another worker until the pool is full
+            for future in [pool.submit(int) for _ in range(self.workers)]:
+                future.result()
+            return
+
+        import pdfplumber  # noqa: F401
+        import pypdfium2  # noqa: F401
+        import reportlab.pdfgen.canvas  # noqa: F401
+        import reportlab.platypus  # noqa: F401
+
+        self.template = RenderTemplate(column_ratios=self.config.table_column_ratios)
+
+    def submit(self, input_type: str, payload: bytes, options: Optional[dict[str, Any]] = None) -> ServiceJob:
+        """
+        Queue a conversion
+
+        Args:
+            input_type: One of INPUT_TYPES
+            payload: Raw input file contents
+            options: Converter options (PDF input: max_pages, artifacts,
+                output_format)
+
+        Returns:
+            The queued job
+        """
+        if input_type not in INPUT_TYPES:
+            raise ValueError(f"Unknown input type: {input_type}")
+        options = options or {}
+        output_format = options.get("output_format", self.config.output_format)
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
+
+        with self._lock:
+            if self._active >= self.workers + self.queue_size:
+                raise QueueFullError(f"{self._active} jobs queued or running")
+            self._active += 1
+            job_id = f"{next(self._job_ids):08d}"
+
+        if input_type == "pdf":
+            output_extension = "jsonl" if output_format == "ndjson" else "json"
+        else:
+            output_extension = "pdf"
+        job_dir = self.work_dir / job_id
+        job = ServiceJob(
+            job_id=job_id,
+            input_type=input_type,
+            output_path=job_dir / f"output.{output_extension}",
+            payload=payload,
+            options={**options, "output_format": output_format},
+            cancel_event=self._new_cancel_event()
+        )
+        try:
+            job_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            with self._lock:
+                self._active -= 1
+            raise
+
+        with self._lock:
+            self.jobs[job_id] = job
+        job.future = self.executor.submit(self._run_job, job)
+        job.future.add_done_callback(lambda future: self._finish_job(job, future))
+        return job
+
+    def get(self, job_id: str) -> Optional[ServiceJob]:
+        """
+        Look up a job by id
+        """
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[ServiceJob]:
+        """
+        Cancel a queued or running job
+
+        Returns:
+            The job, or None if it is unknown
+        """
+        job = self.get(job_id)
+        if job is not None and job.status in ("queued", "running"):
+            job.cancel_event.set()
+            if job.future is not None:
+                job.future.cancel()
+        return job
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Queue occupancy and job counts by status
+        """
+        with self._lock:
+            statuses: dict[str, int] = {}
+            for job in self.jobs.values():
+                statuses[job.status] = statuses.get(job.status, 0) + 1
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "active": self._active,
+                "jobs": statuses,
+            }
+
+    def shutdown(self) -> None:
+        """
+        Cancel outstanding jobs and stop the worker threads and processes
+        """
+        with self._lock:
+            jobs = list(self.jobs.values())
+        for job in jobs:
+            job.cancel_event.set()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True, cancel_futures=True)
+            self._process_pool = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    def _new_cancel_event(self) -> Any:
+        if not self.use_processes:
+            return threading.Event()
+        with self._lock:
+            if self._manager is None:
+                import multiprocessing
+
+                self._manager = multiprocessing.Manager()
+            return self._manager.Event()
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_job_worker,
+                    initargs=(
+                        self.config.table_column_ratios,
+                        self.config.cache_dir if self.cache is not None else None,
+                        self.config.cache_max_size_mb,
+                        LoggingConfig.worker_pool_options()
+                    )
+                )
+            return self._process_pool
+
+    def _job_options(self, job: ServiceJob) -> dict[str, Any]:
+        if job.input_type == "jsonl":
+            return {"sanitize": self.config.sanitize_jsonl}
+        if job.input_type == "json":
+            return {
+                "long_table": self.config.long_table,
+                "column_ratios": self.config.table_column_ratios,
+            }
+        return {
+            "stream": True,
+            "engine": self.config.extraction_engine,
+            "max_pages": job.options.get("max_pages"),
+            "artifacts": job.options.get("artifacts") or self.config.extraction_artifacts,
+            "max_rss_mb": self.config.extraction_max_rss_mb,
+            "output_format": job.options["output_format"],
+            "serializer": self.config.json_serializer,
+        }
+
+    def _run_job(self, job: ServiceJob) -> bool:
+        job.status = "running"
+        job.started_at = time.time()
+        options = self._job_options(job)
+
+        if not self.use_processes:
+            def on_progress(done: int, total: int):
+                job.progress = done / total if total else 0.0
+
+            return _convert_job(
+                job.input_type,
+                job.payload,
+                str(job.output_path),
+                options,
+                self.template,
+                self.cache,
+                on_progress,
+                job.cancel_event
+            )
+
+        pool = self._get_process_pool()
+        progress = self._manager.Value("d", 0.0)
+        future = pool.submit(
+            _run_pooled_job,
+            job.input_type,
+            job.payload,
+            str(job.output_path),
+            options,
+            job.cancel_event,
+            progress
+        )
+        try:
+            while True:
+                try:
+                    success, metrics = future.result(timeout=PROGRESS_POLL_SECONDS)
+                    break
+                except TimeoutError:
+                    job.progress = progress.value
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); later jobs get a new pool
+            with self._lock:
+                if self._process_pool is pool:
+                    self._process_pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        METRICS.merge(metrics)
+        return success
+
+    def _finish_job(self, job: ServiceJob, future: Future) -> None:
+        if future.cancelled() or job.cancel_event.is_set():
+            job.status = "cancelled"
+        elif future.exception() is not None:
+            job.status, job.error = "failed", str(future.exception())
+        elif future.result():
+            job.status, job.progress = "done", 1.0
+        else:
+            job.status, job.error = "failed", "conversion failed, see the service log"
+        job.finished_at = time.time()
+        # The input is only needed while the job runs
+        job.payload = None
+
+        evicted = []
+        with self._lock:
+            self._active -= 1
+            self._finished.append(job.job_id)
+            while len(self._finished) > self.retention:
+                evicted.append(self.jobs.pop(self._finished.popleft()))
+        for old_job in evicted:
+            shutil.rmtree(old_job.output_path.parent, ignore_errors=True)
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP API of the conversion service.
+
+    POST   /jobs?type=json|jsonl|pdf   queue the request body for conversion
+    GET    /jobs/<id>                  job status
+    GET    /jobs/<id>/result           converted file, once the job is done
+    DELETE /jobs/<id>                  cancel a job
+    GET    /health                     queue occupancy
+    GET    /metrics                    stage metrics in Prometheus format
+    """
+    server_version = "DocuBridge"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self) -> ConversionService:
+        return self.server.service
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/jobs":
+            return self._send_json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > self.service.config.max_file_size_mb * 1024 * 1024:
+            self.close_connection = True
+            return self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "input too large"})
+        payload = self.rfile.read(length)
+
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        options: dict[str, Any] = {}
+        try:
+            if "max_pages" in query:
+                options["max_pages"] = int(query["max_pages"])
+            if "artifacts" in query:
+                options["artifacts"] = tuple(query["artifacts"].split(","))
+            if "output_format" in query:
+                options["output_format"] = query["output_format"]
+            job = self.service.submit(query.get("type", ""), payload, options)
+        except QueueFullError as e:
+            return self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(e)}, {"Retry-After": "1"})
+        except ValueError as e:
+            return self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+        self._send_json(HTTPStatus.ACCEPTED, job.to_dict(), {"Location": f"/jobs/{job.job_id}"})
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/health":
+            return self._send_json(HTTPStatus.OK, {"status": "ok", **self.service.stats()})
+        if path == "/metrics":
+            return self._send_body(HTTPStatus.OK, METRICS.to_prometheus().encode("utf-8"), "text/plain; version=0.0.4")
+
+        parts = path.strip("/").split("/")
+        if len(parts) not in (2, 3) or parts[0] != "jobs" or (len(parts) == 3 and parts[2] != "result"):
+            return self._send_json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+        job = self.service.get(parts[1])
+        if job is None:
+            return self._send_json(HTTPStatus.NOT_FOUND, {"error": "unknown job"})
+        if len(parts) == 2:
+            return self._send_json(HTTPStatus.OK, job.to_dict())
+        if job.status != "done":
+            return self._send_json(HTTPStatus.CONFLICT, job.to_dict())
+
+        content_type = CONTENT_TYPES[job.output_path.suffix.lstrip(".")]
+        with open(job.output_path, "rb") as result_file:
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(job.output_path.stat().st_size))
+            self.end_headers()
+            shutil.copyfileobj(result_file, self.wfile)
+
+    def do_DELETE(self):
+        parts = urlsplit(self.path).path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] != "jobs":
+            return self._send_json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+        job = self.service.cancel(parts[1])
+        if job is None:
+            return self._send_json(HTTPStatus.NOT_FOUND, {"error": "unknown job"})
+        self._send_json(HTTPStatus.ACCEPTED, job.to_dict())
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logging.debug(f"{self.address_string()} {format % args}")
+
+    def _send_json(self, status: HTTPStatus, payload: dict[str, Any], headers: Optional[dict[str, str]] = None):
+        self._send_body(status, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+    def _send_body(self, status: HTTPStatus, body: bytes, content_type: str, headers: Optional[dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ServiceHTTPServer(ThreadingHTTPServer):
+    """
+    HTTP server on a localhost TCP port.
+    """
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: ConversionService):
+        self.service = service
+        super().__init__(address, ServiceRequestHandler)
+
+
+class ServiceUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    HTTP server on a Unix domain socket.
+    """
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, service: ConversionService):
+        self.service = service
+        socket_path.unlink(missing_ok=True)
+        super().__init__(str(socket_path), ServiceRequestHandler)
+
+
+def create_server(
+    service: ConversionService,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: Optional[Path] = None
+) -> socketserver.BaseServer:
+    """
+    Bind the HTTP API to a TCP port or a Unix socket
+
+    Args:
+        service: Service handling the requests
+        host: Interface for TCP mode; keep it on localhost
+        port: Port for TCP mode, 0 for any free port
+        unix_socket: Serve on this socket path instead of TCP
+
+    Returns:
+        Bound server, ready for serve_forever()
+    """
+    if unix_socket is not None:
+        return ServiceUnixServer(unix_socket, service)
+    return ServiceHTTPServer((host, port), service)
+
+
+def build_parser(config: AppConfig) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="docubridge-serve",
+        description="Run a local conversion service with warm converters."
+    )
+    parser.add_argument(
+        "--host", default=config.service_host,
+        help="interface to listen on (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=config.service_port,
+        help="TCP port to listen on (default: %(default)s)"
+    )
+    parser.add_argument("--unix-socket", type=Path, help="listen on a Unix socket instead of TCP")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=config.service_workers,
+        help="conversions running at once (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--queue-size", type=int, default=config.service_queue_size,
+        help="jobs allowed to wait for a worker (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--threads", dest="use_processes", action="store_false", default=config.service_use_processes,
+        help="run jobs on threads of the service process instead of worker processes"
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point for the conversion service.
+
+    Returns:
+        Exit code
+    """
+    config = AppConfig()
+    args = build_parser(config).parse_args(argv)
+    LoggingConfig.configure_logging(
+        config.log_dir,
+        queued=config.log_queued,
+        page_log_level=config.page_log_level,
+        page_log_sample_every=config.page_log_sample_every
+    )
+
+    service = ConversionService(
+        config,
+        workers=max(1, args.workers),
+        queue_size=max(0, args.queue_size),
+        retention=config.service_job_retention,
+        use_processes=args.use_processes
+    )
+    service.warm_up()
+    server = create_server(service, args.host, args.port, args.unix_socket)
+    logging.info(f"DocuBridge service listening on {args.unix_socket or f'{args.host}:{server.server_address[1]}'}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+        if args.unix_socket is not None:
+            args.unix_socket.unlink(missing_ok=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+from pathlib import Path
+from typing import Any, BinaryIO
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+
+from app.utils.file_utils import BUFFER_TYPES, FileUtils, InputSource
+
+class ConversionCache:
+    """
+    Content-addressed on-disk cache for conversion artifacts.
+
+    Entries are keyed by a hash of the input bytes plus the conversion
+    options. Each hit refreshes the entry's modification time, which
+    drives least-recently-used eviction once the cache exceeds its size cap.
+    """
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: Path, max_size_mb: int = 512):
+        """
+        Initialize the cache directory and counters
+
+        Args:
+            cache_dir: Directory holding cached artifacts
+            max_size_mb: Maximum total size of cached artifacts in megabytes
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def key_for_bytes(cls, payload: bytes | memoryview, /, **options: Any) -> str:
+        """
+        Build a cache key for in-memory input
+
+        Args:
+            payload: Raw input bytes
+            options: Conversion options affecting the output
+
+        Returns:
+            Hex digest identifying input and options
+        """
+        digest = hashlib.sha256(payload)
+        digest.update(cls._encode_options(options))
+        return digest.hexdigest()
+
+    @classmethod
+    def key_for_file(cls, file_path: str | Path, /, **options: Any) -> str:
+        """
+        Build a cache key for a file, hashing it in chunks
+
+        Args:
+            file_path: Path to the input file
+            options: Conversion options affecting the output
+
+        Returns:
+            Hex digest identifying input and options
+        """
+        with open(file_path, "rb") as input_file:
+            return cls.key_for_stream(input_file, **options)
+
+    @classmethod
+    def key_for_stream(cls, stream: BinaryIO, /, **options: Any) -> str:
+        """
+        Build a cache key for a seekable binary stream, hashing it in chunks
+
+        The stream is read from its current position, which is restored
+        afterwards.
+
+        Args:
+            stream: Seekable binary input stream
+            options: Conversion options affecting the output
+
+        Returns:
+            Hex digest identifying input and options
+        """
+        digest = hashlib.sha256()
+        position = stream.tell()
+        while chunk := stream.read(cls.HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        stream.seek(position)
+        digest.update(cls._encode_options(options))
+        return digest.hexdigest()
+
+    @classmethod
+    def key_for_input(cls, source: InputSource, /, **options: Any) -> str:
+        """
+        Build a cache key for a file path, buffer or seekable stream
+
+        Args:
+            source: Conversion input
+            options: Conversion options affecting the output
+
+        Returns:
+            Hex digest identifying input and options
+        """
+        if FileUtils.is_path(source):
+            return cls.key_for_file(source, **options)
+        if isinstance(source, BUFFER_TYPES):
+            return cls.key_for_bytes(source, **options)
+        return cls.key_for_stream(source, **options)
+
+    def get(self, key: str, destination: str | Path) -> bool:
+        """
+        Copy a cached artifact to `destination` if present
+
+        Args:
+            key: Cache key
+            destination: Path the artifact is copied to on a hit
+
+        Returns:
+            Boolean indicating a cache hit
+        """
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "rb") as cached_file, FileUtils.atomic_write(destination) as output_file:
+                shutil.copyfileobj(cached_file, output_file)
+            os.utime(entry)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def put(self, key: str, source: str | Path) -> None:
+        """
+        Store an artifact and evict old entries beyond the size cap
+
+        Args:
+            key: Cache key
+            source: Path of the freshly converted artifact
+        """
+        try:
+            entry = self._entry_path(key)
+            entry.parent.mkdir(exist_ok=True)
+            # Copy to a temporary name first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            os.close(fd)
+            shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, entry)
+            self._evict()
+        except OSError as e:
+            logging.error(f"Conversion cache write error: {e}")
+
+    def stats(self) -> dict[str, int]:
+        """
+        Snapshot of cache counters and usage
+
+        Returns:
+            Hits, misses, entry count and total size in bytes
+        """
+        entries = self._list_entries()
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(entries),
+                "size_bytes": sum(size for _, size, _ in entries)
+            }
+
+    def clear(self) -> None:
+        """
+        Remove every cached artifact
+        """
+        for entry, _, _ in self._list_entries():
+            entry.unlink(missing_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        # Fan out over subdirectories to keep directory listings short
+        return self.cache_dir / key[:2] / key
+
+    def _list_entries(self) -> list[tuple[Path, int, float]]:
+        entries = []
+        for entry in self.cache_dir.glob("*/*"):
+            if entry.suffix == ".tmp":
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((entry, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._list_entries()
+        total_size = sum(size for _, size, _ in entries)
+        if total_size <= self.max_size_bytes:
+            return
+
+        # Oldest access first
+        for entry, size, _ in sorted(entries, key=lambda item: item[2]):
+            entry.unlink(missing_ok=True)
+            total_size -= size
+            if total_size <= self.max_size_bytes:
+                break
+
+    @staticmethod
+    def _encode_options(options: dict[str, Any]) -> bytes:
+        return json.dumps(options, sort_keys=True, default=str).encode("utf-8")
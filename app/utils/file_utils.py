@@ -1,7 +1,126 @@
-from typing import Optional
+from contextlib import contextmanager
+from itertools import count
+from typing import Any, BinaryIO, Iterable, Iterator, NamedTuple, Optional, Union
 from pathlib import Path
+import io
+import mmap
 import os
 import logging
+import time
+
+# Distinguishes temporary files written concurrently by one process
+_temp_ids = count(1)
+
+# In-memory inputs read without copying
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+# What converters accept as input: a file path, an in-memory buffer or a
+# binary file-like object
+InputSource = Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap, BinaryIO]
+
+# What converters accept as output: a file path or a writable binary stream
+OutputTarget = Union[str, os.PathLike, BinaryIO]
+
+
+class MemoryReader(io.RawIOBase):
+    """
+    Seekable, read-only stream over a buffer.
+
+    Reads copy only the requested slice, so a large upload held in bytes,
+    a memoryview or an mmap is never duplicated as a whole.
+    """
+    def __init__(self, buffer: Any):
+        super().__init__()
+        self._buffer_view = memoryview(buffer)
+        self._view = self._buffer_view.cast("B")
+        self._position = 0
+
+    def close(self) -> None:
+        # Release the views so an mmap can be closed by its owner
+        if not self.closed:
+            self._view.release()
+            self._buffer_view.release()
+        super().close()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._position = offset
+        return offset
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self._view[self._position:self._position + len(buffer)]
+        buffer[:len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+
+class ScannedFile(NamedTuple):
+    """
+    A file found by a directory scan, with the stat data read for it.
+    """
+    path: Path
+    size: int
+    mtime_ns: int
+
+    @property
+    def signature(self) -> tuple[int, int]:
+        """
+        Size and modification time, which change whenever the file does
+        """
+        return self.size, self.mtime_ns
+
+
+# Shared by every allocator in the process, so two allocators writing to
+# the same directory (two AppConfigs, the GUI and the service) never hand
+# out the same name
+_OUTPUT_SEQUENCE = count(1)
+
+
+class OutputAllocator:
+    """
+    Constant-time, collision-free output file names.
+
+    Names combine the allocator's start time, the process id and a
+    process-wide sequence number, so a name is chosen without probing the
+    output directory and parallel jobs, other allocators or worker
+    processes never pick the same one.
+    """
+    def __init__(self, output_dir: Path, prefix: str = "converted_file"):
+        self.output_dir = Path(output_dir)
+        self.prefix = prefix
+        self._started = time.strftime("%Y%m%d-%H%M%S")
+
+    def allocate(self, extension: str, prefix: Optional[str] = None) -> Path:
+        """
+        Next free output path
+
+        Args:
+            extension: File extension without the dot
+            prefix: Base filename, the allocator's prefix when omitted
+
+        Returns:
+            Output file path that no other allocation will return
+        """
+        # next() on a count is atomic, and the pid is read per call so a
+        # forked worker does not repeat its parent's names
+        sequence = next(_OUTPUT_SEQUENCE)
+        name = f"{prefix or self.prefix}_{self._started}_{os.getpid()}_{sequence:06d}.{extension}"
+        return self.output_dir / name
+
 
 class FileUtils:
     """
@@ -33,7 +152,10 @@ class FileUtils:
         valid_extensions: list[str],
     ) -> list[Path]:
         """
-        Retrieve valid files from a directory
+        Retrieve valid files from a directory, without descending into
+        subdirectories (see `scan_files`)
+
+        Hidden and empty files are included.
 
         Args:
             directory: Directory to scan
@@ -43,6 +165,342 @@ class FileUtils:
             list of valid file paths
         """
         return [
-            file for file in directory.iterdir()
-            if file.is_file() and file.suffix.lstrip(".") in valid_extensions
-        ]
\ No newline at end of file
+            scanned.path
+            for scanned in FileUtils.scan_files(
+                directory,
+                valid_extensions,
+                recursive=False,
+                skip_hidden=False,
+                skip_empty=False
+            )
+        ]
+
+    @staticmethod
+    def scan_files(
+        directory: Path,
+        valid_extensions: Iterable[str],
+        max_size_mb: Optional[float] = None,
+        recursive: bool = True,
+        exclude: Iterable[Path] = (),
+        skip_hidden: bool = True,
+        skip_empty: bool = True
+    ) -> Iterator[ScannedFile]:
+        """
+        Lazily find valid files under a directory
+
+        Walks the tree with os.scandir and an explicit stack, yielding
+        files as they are found. By default hidden files and directories
+        (including the temporaries written by `atomic_output`) are
+        skipped, as are empty files; files over `max_size_mb` always are.
+
+        Args:
+            directory: Directory to scan
+            valid_extensions: File extensions to keep, without the dot
+            max_size_mb: Optional size limit in megabytes
+            recursive: Descend into subdirectories
+            exclude: Directories to leave out, such as the output directory
+            skip_hidden: Skip entries whose name starts with a dot
+            skip_empty: Skip zero-byte files
+
+        Yields:
+            Matching files with their size and modification time
+        """
+        valid_extensions = frozenset(valid_extensions)
+        max_bytes = None if max_size_mb is None else max_size_mb * 1024 * 1024
+        excluded = frozenset(os.path.abspath(path) for path in exclude)
+
+        stack = [os.fspath(directory)]
+        while stack:
+            files, subdirectories = FileUtils._scan_directory(
+                stack.pop(),
+                valid_extensions,
+                max_bytes,
+                skip_hidden,
+                skip_empty
+            )
+            yield from files
+            if recursive:
+                stack.extend(sorted(
+                    (path for path in subdirectories if os.path.abspath(path) not in excluded),
+                    reverse=True
+                ))
+
+    @staticmethod
+    def _scan_directory(
+        directory: str,
+        valid_extensions: frozenset[str],
+        max_bytes: Optional[float],
+        skip_hidden: bool = True,
+        skip_empty: bool = True
+    ) -> tuple[list[ScannedFile], list[str]]:
+        """
+        List one directory level
+
+        Returns:
+            Matching files in name order and the paths of visible subdirectories
+        """
+        files, subdirectories = [], []
+        try:
+            with os.scandir(directory) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+        except OSError as e:
+            logging.warning(f"Cannot scan {directory}: {e}")
+            return files, subdirectories
+
+        for entry in entries:
+            if skip_hidden and entry.name.startswith("."):
+                continue
+            try:
+                # d_type from scandir answers these without a stat call
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                    continue
+                if not entry.is_file() or os.path.splitext(entry.name)[1][1:].lower() not in valid_extensions:
+                    continue
+                stat = entry.stat()
+            except OSError:
+                # Removed between listing and stat
+                continue
+            if skip_empty and stat.st_size == 0:
+                continue
+            if max_bytes is not None and stat.st_size > max_bytes:
+                logging.warning(f"Skipping {entry.path}: {stat.st_size} bytes exceeds the size limit")
+                continue
+            files.append(ScannedFile(Path(entry.path), stat.st_size, stat.st_mtime_ns))
+        return files, subdirectories
+
+    @staticmethod
+    def is_path(source: Any) -> bool:
+        """
+        Check whether an input or output refers to a file on disk
+        """
+        return isinstance(source, (str, os.PathLike))
+
+    @staticmethod
+    def describe(source: Any) -> str:
+        """
+        Short description of an input or output for log messages
+        """
+        if FileUtils.is_path(source):
+            return os.fspath(source)
+        return f"<{type(source).__name__}>"
+
+    @staticmethod
+    @contextmanager
+    def open_input(source: InputSource) -> Iterator[BinaryIO]:
+        """
+        Open any supported input as a seekable binary stream
+
+        Paths are opened and closed again afterwards. Buffers are wrapped
+        without copying. Seekable streams are used as they are and left
+        open; other streams (sockets, pipes) are read into memory first.
+
+        Args:
+            source: File path, buffer or binary file-like object
+
+        Yields:
+            Seekable binary stream positioned at the start of the input
+        """
+        if FileUtils.is_path(source):
+            with open(source, "rb") as input_file:
+                yield input_file
+        elif isinstance(source, BUFFER_TYPES):
+            with io.BufferedReader(MemoryReader(source)) as reader:
+                yield reader
+        elif source.seekable():
+            yield source
+        else:
+            yield io.BytesIO(source.read())
+
+    @staticmethod
+    def input_size(stream: BinaryIO) -> int:
+        """
+        Bytes from the current position to the end of a seekable stream
+        """
+        position = stream.tell()
+        size = stream.seek(0, io.SEEK_END) - position
+        stream.seek(position)
+        return size
+
+    @staticmethod
+    @contextmanager
+    def output_target(destination: OutputTarget) -> Iterator[str | BinaryIO]:
+        """
+        Where a converter should write its output
+
+        Args:
+            destination: File path or writable binary stream
+
+        Yields:
+            A temporary path renamed over a file destination on success
+            (see `atomic_output`), or the stream itself
+        """
+        if FileUtils.is_path(destination):
+            with FileUtils.atomic_output(destination) as temp_path:
+                yield temp_path
+        else:
+            yield destination
+
+    @staticmethod
+    @contextmanager
+    def open_output(destination: OutputTarget) -> Iterator[BinaryIO]:
+        """
+        Binary stream a converter should write its output to
+
+        Args:
+            destination: File path or writable binary stream
+
+        Yields:
+            An atomically replaced file (see `atomic_write`), or the stream
+            itself, which is left open
+        """
+        if FileUtils.is_path(destination):
+            with FileUtils.atomic_write(destination) as output_file:
+                yield output_file
+        else:
+            yield destination
+
+    @staticmethod
+    @contextmanager
+    def atomic_output(file_path: str | Path) -> Iterator[str]:
+        """
+        Temporary path that replaces `file_path` once the block succeeds
+
+        The temporary file lives in the same directory, so the final
+        os.replace is atomic and readers only ever see the previous file
+        or the complete new one. It is removed if the block raises.
+
+        Args:
+            file_path: Final file path
+
+        Yields:
+            Temporary path to write to
+        """
+        file_path = Path(file_path)
+        temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.{next(_temp_ids)}.tmp")
+        # Created through os.open so the file gets the usual umask permissions
+        os.close(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+        try:
+            yield str(temp_path)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    @contextmanager
+    def atomic_write(file_path: str | Path) -> Iterator[BinaryIO]:
+        """
+        Binary file that replaces `file_path` once the block succeeds
+
+        Args:
+            file_path: Final file path
+
+        Yields:
+            File object open for writing
+        """
+        with FileUtils.atomic_output(file_path) as temp_path:
+            with open(temp_path, "wb") as output_file:
+                yield output_file
+
+
+class FolderWatcher:
+    """
+    Polling watcher reporting new and changed files in a directory tree.
+
+    Each poll stats every known directory once and only re-lists the
+    directories whose modification time changed, reusing the cached
+    subdirectory list of the others, so a quiet tree with many files costs
+    one stat per directory. A file is reported once its size and
+    modification time were the same on two consecutive polls, so files
+    still being copied in are not picked up half-written. Files modified
+    in place do not touch their directory, so every `full_scan_every`-th
+    poll re-lists the whole tree to catch them.
+    """
+    def __init__(
+        self,
+        directory: Path,
+        valid_extensions: Iterable[str],
+        max_size_mb: Optional[float] = None,
+        recursive: bool = True,
+        exclude: Iterable[Path] = (),
+        full_scan_every: int = 30
+    ):
+        self.directory = os.fspath(directory)
+        self.valid_extensions = frozenset(valid_extensions)
+        self.max_bytes = None if max_size_mb is None else max_size_mb * 1024 * 1024
+        self.recursive = recursive
+        self.excluded = frozenset(os.path.abspath(path) for path in exclude)
+        self.full_scan_every = max(1, full_scan_every)
+
+        self._polls = 0
+        # Directory path -> (mtime_ns, subdirectories) from its last listing
+        self._directories: dict[str, tuple[int, list[str]]] = {}
+        self._pending: dict[Path, tuple[int, int]] = {}
+        self._reported: dict[Path, tuple[int, int]] = {}
+
+    def poll(self) -> list[ScannedFile]:
+        """
+        Scan for files that appeared or changed since they were last reported
+
+        Returns:
+            Settled new or changed files
+        """
+        full_scan = self._polls % self.full_scan_every == 0
+        self._polls += 1
+
+        found = self._scan_changed_directories(full_scan)
+        # Files still settling may sit in directories that were not re-listed
+        for path in self._pending.keys() - found.keys():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if 0 < stat.st_size and (self.max_bytes is None or stat.st_size <= self.max_bytes):
+                found[path] = ScannedFile(path, stat.st_size, stat.st_mtime_ns)
+
+        ready = []
+        pending = {}
+        for path, scanned in found.items():
+            if self._reported.get(path) == scanned.signature:
+                continue
+            if self._pending.get(path) == scanned.signature:
+                self._reported[path] = scanned.signature
+                ready.append(scanned)
+            else:
+                pending[path] = scanned.signature
+        self._pending = pending
+
+        if full_scan:
+            # Forget deleted files so the history does not grow without bound
+            self._reported = {path: signature for path, signature in self._reported.items() if path in found}
+        return ready
+
+    def _scan_changed_directories(self, full_scan: bool) -> dict[Path, ScannedFile]:
+        found: dict[Path, ScannedFile] = {}
+        directories: dict[str, tuple[int, list[str]]] = {}
+        stack = [self.directory]
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+
+            cached = self._directories.get(directory)
+            if full_scan or cached is None or cached[0] != mtime_ns:
+                files, subdirectories = FileUtils._scan_directory(
+                    directory,
+                    self.valid_extensions,
+                    self.max_bytes
+                )
+                found.update((scanned.path, scanned) for scanned in files)
+                cached = (
+                    mtime_ns,
+                    [path for path in subdirectories if os.path.abspath(path) not in self.excluded]
+                )
+            directories[directory] = cached
+            if self.recursive:
+                stack.extend(cached[1])
+        self._directories = directories
+        return found
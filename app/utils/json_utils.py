@@ -1,9 +1,190 @@
+import hashlib
 import json
-import jsonschema
-from typing import Any, Optional, Union
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional, Union
 import logging
 
-import jsonschema.exceptions
+# Schema used when callers do not pass one
+DEFAULT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "data": {"type": "array"},
+        "metadata": {"type": "object"}
+    }
+}
+
+# Keys dropped by sanitize_json, compared lowercase
+REDACTED_KEYS = frozenset({"password", "secret", "token"})
+MAX_STRING_LENGTH = 1000
+# Distinct keys remembered by a sanitizer before its memo is reset
+MAX_MEMOIZED_KEYS = 100_000
+
+# Compiled validators keyed by schema hash, per process
+MAX_CACHED_VALIDATORS = 64
+_validator_cache: dict[str, Any] = {}
+_validator_lock = threading.Lock()
+
+
+def _schema_hash(schema: dict[str, Any]) -> str:
+    """
+    Stable identity of a schema, independent of key order
+    """
+    encoded = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _validate_jsonl_chunk(
+    schema: Optional[dict[str, Any]],
+    lines: list[tuple[int, bytes]]
+) -> list[dict[str, Any]]:
+    """
+    Validate a chunk of JSONL lines in a worker process
+
+    Args:
+        schema: JSON schema each record must satisfy
+        lines: (line number, raw line) pairs
+
+    Returns:
+        Error reports for the invalid lines of the chunk
+    """
+    validator = JsonUtils.get_validator(schema)
+    reports = []
+    for line_number, line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            reports.append({
+                "line_number": line_number,
+                "errors": [{"path": "$", "message": f"Invalid JSON: {error}"}]
+            })
+            continue
+
+        errors = [
+            {"path": error.json_path, "message": error.message}
+            for error in validator.iter_errors(record)
+        ]
+        if errors:
+            reports.append({"line_number": line_number, "errors": errors})
+    return reports
+
+
+class JsonSanitizer:
+    """
+    Iterative JSON sanitizer that drops redacted keys and truncates long strings.
+
+    Containers are walked with an explicit stack, so arbitrarily deep
+    documents never hit the recursion limit. The redaction decision is
+    memoized per distinct key, so the lowercase copy of a key is built
+    once rather than once per occurrence.
+    """
+    def __init__(
+        self,
+        redacted_keys: frozenset[str] = REDACTED_KEYS,
+        max_string_length: int = MAX_STRING_LENGTH
+    ):
+        self.redacted_keys = frozenset(key.lower() for key in redacted_keys)
+        self.max_string_length = max_string_length
+        self._decisions: dict[str, bool] = {}
+
+    def is_redacted(self, key: str) -> bool:
+        """
+        Check whether an object key is removed
+        """
+        decision = self._decisions.get(key)
+        if decision is None:
+            decision = key.lower() in self.redacted_keys
+            if len(self._decisions) >= MAX_MEMOIZED_KEYS:
+                self._decisions.clear()
+            self._decisions[key] = decision
+        return decision
+
+    def sanitize(self, data: Any, in_place: bool = False) -> Any:
+        """
+        Sanitize a parsed JSON value
+
+        Args:
+            data: Parsed JSON value
+            in_place: Modify `data` directly instead of building a copy
+
+        Returns:
+            Sanitized value; `data` itself when sanitized in place
+        """
+        if isinstance(data, str):
+            return self._truncate(data)
+        if not isinstance(data, (dict, list)):
+            return data
+        if in_place:
+            self._sanitize_in_place(data)
+            return data
+        return self._sanitize_copy(data)
+
+    def iter_jsonl(self, jsonl_file: BinaryIO) -> Iterator[Any]:
+        """
+        Parse and sanitize JSONL records one at a time
+
+        Args:
+            jsonl_file: Source JSONL file opened in binary mode
+
+        Yields:
+            Sanitized records; blank lines are skipped
+        """
+        for line in jsonl_file:
+            if line.strip():
+                yield self.sanitize(json.loads(line), in_place=True)
+
+    def _truncate(self, value: str) -> str:
+        # Slicing always copies, so only slice strings that are too long
+        return value[:self.max_string_length] if len(value) > self.max_string_length else value
+
+    def _sanitize_copy(self, data: dict | list) -> dict | list:
+        root = {} if isinstance(data, dict) else []
+        stack = [(data, root)]
+        while stack:
+            source, target = stack.pop()
+            if isinstance(source, dict):
+                for key, value in source.items():
+                    if not self.is_redacted(key):
+                        target[key] = self._copy_value(value, stack)
+            else:
+                target.extend(self._copy_value(value, stack) for value in source)
+        return root
+
+    def _copy_value(self, value: Any, stack: list) -> Any:
+        # Containers are created empty and filled when popped off the stack
+        if isinstance(value, dict):
+            copy = {}
+        elif isinstance(value, list):
+            copy = []
+        elif isinstance(value, str):
+            return self._truncate(value)
+        else:
+            return value
+        stack.append((value, copy))
+        return copy
+
+    def _sanitize_in_place(self, data: dict | list) -> None:
+        stack = [data]
+        while stack:
+            container = stack.pop()
+            if isinstance(container, dict):
+                redacted = [key for key in container if self.is_redacted(key)]
+                for key in redacted:
+                    del container[key]
+                items = container.items()
+            else:
+                items = enumerate(container)
+
+            for key, value in items:
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+                elif isinstance(value, str) and len(value) > self.max_string_length:
+                    # Replacing the value of an existing key keeps iteration valid
+                    container[key] = value[:self.max_string_length]
+
 
 class JsonUtils:
     """
@@ -25,55 +206,157 @@ class JsonUtils:
         Returns:
             Boolean indicating validation success
         """
+        import jsonschema
+
         try:
             # Parse string input if necessary
             if isinstance(data, str):
                 data = json.loads(data)
-            
-            # Default schema if not provided
-            default_schema = {
-                "type": "object",
-                "properties": {
-                    "data": {"type": "array"},
-                    "metadata": {"type": "object"}
-                }
-            }
-
-            jsonschema.validate(
-                instance=data,
-                schema=schema or default_schema
-            )
+
+            JsonUtils.get_validator(schema).validate(data)
             return True
         except (jsonschema.exceptions.ValidationError, json.JSONDecodeError) as error:
             logging.error(f"JSON validation error: {error}")
             return False
         
+    @staticmethod
+    def get_validator(schema: Optional[dict[str, Any]] = None) -> Any:
+        """
+        Compiled validator for a schema, built once per schema hash
+
+        The schema itself is checked only when its validator is first
+        built, so repeated validation skips that setup entirely.
+
+        Args:
+            schema: JSON schema, DEFAULT_SCHEMA when omitted
+
+        Returns:
+            jsonschema validator instance
+        """
+        import jsonschema
+
+        schema = schema or DEFAULT_SCHEMA
+        key = _schema_hash(schema)
+        with _validator_lock:
+            validator = _validator_cache.get(key)
+            if validator is not None:
+                return validator
+
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+
+        with _validator_lock:
+            if len(_validator_cache) >= MAX_CACHED_VALIDATORS:
+                # Drop the oldest entry; dicts keep insertion order
+                del _validator_cache[next(iter(_validator_cache))]
+            _validator_cache[key] = validator
+        return validator
+
+    @staticmethod
+    def validate_jsonl(
+        input_path: str | Path,
+        schema: Optional[dict[str, Any]] = None,
+        workers: int = 1,
+        chunk_size: int = 10_000
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Validate every record of a JSONL file, reporting errors per line
+
+        With more than one worker, chunks of `chunk_size` lines are
+        validated on a process pool. Only a bounded number of chunks is
+        in flight at a time and reports are yielded in line order.
+
+        Args:
+            input_path: Source JSONL file
+            schema: JSON schema each record must satisfy, DEFAULT_SCHEMA
+                when omitted
+            workers: Number of worker processes
+            chunk_size: Lines handed to a worker at a time
+
+        Yields:
+            {"line_number", "errors": [{"path", "message"}]} for each
+            invalid line; blank lines are skipped
+        """
+        with open(input_path, "rb") as jsonl_file:
+            chunks = JsonUtils._iter_line_chunks(jsonl_file, chunk_size)
+            if workers <= 1:
+                for chunk in chunks:
+                    yield from _validate_jsonl_chunk(schema, chunk)
+                return
+
+            from collections import deque
+            from concurrent.futures import ProcessPoolExecutor
+            from app.utils.logging_config import LoggingConfig
+
+            pool = ProcessPoolExecutor(max_workers=workers, **LoggingConfig.worker_pool_options())
+            try:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(pool.submit(_validate_jsonl_chunk, schema, chunk))
+                    if len(pending) >= workers * 2:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _iter_line_chunks(
+        jsonl_file: BinaryIO,
+        chunk_size: int
+    ) -> Iterator[list[tuple[int, bytes]]]:
+        numbered_lines = enumerate(jsonl_file, 1)
+        while chunk := list(islice(numbered_lines, chunk_size)):
+            yield chunk
+
     @staticmethod
     def sanitize_json(
-        data: dict[str, Any],
-    ) -> dict[str, Any]:
+        data: Any,
+        redacted_keys: frozenset[str] = REDACTED_KEYS,
+        max_string_length: int = MAX_STRING_LENGTH,
+        in_place: bool = False
+    ) -> Any:
         """
         Advanced JSON data sanitization
 
+        Drops redacted keys (case-insensitively) and truncates long strings.
+
         Args:
             data: Input JSON data
+            redacted_keys: Lowercase key names removed from every object
+            max_string_length: Maximum length kept for string values
+            in_place: Modify `data` directly instead of building a copy
 
         Returns:
             Sanitized JSON data
         """
-        def _sanitize_value(value):
-            """
-            Recursive value sanitization
-            """
-            if isinstance(value, dict):
-                return {
-                    k: _sanitize_value(v) for k, v in value.items()
-                    if not k.lower() in ["password", "secret", "token"]
-                }
-            elif isinstance(value, list):
-                return [_sanitize_value(item) for item in value]
-            elif isinstance(value, str):
-                return value[:1000]
-            return value
-        
-        return _sanitize_value(data)
\ No newline at end of file
+        return JsonSanitizer(redacted_keys, max_string_length).sanitize(data, in_place)
+
+    @staticmethod
+    def sanitize_jsonl(
+        input_path: str | Path,
+        output_path: str | Path,
+        redacted_keys: frozenset[str] = REDACTED_KEYS,
+        max_string_length: int = MAX_STRING_LENGTH
+    ) -> int:
+        """
+        Sanitize a JSONL file one record at a time
+
+        Args:
+            input_path: Source JSONL file
+            output_path: Destination JSONL file
+            redacted_keys: Lowercase key names removed from every object
+            max_string_length: Maximum length kept for string values
+
+        Returns:
+            Number of records written
+        """
+        sanitizer = JsonSanitizer(redacted_keys, max_string_length)
+        records = 0
+        with open(input_path, "rb") as jsonl_file, open(output_path, "w", encoding="utf-8") as output_file:
+            for record in sanitizer.iter_jsonl(jsonl_file):
+                output_file.write(json.dumps(record, ensure_ascii=False))
+                output_file.write("\n")
+                records += 1
+        return records
@@ -1,39 +1,193 @@
+import atexit
 import logging
-import structlog
+import logging.handlers
+from itertools import count
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+from app.utils.metrics import Metrics
+
+if TYPE_CHECKING:
+    import structlog
+
+# Logger receiving per-page stage events
+PAGE_LOGGER_NAME = Metrics.PAGE_LOGGER_NAME
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Let through one record out of every `sample_every`.
+    """
+    def __init__(self, sample_every: int = 1):
+        super().__init__()
+        self.sample_every = max(1, sample_every)
+        self._counter = count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return next(self._counter) % self.sample_every == 0
+
 
 class LoggingConfig:
     """
     Centralized logging configuration with structured logging.
+
+    In queued mode, log calls only enqueue the record; a background
+    listener thread owns the file and console handlers. Pool workers
+    started with `worker_pool_options` send their records to the same
+    queue, so every process ends up in one log file without contending
+    on it.
     """
+    _listener: Optional[logging.handlers.QueueListener] = None
+    _queue: Any = None
+    _handlers: list[logging.Handler] = []
+    _worker_settings: Optional[tuple[int, int, int]] = None
+
     @staticmethod
     def configure_logging(
         log_dir: Optional[Path] = None,
-        log_level: int = logging.INFO
-    ) -> structlog.BoundLogger:
+        log_level: int = logging.INFO,
+        queued: bool = True,
+        page_log_level: int = logging.INFO,
+        page_log_sample_every: int = 1
+    ) -> "structlog.BoundLogger":
         """
         Configure structured logging with file and console outputs
 
         Args:
             log_dir: directory for log files
             log_level: logging verbosity level
-        
+            queued: hand records to a background listener thread instead
+                of writing them on the calling thread
+            page_log_level: threshold for per-page debug events, which are
+                emitted at DEBUG; leave above DEBUG to drop them cheaply
+            page_log_sample_every: keep one per-page event out of this many
+
         Returns:
             Configured structured logger
         """
+        import structlog
 
-        # Logging configuration
-        logging.basicConfig(
-            level=log_level,
-            format='%(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler(
-                    filename=(log_dir or Path.cwd()) / 'docubridge.log',
-                )
-            ]
-        )
+        LoggingConfig.shutdown()
+
+        handlers: list[logging.Handler] = [
+            logging.StreamHandler(),
+            logging.FileHandler(
+                filename=(log_dir or Path.cwd()) / 'docubridge.log',
+            )
+        ]
+        formatter = logging.Formatter('%(message)s')
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        root = logging.getLogger()
+        root.setLevel(log_level)
+        if queued:
+            import multiprocessing
+
+            # A multiprocessing queue so pool workers can log into it too
+            LoggingConfig._queue = multiprocessing.Queue()
+            LoggingConfig._listener = logging.handlers.QueueListener(
+                LoggingConfig._queue,
+                *handlers,
+                respect_handler_level=True
+            )
+            LoggingConfig._listener.start()
+            LoggingConfig._handlers = [logging.handlers.QueueHandler(LoggingConfig._queue)]
+            LoggingConfig._worker_settings = (log_level, page_log_level, page_log_sample_every)
+        else:
+            LoggingConfig._handlers = handlers
+
+        for handler in LoggingConfig._handlers:
+            root.addHandler(handler)
+        LoggingConfig._configure_page_logger(page_log_level, page_log_sample_every)
+        LoggingConfig._configure_structlog()
+
+        return structlog.get_logger()
+
+    @staticmethod
+    def shutdown() -> None:
+        """
+        Flush queued records and detach the handlers installed by
+        `configure_logging`
+        """
+        root = logging.getLogger()
+        for handler in LoggingConfig._handlers:
+            root.removeHandler(handler)
+            handler.close()
+        LoggingConfig._handlers = []
+
+        if LoggingConfig._listener is not None:
+            # stop() drains the queue before returning
+            LoggingConfig._listener.stop()
+            for handler in LoggingConfig._listener.handlers:
+                handler.close()
+            LoggingConfig._listener = None
+        if LoggingConfig._queue is not None:
+            LoggingConfig._queue.close()
+            LoggingConfig._queue = None
+        LoggingConfig._worker_settings = None
+
+    @staticmethod
+    def worker_pool_options() -> dict[str, Any]:
+        """
+        Keyword arguments routing a process pool's logging to the listener
+
+        Returns:
+            `initializer`/`initargs` for ProcessPoolExecutor, or an empty
+            dict when queued logging is not active
+        """
+        if LoggingConfig._queue is None or LoggingConfig._worker_settings is None:
+            return {}
+        return {
+            "initializer": LoggingConfig.configure_worker,
+            "initargs": (LoggingConfig._queue, *LoggingConfig._worker_settings)
+        }
+
+    @staticmethod
+    def configure_worker(
+        log_queue: Any,
+        log_level: int,
+        page_log_level: int,
+        page_log_sample_every: int
+    ) -> None:
+        """
+        Send a worker process's records to the parent's log queue
+
+        Args:
+            log_queue: Queue drained by the parent's listener
+            log_level: logging verbosity level
+            page_log_level: threshold for per-page debug events
+            page_log_sample_every: keep one per-page event out of this many
+        """
+        root = logging.getLogger()
+        # Drop handlers inherited through fork; the parent owns the outputs
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        root.addHandler(queue_handler)
+        root.setLevel(log_level)
+
+        # A forked worker must not stop the parent's listener on exit
+        LoggingConfig._listener = None
+        LoggingConfig._queue = None
+        LoggingConfig._handlers = [queue_handler]
+        LoggingConfig._worker_settings = None
+
+        LoggingConfig._configure_page_logger(page_log_level, page_log_sample_every)
+        LoggingConfig._configure_structlog()
+
+    @staticmethod
+    def _configure_page_logger(level: int, sample_every: int) -> None:
+        page_logger = logging.getLogger(PAGE_LOGGER_NAME)
+        page_logger.setLevel(level)
+        for existing in list(page_logger.filters):
+            page_logger.removeFilter(existing)
+        if sample_every > 1:
+            page_logger.addFilter(SamplingFilter(sample_every))
+
+    @staticmethod
+    def _configure_structlog() -> None:
+        import structlog
 
         # Structured logging configuration
         structlog.configure(
@@ -52,4 +206,6 @@ class LoggingConfig:
             cache_logger_on_first_use=True,
         )
 
-        return structlog.get_logger()
\ No newline at end of file
+
+# Flush whatever is still queued when the interpreter exits
+atexit.register(LoggingConfig.shutdown)
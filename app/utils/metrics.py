@@ -0,0 +1,175 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Iterator
+import json
+import sys
+import threading
+import time
+
+# Numeric span fields that are also accumulated as per-stage counters
+COUNTED_FIELDS = ("pages", "rows", "records", "bytes", "chars")
+
+
+class Metrics:
+    """
+    Per-process registry of stage timings and counters.
+
+    Stages are timed with `span`, which also emits a structured log event
+    through structlog once logging has been configured. structlog is not
+    imported here; it can only be configured after something else loaded it.
+    Whole-document stages are logged at INFO, so they appear with the
+    default logging setup. Spans carrying a `page` field are logged at
+    DEBUG on a separate logger so their level and sampling can be tuned
+    apart from whole-document stages.
+    """
+    LOGGER_NAME = "docubridge.metrics"
+    PAGE_LOGGER_NAME = "docubridge.metrics.page"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loggers: dict[str, Any] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Discard all collected timings and counters
+        """
+        with self._lock:
+            self._stages: dict[str, dict[str, float]] = {}
+            self._units: dict[str, dict[str, float]] = defaultdict(dict)
+
+    @contextmanager
+    def span(self, stage: str, **fields: Any) -> Iterator[dict[str, Any]]:
+        """
+        Time a conversion stage
+
+        The yielded dict holds the span fields; callers may add counts
+        (pages, rows, records, bytes, chars) that are only known once the
+        stage has run.
+
+        Args:
+            stage: Stage name, e.g. "json_to_pdf.doc_build"
+            fields: Initial span fields
+
+        Yields:
+            Mutable span fields
+        """
+        start = time.perf_counter()
+        try:
+            yield fields
+        finally:
+            duration = time.perf_counter() - start
+            self.observe(stage, duration, **fields)
+            structlog = sys.modules.get("structlog")
+            if structlog is not None and structlog.is_configured():
+                per_page = "page" in fields
+                name = self.PAGE_LOGGER_NAME if per_page else self.LOGGER_NAME
+                if name not in self._loggers:
+                    self._loggers[name] = structlog.get_logger(name)
+                logger = self._loggers[name]
+                (logger.debug if per_page else logger.info)(
+                    "stage_completed",
+                    stage=stage,
+                    duration_ms=round(duration * 1000, 3),
+                    **fields
+                )
+
+    def observe(self, stage: str, duration: float, **fields: Any) -> None:
+        """
+        Record a stage duration and its counted fields
+
+        Args:
+            stage: Stage name
+            duration: Stage duration in seconds
+            fields: Span fields; those in COUNTED_FIELDS are accumulated
+        """
+        with self._lock:
+            timing = self._stages.setdefault(
+                stage,
+                {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            timing["count"] += 1
+            timing["total_seconds"] += duration
+            timing["max_seconds"] = max(timing["max_seconds"], duration)
+
+            for unit in COUNTED_FIELDS:
+                value = fields.get(unit)
+                if isinstance(value, (int, float)):
+                    units = self._units[stage]
+                    units[unit] = units.get(unit, 0) + value
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Copy of the collected metrics
+
+        Returns:
+            Per-stage count, total and max duration, and unit counters
+        """
+        with self._lock:
+            return {
+                "stages": {
+                    stage: {**timing, "units": dict(self._units.get(stage, {}))}
+                    for stage, timing in self._stages.items()
+                }
+            }
+
+    def merge(self, snapshot: dict[str, Any]) -> None:
+        """
+        Add metrics collected elsewhere, such as in a worker process
+
+        Args:
+            snapshot: Result of another registry's `snapshot`
+        """
+        with self._lock:
+            for stage, other in snapshot["stages"].items():
+                timing = self._stages.setdefault(
+                    stage,
+                    {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+                )
+                timing["count"] += other["count"]
+                timing["total_seconds"] += other["total_seconds"]
+                timing["max_seconds"] = max(timing["max_seconds"], other["max_seconds"])
+
+                units = self._units[stage]
+                for unit, value in other["units"].items():
+                    units[unit] = units.get(unit, 0) + value
+
+    def to_json(self) -> str:
+        """
+        Serialize the snapshot as JSON
+        """
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def to_prometheus(self) -> str:
+        """
+        Serialize the snapshot in the Prometheus text exposition format
+        """
+        stages = self.snapshot()["stages"]
+        lines = [
+            "# HELP docubridge_stage_duration_seconds Time spent per conversion stage.",
+            "# TYPE docubridge_stage_duration_seconds summary",
+        ]
+        for stage, timing in sorted(stages.items()):
+            lines.append(f'docubridge_stage_duration_seconds_count{{stage="{stage}"}} {timing["count"]}')
+            lines.append(f'docubridge_stage_duration_seconds_sum{{stage="{stage}"}} {timing["total_seconds"]}')
+
+        lines += [
+            "# HELP docubridge_stage_duration_seconds_max Longest single run per stage.",
+            "# TYPE docubridge_stage_duration_seconds_max gauge",
+        ]
+        for stage, timing in sorted(stages.items()):
+            lines.append(f'docubridge_stage_duration_seconds_max{{stage="{stage}"}} {timing["max_seconds"]}')
+
+        lines += [
+            "# HELP docubridge_stage_units_total Units (pages, rows, records, bytes, chars) processed per stage.",
+            "# TYPE docubridge_stage_units_total counter",
+        ]
+        for stage, timing in sorted(stages.items()):
+            for unit, value in sorted(timing["units"].items()):
+                lines.append(f'docubridge_stage_units_total{{stage="{stage}",unit="{unit}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+
+# Default registry used by the converters
+METRICS = Metrics()
@@ -1,58 +1,610 @@
-import pdfplumber
-from typing import Any
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+import gc
 import logging
+import mmap
+import os
+import threading
+
+from app.utils.file_utils import FileUtils, InputSource
+from app.utils.metrics import METRICS
+
+# A PDF as the parsers take it: a file path or a seekable binary stream
+PdfInput = str | BinaryIO
+
+# Per-page artifacts an extraction can produce, in output order, with the
+# page record key each one is stored under
+ARTIFACT_KEYS: dict[str, str] = {
+    "text": "context",
+    "tables": "tables",
+    "words": "words",
+    "images": "images",
+}
+DEFAULT_ARTIFACTS = ("text",)
+
+# pdfium is not thread-safe; every document and page call goes through this
+# lock. It is never held across a yield, so concurrent conversions interleave
+# page by page.
+_PDFIUM_LOCK = threading.RLock()
+
+
+def _reset_pdfium_lock() -> None:
+    global _PDFIUM_LOCK
+    _PDFIUM_LOCK = threading.RLock()
+
+
+# Process pools fork on Linux. Holding the lock across fork() means no other
+# thread is inside pdfium when the child's copy of its state is taken, and
+# the child starts with a fresh lock instead of one owned by a thread that
+# does not exist there.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=lambda: _PDFIUM_LOCK.acquire(),
+        after_in_parent=lambda: _PDFIUM_LOCK.release(),
+        after_in_child=_reset_pdfium_lock
+    )
+
+
+def resolve_artifacts(artifacts: Optional[Iterable[str]]) -> tuple[str, ...]:
+    """
+    Validate requested artifacts and put them in canonical order
+
+    Args:
+        artifacts: Artifact names, DEFAULT_ARTIFACTS when omitted
+
+    Returns:
+        Requested artifacts in ARTIFACT_KEYS order
+    """
+    requested = set(artifacts or DEFAULT_ARTIFACTS)
+    unknown = requested - ARTIFACT_KEYS.keys()
+    if unknown:
+        raise ValueError(f"Unknown extraction artifacts: {', '.join(sorted(unknown))}")
+    return tuple(artifact for artifact in ARTIFACT_KEYS if artifact in requested)
+
+
+def _bbox(item: dict[str, Any]) -> dict[str, float]:
+    return {key: round(item[key], 2) for key in ("x0", "top", "x1", "bottom")}
+
+
+def current_rss_mb() -> Optional[float]:
+    """
+    Resident set size of the current process in megabytes
+
+    Returns:
+        Current RSS, or None where /proc is not available
+    """
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * mmap.PAGESIZE / (1024 * 1024)
+
+
+def _over_rss_ceiling(max_rss_mb: Optional[float]) -> bool:
+    if max_rss_mb is None:
+        return False
+    rss = current_rss_mb()
+    return rss is not None and rss > max_rss_mb
+
+
+def _flush_document_caches(pdf: Any) -> None:
+    """
+    Drop pdfminer's resolved-object caches; objects are re-read on demand
+    """
+    for cache_name in ("_cached_objs", "_parsed_objs"):
+        cache = getattr(pdf.doc, cache_name, None)
+        if cache:
+            cache.clear()
+    gc.collect()
+
+
+class ExtractionBackend(ABC):
+    """
+    Interface for page extraction engines.
+    """
+    name: str = ""
+    # Artifacts this engine can produce
+    artifacts: frozenset[str] = frozenset(DEFAULT_ARTIFACTS)
+
+    @abstractmethod
+    def iter_pages(
+        self,
+        pdf_path: PdfInput,
+        first_page: int,
+        last_page: int,
+        artifacts: tuple[str, ...] = DEFAULT_ARTIFACTS,
+        max_rss_mb: Optional[float] = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Extract a contiguous page range
+
+        Each page's parsed state is released once its record is built, so
+        memory use does not grow with the number of pages.
+
+        Args:
+            pdf_path: Path to the PDF file or a seekable binary stream
+            first_page: First page number (1-based, inclusive)
+            last_page: Last page number (1-based, inclusive)
+            artifacts: Artifacts to produce, a subset of `self.artifacts`
+            max_rss_mb: Optional RSS ceiling; above it, document-level
+                caches are flushed after every page
+
+        Yields:
+            Page records with page number and one key per artifact
+        """
+
+
+class PdfplumberBackend(ExtractionBackend):
+    """
+    Layout-aware extraction through pdfplumber/pdfminer.
+
+    pdfplumber caches a page's parsed layout objects on the page, so every
+    artifact after the first reuses the same parse instead of re-running
+    layout analysis.
+    """
+    name = "pdfplumber"
+    artifacts = frozenset(ARTIFACT_KEYS)
+
+    def iter_pages(
+        self,
+        pdf_path: PdfInput,
+        first_page: int,
+        last_page: int,
+        artifacts: tuple[str, ...] = DEFAULT_ARTIFACTS,
+        max_rss_mb: Optional[float] = None
+    ) -> Iterator[dict[str, Any]]:
+        import pdfplumber
+
+        with pdfplumber.open(pdf_path, pages=range(first_page, last_page + 1)) as pdf:
+            for page in pdf.pages:
+                record = {"page_number": page.page_number}
+                for artifact in artifacts:
+                    with METRICS.span(f"pdf.extract_{artifact}", engine=self.name, page=page.page_number, pages=1) as span:
+                        if artifact == "text":
+                            page_text = page.extract_text()
+                            span["chars"] = len(page_text) if page_text else 0
+                            value = page_text.strip() if page_text else ""
+                        elif artifact == "tables":
+                            value = page.extract_tables()
+                        elif artifact == "words":
+                            value = [
+                                {"text": word["text"], **_bbox(word)}
+                                for word in page.extract_words()
+                            ]
+                        else:
+                            value = [
+                                {
+                                    "name": image.get("name"),
+                                    "source_size": list(image.get("srcsize") or ()),
+                                    **_bbox(image)
+                                }
+                                for image in page.images
+                            ]
+                    record[ARTIFACT_KEYS[artifact]] = value
+                # The record holds plain data only, so the page's cached
+                # layout can go before the record is handed on
+                page.close()
+                if _over_rss_ceiling(max_rss_mb):
+                    logging.debug(f"RSS above {max_rss_mb} MB, flushing caches of {pdf_path}")
+                    _flush_document_caches(pdf)
+                yield record
+
+
+class PdfiumBackend(ExtractionBackend):
+    """
+    Fast plain-text extraction through pypdfium2.
+    """
+    name = "pdfium"
+
+    def iter_pages(
+        self,
+        pdf_path: PdfInput,
+        first_page: int,
+        last_page: int,
+        artifacts: tuple[str, ...] = DEFAULT_ARTIFACTS,
+        max_rss_mb: Optional[float] = None
+    ) -> Iterator[dict[str, Any]]:
+        import pypdfium2
+
+        with _PDFIUM_LOCK:
+            pdf = pypdfium2.PdfDocument(pdf_path)
+        try:
+            for page_number in range(first_page, last_page + 1):
+                with METRICS.span("pdf.extract_text", engine=self.name, page=page_number, pages=1) as span:
+                    with _PDFIUM_LOCK:
+                        page = pdf[page_number - 1]
+                        try:
+                            text_page = page.get_textpage()
+                            try:
+                                page_text = text_page.get_text_range()
+                            finally:
+                                text_page.close()
+                        finally:
+                            page.close()
+                    span["chars"] = len(page_text)
+                yield {
+                    "page_number": page_number,
+                    "context": page_text.replace("\r\n", "\n").strip()
+                }
+        finally:
+            with _PDFIUM_LOCK:
+                pdf.close()
+
+
+EXTRACTION_BACKENDS: dict[str, ExtractionBackend] = {
+    backend.name: backend
+    for backend in (PdfplumberBackend(), PdfiumBackend())
+}
+
+DEFAULT_ENGINE = PdfplumberBackend.name
+
+
+def _iter_engine_pages(
+    engine: str,
+    pdf_path: PdfInput,
+    first_page: int,
+    last_page: int,
+    artifacts: tuple[str, ...] = DEFAULT_ARTIFACTS,
+    max_rss_mb: Optional[float] = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Extract a page range with the requested engine
+
+    If a non-default engine fails, the remaining pages of the range are
+    extracted with the default pdfplumber engine instead. The default
+    engine is also used when the requested one cannot produce every
+    requested artifact.
+
+    Args:
+        engine: Extraction engine name
+        pdf_path: Path to the PDF file or a seekable binary stream
+        first_page: First page number (1-based, inclusive)
+        last_page: Last page number (1-based, inclusive)
+        artifacts: Artifacts to produce for each page
+        max_rss_mb: Optional RSS ceiling passed to the backend
+
+    Yields:
+        Page records with page number and one key per artifact
+    """
+    if engine not in EXTRACTION_BACKENDS:
+        raise ValueError(f"Unknown extraction engine: {engine}")
+
+    next_page = first_page
+    if engine != DEFAULT_ENGINE and EXTRACTION_BACKENDS[engine].artifacts.issuperset(artifacts):
+        try:
+            backend = EXTRACTION_BACKENDS[engine]
+            for page in backend.iter_pages(pdf_path, first_page, last_page, artifacts, max_rss_mb):
+                yield page
+                next_page = page["page_number"] + 1
+            return
+        except Exception as e:
+            logging.warning(
+                f"{engine} extraction failed at page {next_page}, "
+                f"falling back to {DEFAULT_ENGINE}: {e}"
+            )
+
+    yield from EXTRACTION_BACKENDS[DEFAULT_ENGINE].iter_pages(
+        pdf_path,
+        next_page,
+        last_page,
+        artifacts,
+        max_rss_mb
+    )
+
+
+def _extract_page_shard(
+    pdf_path: str,
+    first_page: int,
+    last_page: int,
+    engine: str = DEFAULT_ENGINE,
+    artifacts: tuple[str, ...] = DEFAULT_ARTIFACTS,
+    max_rss_mb: Optional[float] = None
+) -> list[dict[str, Any]]:
+    """
+    Extract a contiguous page range in a worker process
+
+    Each worker opens its own document handle, since open documents
+    cannot be shared across processes.
+
+    Args:
+        pdf_path: Path to the PDF file
+        first_page: First page number of the shard (1-based, inclusive)
+        last_page: Last page number of the shard (1-based, inclusive)
+        engine: Extraction engine name
+        artifacts: Artifacts to produce for each page
+        max_rss_mb: Optional RSS ceiling of the worker process
+
+    Returns:
+        Page records for the shard, in page order
+    """
+    return list(_iter_engine_pages(engine, pdf_path, first_page, last_page, artifacts, max_rss_mb))
+
 
 class PdfUtils:
     """
     Advanced PDF parsing utilities.
     """
     @staticmethod
-    def extract_text_from_pdf(pdf_path: str) -> dict[str, Any]:
+    def extract_text_from_pdf(
+        pdf_path: str,
+        workers: int = 1,
+        pages_per_shard: int = 50,
+        engine: str = DEFAULT_ENGINE,
+        page_range: Optional[tuple[int, int]] = None,
+        max_pages: Optional[int] = None,
+        max_rss_mb: Optional[float] = None
+    ) -> dict[str, Any]:
         """
         Intelligent PDF text extraction with structured output
 
+        With more than one worker, the page range is split into shards of
+        `pages_per_shard` pages which are extracted on a process pool and
+        merged back in page order.
+
         Args:
             pdf_path: Path to the PDF file
+            workers: Number of worker processes used for extraction
+            pages_per_shard: Number of pages handed to a worker at a time
+            engine: Extraction engine name (see `EXTRACTION_BACKENDS`)
+            page_range: Optional (first, last) pages to extract, 1-based and inclusive
+            max_pages: Optional cap on the number of pages extracted
+            max_rss_mb: Optional RSS ceiling (see `iter_pages`)
 
         Returns:
             Dictionary with extracted text and metadata
         """
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                extracted_data = {
-                    "metadata": {
-                        "total_pages": len(pdf.pages),
-                        "file_path": pdf_path
-                    },
-                    "pages": []
-                }
-
-                for page_num, page in enumerate(pdf.pages, 1):
-                    page_text = page.extract_text()
-                    extracted_data["pages"].append({
-                        "page_number": page_num,
-                        "context": page_text.strip() if page_text else ""
-                    })
-                
-                return extracted_data
+            total_pages = PdfUtils.get_pdf_page_count(pdf_path, raise_errors=True)
+            return {
+                "metadata": {
+                    "total_pages": total_pages,
+                    "file_path": pdf_path
+                },
+                "pages": list(PdfUtils.iter_pages(
+                    pdf_path,
+                    workers=workers,
+                    pages_per_shard=pages_per_shard,
+                    engine=engine,
+                    page_range=page_range,
+                    max_pages=max_pages,
+                    max_rss_mb=max_rss_mb
+                ))
+            }
         except Exception as e:
             logging.error(f"PDF text extraction error: {e}")
             return {}
-        
+
     @staticmethod
-    def get_pdf_page_count(pdf_path: str) -> int:
+    def iter_pages(
+        pdf_path: PdfInput,
+        workers: int = 1,
+        pages_per_shard: int = 50,
+        engine: str = DEFAULT_ENGINE,
+        page_range: Optional[tuple[int, int]] = None,
+        max_pages: Optional[int] = None,
+        artifacts: Optional[Iterable[str]] = None,
+        max_rss_mb: Optional[float] = None
+    ) -> Iterator[dict[str, Any]]:
         """
-        Retrieve total number of pages in a PDF
+        Lazily extract pages one at a time, in page order
+
+        Unlike `extract_text_from_pdf`, errors are raised to the caller,
+        so a partially consumed generator is never mistaken for a complete
+        document. Streams are always extracted in this process, since
+        worker processes can only reopen a document by path.
+
+        Args:
+            pdf_path: Path to the PDF file or a seekable binary stream
+            workers: Number of worker processes used for extraction
+            pages_per_shard: Number of pages handed to a worker at a time
+            engine: Extraction engine name (see `EXTRACTION_BACKENDS`)
+            page_range: Optional (first, last) pages to extract, 1-based and inclusive
+            max_pages: Optional cap on the number of pages extracted
+            artifacts: Artifacts to produce for each page, any of
+                ARTIFACT_KEYS; all of them come from a single parse per page
+            max_rss_mb: Optional RSS ceiling per process. Extraction
+                processes flush document caches above it, and the parallel
+                path stops queueing shards until the parent drops below it
+
+        Yields:
+            Page records with page number and one key per artifact
+        """
+        artifacts = resolve_artifacts(artifacts)
+        total_pages = PdfUtils.get_pdf_page_count(pdf_path, raise_errors=True)
+        first_page, last_page = PdfUtils.resolve_page_range(total_pages, page_range, max_pages)
+        if last_page < first_page:
+            return
+
+        if (
+            workers <= 1
+            or not FileUtils.is_path(pdf_path)
+            or last_page - first_page + 1 <= pages_per_shard
+        ):
+            yield from _iter_engine_pages(engine, pdf_path, first_page, last_page, artifacts, max_rss_mb)
+            return
+
+        for shard in PdfUtils._iter_shards_parallel(
+            pdf_path,
+            first_page,
+            last_page,
+            workers,
+            pages_per_shard,
+            engine,
+            artifacts,
+            max_rss_mb
+        ):
+            yield from shard
+
+    @staticmethod
+    @contextmanager
+    def open_source(source: InputSource) -> Iterator[PdfInput]:
+        """
+        Present any supported input the way the PDF parsers take it
+
+        Paths pass through unchanged, so worker processes can reopen them;
+        buffers and streams become a seekable binary stream (see
+        `FileUtils.open_input`).
+
+        Args:
+            source: PDF file path, buffer or binary file-like object
+
+        Yields:
+            File path or seekable binary stream
+        """
+        if FileUtils.is_path(source):
+            yield os.fspath(source)
+        else:
+            with FileUtils.open_input(source) as stream:
+                yield stream
+
+    @staticmethod
+    def resolve_page_range(
+        total_pages: int,
+        page_range: Optional[tuple[int, int]] = None,
+        max_pages: Optional[int] = None
+    ) -> tuple[int, int]:
+        """
+        Clamp a requested page selection to the document
+
+        Args:
+            total_pages: Number of pages in the PDF
+            page_range: Optional (first, last) pages, 1-based and inclusive;
+                a last page past the end of the document is clamped
+            max_pages: Optional cap on the number of selected pages
+
+        Returns:
+            (first, last) pages to extract; last is below first when
+            nothing is selected
+        """
+        first_page, last_page = page_range or (1, total_pages)
+        if first_page < 1 or last_page < first_page:
+            raise ValueError(f"Invalid page range: {first_page}-{last_page}")
+        if max_pages is not None:
+            if max_pages < 0:
+                raise ValueError(f"Invalid max_pages: {max_pages}")
+            last_page = min(last_page, first_page + max_pages - 1)
+        return first_page, min(last_page, total_pages)
+
+    @staticmethod
+    def _iter_shards_parallel(
+        pdf_path: str,
+        first_page: int,
+        last_page: int,
+        workers: int,
+        pages_per_shard: int,
+        engine: str,
+        artifacts: tuple[str, ...] = DEFAULT_ARTIFACTS,
+        max_rss_mb: Optional[float] = None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Extract pages on a process pool, one shard per task
+
+        At most two shards per worker are in flight, so finished shards
+        never pile up faster than the consumer takes them.
 
         Args:
             pdf_path: Path to the PDF file
+            first_page: First page to extract (1-based, inclusive)
+            last_page: Last page to extract (1-based, inclusive)
+            workers: Maximum number of worker processes
+            pages_per_shard: Number of pages per shard
+            engine: Extraction engine name
+            artifacts: Artifacts to produce for each page
+            max_rss_mb: Optional RSS ceiling; while the parent is above it,
+                in-flight shards are drained before new ones are queued
+
+        Yields:
+            Page records of each shard, in page order
+        """
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+        from app.utils.logging_config import LoggingConfig
+
+        shards = [
+            (first, min(first + pages_per_shard - 1, last_page))
+            for first in range(first_page, last_page + 1, pages_per_shard)
+        ]
+        pool = ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)),
+            **LoggingConfig.worker_pool_options()
+        )
+        pending = deque()
+        try:
+            for shard_first, shard_last in shards:
+                max_in_flight = 1 if _over_rss_ceiling(max_rss_mb) else workers * 2
+                while len(pending) >= max_in_flight:
+                    # Results are taken in submission order, so shards merge in page order
+                    yield pending.popleft().result()
+                pending.append(pool.submit(
+                    _extract_page_shard,
+                    pdf_path,
+                    shard_first,
+                    shard_last,
+                    engine,
+                    artifacts,
+                    max_rss_mb
+                ))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Drop queued shards if the consumer stops early
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def get_pdf_page_count(pdf_path: PdfInput, raise_errors: bool = False) -> int:
+        """
+        Retrieve total number of pages in a PDF
+
+        Reads the page tree through pdfium without parsing page content.
+
+        Args:
+            pdf_path: Path to the PDF file or a seekable binary stream
+            raise_errors: Raise instead of logging and returning 0
 
         Returns:
             Number of pages in the PDF
         """
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                return len(pdf.pages)
+            return PdfUtils.get_pdf_metadata(pdf_path, raise_errors=True)["total_pages"]
         except Exception as e:
+            if raise_errors:
+                raise
             logging.error(f"PDF page count error: {e}")
-            return 0
\ No newline at end of file
+            return 0
+
+    @staticmethod
+    def get_pdf_metadata(pdf_path: PdfInput, raise_errors: bool = False) -> dict[str, Any]:
+        """
+        Read page count and document info without touching page content
+
+        Only the cross-reference table, trailer and page tree are loaded,
+        so this stays cheap for triage regardless of document size.
+
+        Args:
+            pdf_path: Path to the PDF file or a seekable binary stream
+            raise_errors: Raise instead of logging and returning {}
+
+        Returns:
+            Dictionary with total pages, PDF version and the non-empty
+            document info entries (Title, Author, ...)
+        """
+        import pypdfium2
+
+        try:
+            with METRICS.span("pdf.metadata"), _PDFIUM_LOCK:
+                pdf = pypdfium2.PdfDocument(pdf_path)
+                try:
+                    return {
+                        "total_pages": len(pdf),
+                        "pdf_version": pdf.get_version(),
+                        "info": pdf.get_metadata_dict(skip_empty=True)
+                    }
+                finally:
+                    pdf.close()
+        except Exception as e:
+            if raise_errors:
+                raise
+            logging.error(f"PDF metadata error: {e}")
+            return {}
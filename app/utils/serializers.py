@@ -0,0 +1,99 @@
+from typing import Any
+import json
+import logging
+
+# Output layouts for PDF to JSON conversion
+OUTPUT_FORMATS = ("json", "compact", "ndjson")
+
+
+class JsonSerializer:
+    """
+    Standard library JSON encoder, always available.
+
+    Serializers return UTF-8 bytes so output files can be written in
+    binary mode without a decode/encode round trip.
+    """
+    name = "stdlib"
+
+    def dumps(self, data: Any, pretty: bool = False) -> bytes:
+        """
+        Encode a value as UTF-8 JSON
+
+        Args:
+            data: JSON-compatible value
+            pretty: Indent nested values by two spaces
+
+        Returns:
+            Encoded JSON
+        """
+        if pretty:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: str | bytes | bytearray | memoryview) -> Any:
+        """
+        Decode JSON text or UTF-8 encoded JSON
+
+        Args:
+            data: JSON document
+
+        Returns:
+            Decoded value
+        """
+        if isinstance(data, memoryview):
+            # The json module cannot read a buffer directly
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonSerializer(JsonSerializer):
+    """
+    orjson encoder, several times faster than the standard library.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, data: Any, pretty: bool = False) -> bytes:
+        option = self._orjson.OPT_INDENT_2 if pretty else 0
+        return self._orjson.dumps(data, option=option)
+
+    def loads(self, data: str | bytes | bytearray | memoryview) -> Any:
+        # orjson parses buffers in place
+        return self._orjson.loads(data)
+
+
+SERIALIZERS: dict[str, type[JsonSerializer]] = {
+    JsonSerializer.name: JsonSerializer,
+    OrjsonSerializer.name: OrjsonSerializer,
+}
+
+
+def get_serializer(name: str = "auto") -> JsonSerializer:
+    """
+    Look up a serializer backend
+
+    Args:
+        name: "auto" for the fastest installed backend, or a key of
+            SERIALIZERS; an uninstalled backend falls back to the stdlib
+
+    Returns:
+        Serializer instance
+    """
+    if name == "auto":
+        name = OrjsonSerializer.name
+        fallback_quietly = True
+    elif name in SERIALIZERS:
+        fallback_quietly = False
+    else:
+        raise ValueError(f"Unknown JSON serializer: {name}")
+
+    try:
+        return SERIALIZERS[name]()
+    except ImportError:
+        if not fallback_quietly:
+            logging.warning(f"{name} is not installed, falling back to the standard json module")
+        return JsonSerializer()
@@ -0,0 +1,51 @@
+"""
+Compare page throughput of the PDF text extraction engines.
+
+Usage:
+    python -m benchmarks.bench_extraction_engines [--pdf FILE] [--pages N]
+
+Without --pdf, a synthetic text-only PDF with N pages is generated.
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from app.utils.pdf_utils import EXTRACTION_BACKENDS, PdfUtils
+from benchmarks.corpus import build_sample_pdf
+
+
+def benchmark_engine(pdf_path: Path, engine: str, repeat: int) -> float:
+    """
+    Return the best pages-per-second figure over `repeat` runs
+    """
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        page_count = sum(1 for _ in PdfUtils.iter_pages(str(pdf_path), engine=engine))
+        elapsed = time.perf_counter() - start
+        best = max(best, page_count / elapsed)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pdf", type=Path, help="PDF to benchmark against")
+    parser.add_argument("--pages", type=int, default=200, help="pages in the synthetic PDF")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per engine")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = args.pdf or build_sample_pdf(Path(tmp_dir) / "sample.pdf", args.pages)
+        results = {
+            engine: benchmark_engine(pdf_path, engine, args.repeat)
+            for engine in EXTRACTION_BACKENDS
+        }
+
+    baseline = results["pdfplumber"]
+    for engine, pages_per_second in results.items():
+        print(f"{engine:>12}: {pages_per_second:10.1f} pages/s  ({pages_per_second / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
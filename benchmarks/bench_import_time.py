@@ -0,0 +1,80 @@
+"""
+Measure cold import time of the application entry points.
+
+Usage:
+    python -m benchmarks.bench_import_time [--repeat N] [--module NAME ...]
+
+Each module is imported in a fresh interpreter, so nothing is served from
+an already-populated sys.modules. Heavy third-party packages pulled in by
+the import are listed next to the timing.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Entry points that should stay cheap to import
+MODULES = (
+    "main",
+    "app.cli",
+    "app.core.json_to_pdf",
+    "app.core.pdf_to_json",
+    "app.core.async_api",
+    "app.utils.json_utils",
+)
+
+# Packages that should only load once a conversion actually needs them
+HEAVY_PACKAGES = (
+    "reportlab",
+    "pdfplumber",
+    "pdfminer",
+    "pypdfium2",
+    "jsonschema",
+    "structlog",
+    "tkinter",
+    "tkinterdnd2",
+)
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = sorted({{name.split(".")[0] for name in sys.modules}} & set({heavy!r}))
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+
+def measure_import(module: str) -> dict:
+    """
+    Import `module` in a fresh interpreter
+
+    Returns:
+        Import time in seconds and the heavy packages it loaded
+    """
+    probe = _PROBE.format(module=module, heavy=HEAVY_PACKAGES)
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--module", action="append", help="module to measure (repeatable)")
+    args = parser.parse_args()
+
+    for module in args.module or MODULES:
+        runs = [measure_import(module) for _ in range(args.repeat)]
+        median_ms = statistics.median(run["seconds"] for run in runs) * 1000
+        loaded = ", ".join(runs[-1]["loaded"]) or "-"
+        print(f"{module:>24}: {median_ms:8.1f} ms  heavy: {loaded}")
+
+
+if __name__ == "__main__":
+    main()
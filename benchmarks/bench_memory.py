@@ -0,0 +1,136 @@
+"""
+Measure peak RSS of both conversion directions as the input grows.
+
+Usage:
+    python -m benchmarks.bench_memory [--pages N ...] [--max-rss-mb MB]
+        [--jsonl-rows N ...] [--max-jsonl-mb-per-10k-rows MB]
+
+Each conversion runs in a fresh interpreter, so the reported peak belongs
+to that input size alone. With bounded-memory extraction the PDF to JSON
+peak should stay roughly flat from the smallest to the largest document.
+
+JSONL to PDF streams its input, but reportlab keeps every finished page
+until the document is saved, so its peak grows with the number of pages.
+That growth is reported per 10k records, and the command exits non-zero
+when it exceeds --max-jsonl-mb-per-10k-rows.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.corpus import build_jsonl, build_sample_pdf
+
+DEFAULT_PAGE_COUNTS = (100, 400, 1_600)
+DEFAULT_JSONL_ROWS = (10_000, 40_000)
+# Measured around 17 MB per 10k corpus records (reportlab's retained page
+# streams); the limit leaves headroom for allocator noise while catching
+# anything else kept per record.
+DEFAULT_MAX_JSONL_MB_PER_10K_ROWS = 25.0
+
+_PEAK = """
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"ok": ok, "peak_rss_mb": peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024}}))
+"""
+
+_PROBE = """
+import json, resource, sys
+from app.core.pdf_to_json import PdfToJsonConverter
+ok = PdfToJsonConverter.convert({pdf!r}, {output!r}, stream=True, max_rss_mb={max_rss_mb!r})
+""" + _PEAK
+
+_JSONL_PROBE = """
+import json, resource, sys
+from app.core.json_to_pdf import JsonToPdfConverter
+ok = JsonToPdfConverter.convert_jsonl({jsonl!r}, {output!r})
+""" + _PEAK
+
+
+def _run_probe(probe: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure_conversion(pdf_path: Path, output_path: Path, max_rss_mb=None) -> dict:
+    """
+    Convert `pdf_path` in a fresh interpreter
+
+    Returns:
+        Success flag and peak RSS in megabytes
+    """
+    return _run_probe(_PROBE.format(pdf=str(pdf_path), output=str(output_path), max_rss_mb=max_rss_mb))
+
+
+def measure_jsonl_conversion(jsonl_path: Path, output_path: Path) -> dict:
+    """
+    Render `jsonl_path` to PDF in a fresh interpreter
+
+    Returns:
+        Success flag and peak RSS in megabytes
+    """
+    return _run_probe(_JSONL_PROBE.format(jsonl=str(jsonl_path), output=str(output_path)))
+
+
+def growth_per_10k_rows(results: dict[int, float]) -> float:
+    """
+    Peak RSS growth between the smallest and largest run
+
+    Args:
+        results: Peak RSS in megabytes keyed by record count
+
+    Returns:
+        Megabytes per 10k records
+    """
+    smallest, largest = min(results), max(results)
+    return (results[largest] - results[smallest]) / (largest - smallest) * 10_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, action="append", help="page count to measure (repeatable)")
+    parser.add_argument("--max-rss-mb", type=float, help="RSS ceiling passed to the converter")
+    parser.add_argument("--jsonl-rows", type=int, action="append", help="JSONL record count to measure (repeatable)")
+    parser.add_argument(
+        "--max-jsonl-mb-per-10k-rows",
+        type=float,
+        default=DEFAULT_MAX_JSONL_MB_PER_10K_ROWS,
+        help="fail when JSONL rendering grows faster than this"
+    )
+    args = parser.parse_args()
+
+    results = {}
+    jsonl_results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for page_count in args.pages or DEFAULT_PAGE_COUNTS:
+            pdf_path = build_sample_pdf(Path(tmp_dir) / f"sample_{page_count}.pdf", page_count)
+            result = measure_conversion(pdf_path, Path(tmp_dir) / "output.json", args.max_rss_mb)
+            results[page_count] = result["peak_rss_mb"]
+            status = "" if result["ok"] else "  (conversion failed)"
+            print(f"{page_count:>8} pages: {result['peak_rss_mb']:8.1f} MB peak RSS{status}")
+
+        for row_count in args.jsonl_rows or DEFAULT_JSONL_ROWS:
+            jsonl_path = build_jsonl(Path(tmp_dir) / f"sample_{row_count}.jsonl", row_count)
+            result = measure_jsonl_conversion(jsonl_path, Path(tmp_dir) / "output.pdf")
+            jsonl_results[row_count] = result["peak_rss_mb"]
+            status = "" if result["ok"] else "  (conversion failed)"
+            print(f"{row_count:>8} rows:  {result['peak_rss_mb']:8.1f} MB peak RSS{status}")
+
+    smallest, largest = min(results), max(results)
+    print(f"growth {smallest} -> {largest} pages: {results[largest] / results[smallest]:.2f}x")
+
+    if len(jsonl_results) > 1:
+        growth = growth_per_10k_rows(jsonl_results)
+        print(f"jsonl growth: {growth:.1f} MB per 10k rows (limit {args.max_jsonl_mb_per_10k_rows:.1f})")
+        if growth > args.max_jsonl_mb_per_10k_rows:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Measure per-document overhead of JSON to PDF conversion for small documents.
+
+Usage:
+    python -m benchmarks.bench_render_template [--documents N] [--long-table]
+
+Each document is rendered twice: once building a fresh RenderTemplate per
+conversion, as every call did before templates existed, and once passing
+one shared template to every conversion.
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from app.core.json_to_pdf import JsonToPdfConverter, RenderTemplate
+
+SAMPLE_DOCUMENT = {
+    "id": 1,
+    "name": "DocuBridge",
+    "tags": ["json", "pdf"],
+    "owner": {"team": "ingestion", "active": True},
+}
+
+
+def measure_documents(
+    documents: int,
+    output_path: Path,
+    long_table: bool = False,
+    template: Optional[RenderTemplate] = None
+) -> list[float]:
+    """
+    Convert SAMPLE_DOCUMENT `documents` times
+
+    Args:
+        documents: Number of conversions
+        output_path: Destination PDF, overwritten by every conversion
+        long_table: Render in long-table mode
+        template: Shared template, or None to build one per conversion
+
+    Returns:
+        Seconds per conversion
+    """
+    timings = []
+    for _ in range(documents):
+        start = time.perf_counter()
+        JsonToPdfConverter.convert(
+            SAMPLE_DOCUMENT,
+            str(output_path),
+            long_table=long_table,
+            template=template or RenderTemplate()
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--documents", type=int, default=500, help="conversions per variant")
+    parser.add_argument("--long-table", action="store_true", help="render in long-table mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = Path(tmp_dir) / "output.pdf"
+        # Warm up imports and font caches before timing anything
+        measure_documents(5, output_path, args.long_table)
+
+        results = {
+            "fresh template": measure_documents(args.documents, output_path, args.long_table),
+            "shared template": measure_documents(
+                args.documents,
+                output_path,
+                args.long_table,
+                template=RenderTemplate()
+            ),
+        }
+
+    for label, timings in results.items():
+        print(f"{label:>16}: {statistics.median(timings) * 1000:7.2f} ms/document")
+    fresh, shared = (statistics.median(timings) for timings in results.values())
+    print(f"{'saved':>16}: {(fresh - shared) / fresh:7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Synthetic input generators for the benchmark suite.
+
+Every generator is deterministic, so results from different runs and
+machines are measured against identical inputs.
+"""
+import json
+from pathlib import Path
+from typing import Any
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+# Input sizes per scale; the "large" scale matches production documents.
+# Nesting stays below the json module's recursion limit so inputs round-trip.
+SCALES: dict[str, dict[str, int]] = {
+    "small": {"pdf_pages": 10, "wide_keys": 1_000, "deep_levels": 100, "jsonl_rows": 10_000},
+    "medium": {"pdf_pages": 1_000, "wide_keys": 20_000, "deep_levels": 500, "jsonl_rows": 100_000},
+    "large": {"pdf_pages": 10_000, "wide_keys": 100_000, "deep_levels": 900, "jsonl_rows": 1_000_000},
+}
+
+
+def build_sample_pdf(pdf_path: Path, page_count: int, lines_per_page: int = 45) -> Path:
+    """
+    Write a text-only PDF with `lines_per_page` lines on every page
+    """
+    pdf = canvas.Canvas(str(pdf_path), pagesize=letter, pageCompression=1)
+    for page_number in range(1, page_count + 1):
+        text = pdf.beginText(72, 740)
+        for line in range(lines_per_page):
+            text.textLine(f"Page {page_number} line {line}: lorem ipsum dolor sit amet")
+        pdf.drawText(text)
+        pdf.showPage()
+    pdf.save()
+    return pdf_path
+
+
+def build_wide_json(key_count: int) -> dict[str, Any]:
+    """
+    A flat-ish object with `key_count` records under "data"
+    """
+    return {
+        "metadata": {"source": "benchmark", "records": key_count},
+        "data": [
+            {"id": index, "name": f"record {index}", "score": index * 0.5, "active": index % 2 == 0}
+            for index in range(key_count // 4)
+        ],
+    }
+
+
+def build_deep_json(depth: int) -> dict[str, Any]:
+    """
+    An object nested `depth` levels deep with a leaf on every level
+    """
+    root = node = {}
+    for level in range(depth):
+        node["level"] = level
+        node["child"] = {}
+        node = node["child"]
+    node["leaf"] = "bottom"
+    return root
+
+
+def build_jsonl(jsonl_path: Path, row_count: int) -> Path:
+    """
+    Write `row_count` small records, one JSON object per line
+    """
+    with open(jsonl_path, "w", encoding="utf-8") as jsonl_file:
+        for index in range(row_count):
+            jsonl_file.write(json.dumps({
+                "id": index,
+                "user": {"name": f"user {index}", "token": "s3cr3t"},
+                "tags": ["alpha", "beta"],
+            }) + "\n")
+    return jsonl_path
+
+
+def build_corpus(corpus_dir: Path, scale: str) -> dict[str, Path]:
+    """
+    Generate (or reuse) every input for a scale
+
+    Args:
+        corpus_dir: Directory holding generated inputs
+        scale: Key of `SCALES`
+
+    Returns:
+        Input name to file path
+    """
+    sizes = SCALES[scale]
+    corpus_dir = corpus_dir / scale
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+
+    paths = {
+        "pdf": corpus_dir / "document.pdf",
+        "wide_json": corpus_dir / "wide.json",
+        "deep_json": corpus_dir / "deep.json",
+        "jsonl": corpus_dir / "records.jsonl",
+    }
+    if not paths["pdf"].exists():
+        build_sample_pdf(paths["pdf"], sizes["pdf_pages"])
+    if not paths["wide_json"].exists():
+        paths["wide_json"].write_text(json.dumps(build_wide_json(sizes["wide_keys"])))
+    if not paths["deep_json"].exists():
+        paths["deep_json"].write_text(json.dumps(build_deep_json(sizes["deep_levels"])))
+    if not paths["jsonl"].exists():
+        build_jsonl(paths["jsonl"], sizes["jsonl_rows"])
+    return paths
@@ -0,0 +1,282 @@
+"""
+Benchmark suite for both conversion directions and their utilities.
+
+Usage:
+    python -m benchmarks.run_benchmarks [--scale small|medium|large]
+        [--output results.json] [--baseline baseline.json] [--threshold 0.25]
+
+Each case runs in a fresh process so peak RSS is measured in isolation.
+With --baseline, the run exits non-zero when a tracked metric regresses
+by more than the threshold.
+"""
+import argparse
+import json
+import multiprocessing
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional
+
+from benchmarks.corpus import SCALES, build_corpus
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Per-case callable: (corpus paths, scratch dir) -> (units processed, per-operation seconds)
+BenchmarkCase = Callable[[dict[str, Path], Path], tuple[int, list[float]]]
+
+# (metric path, True when higher is better)
+TRACKED_METRICS = [
+    (("throughput",), True),
+    (("latency_ms", "p95"), False),
+    (("peak_rss_mb",), False),
+]
+
+# Cap on records used by the per-record JsonUtils cases
+RECORD_SAMPLE = 10_000
+
+
+def _json_to_pdf_wide(paths, work_dir):
+    from app.core.json_to_pdf import JsonToPdfConverter
+    data = json.loads(paths["wide_json"].read_text())
+    rows = sum(1 for _ in JsonToPdfConverter._iter_flattened(data))
+    assert JsonToPdfConverter.convert(data, str(work_dir / "wide.pdf"), long_table=True)
+    return rows, []
+
+
+def _json_to_pdf_deep(paths, work_dir):
+    from app.core.json_to_pdf import JsonToPdfConverter
+    data = json.loads(paths["deep_json"].read_text())
+    rows = sum(1 for _ in JsonToPdfConverter._iter_flattened(data))
+    assert JsonToPdfConverter.convert(data, str(work_dir / "deep.pdf"), long_table=True)
+    return rows, []
+
+
+def _jsonl_to_pdf(paths, work_dir):
+    from app.core.json_to_pdf import JsonToPdfConverter
+    with open(paths["jsonl"], "rb") as jsonl_file:
+        records = sum(1 for _ in jsonl_file)
+    assert JsonToPdfConverter.convert_jsonl(str(paths["jsonl"]), str(work_dir / "records.pdf"))
+    return records, []
+
+
+def _pdf_to_json(paths, work_dir):
+    from app.core.pdf_to_json import PdfToJsonConverter
+    from app.utils.pdf_utils import PdfUtils
+    pages = PdfUtils.get_pdf_page_count(str(paths["pdf"]))
+    assert PdfToJsonConverter.convert(str(paths["pdf"]), str(work_dir / "document.json"), stream=True)
+    return pages, []
+
+
+def _iter_pages_timed(pdf_path: Path, engine: str) -> tuple[int, list[float]]:
+    from app.utils.pdf_utils import PdfUtils
+    samples = []
+    start = time.perf_counter()
+    for _ in PdfUtils.iter_pages(str(pdf_path), engine=engine):
+        now = time.perf_counter()
+        samples.append(now - start)
+        start = now
+    return len(samples), samples
+
+
+def _pdf_utils_pdfplumber(paths, work_dir):
+    return _iter_pages_timed(paths["pdf"], "pdfplumber")
+
+
+def _pdf_utils_pdfium(paths, work_dir):
+    return _iter_pages_timed(paths["pdf"], "pdfium")
+
+
+def _read_records(jsonl_path: Path) -> list[dict]:
+    records = []
+    with open(jsonl_path, encoding="utf-8") as jsonl_file:
+        for line in jsonl_file:
+            records.append(json.loads(line))
+            if len(records) == RECORD_SAMPLE:
+                break
+    return records
+
+
+def _json_utils_validate(paths, work_dir):
+    from app.utils.json_utils import JsonUtils
+    schema = {"type": "object", "required": ["id"], "properties": {"id": {"type": "integer"}}}
+    samples = []
+    for record in _read_records(paths["jsonl"]):
+        start = time.perf_counter()
+        JsonUtils.validate_json(record, schema)
+        samples.append(time.perf_counter() - start)
+    return len(samples), samples
+
+
+def _json_utils_validate_jsonl(paths, work_dir):
+    import os
+    from app.utils.json_utils import JsonUtils
+    schema = {"type": "object", "required": ["id"], "properties": {"id": {"type": "integer"}}}
+    with open(paths["jsonl"], "rb") as jsonl_file:
+        records = sum(1 for _ in jsonl_file)
+    reports = list(JsonUtils.validate_jsonl(paths["jsonl"], schema, workers=os.cpu_count() or 1))
+    assert not reports
+    return records, []
+
+
+def _json_utils_sanitize(paths, work_dir):
+    from app.utils.json_utils import JsonUtils
+    samples = []
+    for record in _read_records(paths["jsonl"]):
+        start = time.perf_counter()
+        JsonUtils.sanitize_json(record)
+        samples.append(time.perf_counter() - start)
+    return len(samples), samples
+
+
+CASES: dict[str, tuple[BenchmarkCase, str]] = {
+    "json_to_pdf.wide": (_json_to_pdf_wide, "rows"),
+    "json_to_pdf.deep": (_json_to_pdf_deep, "rows"),
+    "json_to_pdf.jsonl": (_jsonl_to_pdf, "records"),
+    "pdf_to_json.convert": (_pdf_to_json, "pages"),
+    "pdf_utils.pdfplumber": (_pdf_utils_pdfplumber, "pages"),
+    "pdf_utils.pdfium": (_pdf_utils_pdfium, "pages"),
+    "json_utils.validate": (_json_utils_validate, "records"),
+    "json_utils.validate_jsonl": (_json_utils_validate_jsonl, "records"),
+    "json_utils.sanitize": (_json_utils_sanitize, "records"),
+}
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of a non-empty sample list
+    """
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Peak resident set size of the current process in megabytes
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure_case(name: str, paths: dict[str, Path], repeat: int) -> dict:
+    """
+    Run one case `repeat` times and summarize it
+
+    Intended to run in a fresh worker process.
+    """
+    case, unit = CASES[name]
+    throughputs = []
+    samples = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            units, operation_samples = case(paths, Path(work_dir))
+            elapsed = time.perf_counter() - start
+            throughputs.append(units / elapsed)
+            samples.extend(operation_samples or [elapsed])
+
+    return {
+        "unit": f"{unit}/s",
+        "throughput": statistics.median(throughputs),
+        "latency_ms": {
+            f"p{int(fraction * 100)}": percentile(samples, fraction) * 1000
+            for fraction in (0.5, 0.95, 0.99)
+        },
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_suite(scale: str, corpus_dir: Path, repeat: int, cases: list[str]) -> dict:
+    """
+    Generate the corpus and run every selected case in its own process
+    """
+    paths = build_corpus(corpus_dir, scale)
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for name in cases:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results[name] = pool.submit(measure_case, name, paths, repeat).result()
+        print(f"{name:>24}: {results[name]['throughput']:12.1f} {results[name]['unit']}", file=sys.stderr)
+
+    return {
+        "scale": scale,
+        "sizes": SCALES[scale],
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cases": results,
+    }
+
+
+def _metric(case_result: dict, path: tuple[str, ...]) -> Optional[float]:
+    value = case_result
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def compare_results(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    List tracked metrics that regressed by more than `threshold`
+
+    Args:
+        current: Results of this run
+        baseline: Results of a previous run at the same scale
+        threshold: Allowed relative regression, e.g. 0.25 for 25%
+
+    Returns:
+        Human-readable regression descriptions
+    """
+    regressions = []
+    for name, case_result in current["cases"].items():
+        baseline_case = baseline.get("cases", {}).get(name)
+        if baseline_case is None:
+            continue
+        for path, higher_is_better in TRACKED_METRICS:
+            value, reference = _metric(case_result, path), _metric(baseline_case, path)
+            if not value or not reference:
+                continue
+            change = (value - reference) / reference
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(
+                    f"{name} {'.'.join(path)}: {reference:.2f} -> {value:.2f} ({change:+.0%})"
+                )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case")
+    parser.add_argument("--case", action="append", choices=CASES, help="run only these cases")
+    parser.add_argument("--corpus-dir", type=Path, default=Path(tempfile.gettempdir()) / "docubridge-bench")
+    parser.add_argument("--output", type=Path, default=Path("bench_results.json"))
+    parser.add_argument("--baseline", type=Path, help="previous results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative regression")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.scale, args.corpus_dir, args.repeat, args.case or list(CASES))
+    args.output.write_text(json.dumps(results, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("scale") != args.scale:
+            print(f"Baseline scale {baseline.get('scale')} does not match {args.scale}", file=sys.stderr)
+            return 2
+        regressions = compare_results(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
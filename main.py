@@ -2,7 +2,6 @@ import sys
 from typing import Optional
 import logging
 
-from app.gui.app_ui import DocuBridgeApp
 from app.config import AppConfig
 from app.utils.logging_config import LoggingConfig
 
@@ -15,12 +14,20 @@ def main() -> Optional[int]:
         Optional exit code for the application.
     """
     try:
+        # Load application configuration
+        config = AppConfig()
+
         # Setup Logging configuration
-        logger = LoggingConfig.configure_logging()
+        logger = LoggingConfig.configure_logging(
+            config.log_dir,
+            queued=config.log_queued,
+            page_log_level=config.page_log_level,
+            page_log_sample_every=config.page_log_sample_every
+        )
         logger.info("DocuBridge application starting...")
 
-        # Load application configuration
-        config = AppConfig()
+        # Tk and the converters load only once the GUI is actually started
+        from app.gui.app_ui import DocuBridgeApp
 
         # Initialize and run the main application
         app = DocuBridgeApp(config)
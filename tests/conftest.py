@@ -0,0 +1,21 @@
+import pytest
+from pathlib import Path
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """
+    Factory fixture creating a PDF with one line of text per page
+    """
+    def _make_pdf(page_count: int = 3, name: str = "sample.pdf") -> Path:
+        pdf_path = tmp_path / name
+        pdf = canvas.Canvas(str(pdf_path), pagesize=letter)
+        for page_number in range(1, page_count + 1):
+            pdf.drawString(72, 720, f"Page {page_number} content")
+            pdf.showPage()
+        pdf.save()
+        return pdf_path
+
+    return _make_pdf
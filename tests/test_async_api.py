@@ -0,0 +1,133 @@
+import asyncio
+import json
+import threading
+import pytest
+from app.core import async_api
+from app.core.async_api import AsyncConverter
+
+class TestAsyncConverter:
+    """
+    Test suite for the asyncio conversion API
+    """
+    def test_converts_both_directions(self, make_pdf, tmp_path):
+        """
+        Test async conversions return structured results with timings
+        """
+        pdf_path = make_pdf(page_count=2)
+
+        async def run():
+            async with AsyncConverter(max_concurrency=2) as converter:
+                return await asyncio.gather(
+                    converter.json_to_pdf({"name": "DocuBridge"}, tmp_path / "out.pdf"),
+                    converter.pdf_to_json(pdf_path, tmp_path / "out.json", output_format="ndjson"),
+                )
+
+        pdf_result, json_result = asyncio.run(run())
+
+        assert pdf_result.success and pdf_result.error is None
+        assert pdf_result.elapsed_seconds > 0
+        assert (tmp_path / "out.pdf").read_bytes().startswith(b"%PDF")
+        assert json_result.success
+        assert len((tmp_path / "out.json").read_text().splitlines()) == 3
+        assert json_result.to_dict()["direction"] == "pdf_to_json"
+
+    def test_failure_is_reported(self, tmp_path):
+        """
+        Test a failed conversion yields success False with an error
+        """
+        async def run():
+            async with AsyncConverter() as converter:
+                return await converter.pdf_to_json(tmp_path / "missing.pdf", tmp_path / "out.json")
+
+        result = asyncio.run(run())
+
+        assert not result.success
+        assert result.error
+
+    def test_concurrency_limit_is_shared(self, monkeypatch, tmp_path):
+        """
+        Test a shared semaphore caps conversions across converters
+        """
+        running, peak = 0, 0
+        lock = threading.Lock()
+
+        def fake_convert(data, output_path, cancel_event=None):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            threading.Event().wait(0.05)
+            with lock:
+                running -= 1
+            return True
+
+        monkeypatch.setitem(async_api._CONVERTERS, "json_to_pdf", fake_convert)
+
+        async def run():
+            semaphore = asyncio.Semaphore(2)
+            first = AsyncConverter(max_concurrency=4, semaphore=semaphore)
+            second = AsyncConverter(max_concurrency=4, semaphore=semaphore)
+            results = await asyncio.gather(*(
+                converter.json_to_pdf({}, tmp_path / f"{index}.pdf")
+                for index, converter in enumerate([first, second] * 3)
+            ))
+            await first.aclose()
+            await second.aclose()
+            return results
+
+        results = asyncio.run(run())
+
+        assert all(result.success for result in results)
+        assert peak == 2
+        assert max(result.queued_seconds for result in results) > 0
+
+    def test_cancellation_sets_cancel_event(self, monkeypatch, tmp_path):
+        """
+        Test cancelling the awaiting task stops the running converter
+        """
+        started = threading.Event()
+        seen = {}
+
+        def fake_convert(data, output_path, cancel_event=None):
+            started.set()
+            seen["cancelled"] = cancel_event.wait(10)
+            return False
+
+        monkeypatch.setitem(async_api._CONVERTERS, "json_to_pdf", fake_convert)
+
+        async def run():
+            async with AsyncConverter(max_concurrency=1) as converter:
+                task = asyncio.create_task(converter.json_to_pdf({}, tmp_path / "out.pdf"))
+                while not started.is_set():
+                    await asyncio.sleep(0.01)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(run())
+
+        assert seen["cancelled"] is True
+
+    def test_rejects_external_cancel_event(self, tmp_path):
+        """
+        Test cancel_event cannot be passed alongside task cancellation
+        """
+        async def run():
+            async with AsyncConverter() as converter:
+                await converter.json_to_pdf({}, tmp_path / "out.pdf", cancel_event=threading.Event())
+
+        with pytest.raises(ValueError):
+            asyncio.run(run())
+
+    def test_process_executor(self, tmp_path):
+        """
+        Test conversions also run in a process pool
+        """
+        async def run():
+            async with AsyncConverter(max_concurrency=1, use_processes=True) as converter:
+                return await converter.json_to_pdf(json.dumps({"a": 1}), tmp_path / "out.pdf")
+
+        result = asyncio.run(run())
+
+        assert result.success
+        assert (tmp_path / "out.pdf").read_bytes().startswith(b"%PDF")
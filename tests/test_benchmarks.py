@@ -0,0 +1,61 @@
+import pytest
+from benchmarks.bench_memory import growth_per_10k_rows
+from benchmarks.run_benchmarks import compare_results, percentile
+
+class TestBenchmarkSuite:
+    """
+    Test suite for benchmark result handling
+    """
+    @pytest.fixture
+    def baseline(self):
+        return {
+            "cases": {
+                "pdf_to_json.convert": {
+                    "throughput": 100.0,
+                    "latency_ms": {"p95": 10.0},
+                    "peak_rss_mb": 50.0
+                }
+            }
+        }
+
+    def test_percentile(self):
+        """
+        Test nearest-rank percentiles
+        """
+        samples = [float(value) for value in range(1, 101)]
+
+        assert percentile(samples, 0.5) == 51.0
+        assert percentile(samples, 0.99) == 100.0
+
+    def test_no_regression_within_threshold(self, baseline):
+        """
+        Test changes inside the threshold pass
+        """
+        current = {"cases": {"pdf_to_json.convert": {
+            "throughput": 90.0,
+            "latency_ms": {"p95": 11.0},
+            "peak_rss_mb": 55.0
+        }}}
+
+        assert compare_results(current, baseline, 0.25) == []
+
+    def test_regressions_are_reported(self, baseline):
+        """
+        Test slower throughput and higher memory fail the comparison
+        """
+        current = {"cases": {"pdf_to_json.convert": {
+            "throughput": 50.0,
+            "latency_ms": {"p95": 10.0},
+            "peak_rss_mb": 80.0
+        }}}
+
+        regressions = compare_results(current, baseline, 0.25)
+
+        assert len(regressions) == 2
+        assert regressions[0].startswith("pdf_to_json.convert throughput")
+
+    def test_jsonl_memory_growth_rate(self):
+        """
+        Test memory growth is measured between the smallest and largest run
+        """
+        assert growth_per_10k_rows({10_000: 40.0, 20_000: 45.0, 40_000: 100.0}) == 20.0
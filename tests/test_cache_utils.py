@@ -0,0 +1,141 @@
+import io
+import json
+from datetime import date
+import os
+import pytest
+from pathlib import Path
+from app.core.json_to_pdf import JsonToPdfConverter
+from app.core.pdf_to_json import PdfToJsonConverter
+from app.utils.cache_utils import ConversionCache
+
+class TestConversionCache:
+    """
+    Test suite for the content-addressed conversion cache
+    """
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return ConversionCache(tmp_path / "cache", max_size_mb=1)
+
+    def test_keys_depend_on_input_and_options(self):
+        """
+        Test identical inputs and options share a key
+        """
+        key = ConversionCache.key_for_bytes(b"{}", direction="json_to_pdf")
+
+        assert key == ConversionCache.key_for_bytes(b"{}", direction="json_to_pdf")
+        assert key != ConversionCache.key_for_bytes(b"[]", direction="json_to_pdf")
+        assert key != ConversionCache.key_for_bytes(b"{}", direction="pdf_to_json")
+
+    def test_input_kinds_share_keys(self, tmp_path):
+        """
+        Test a path, buffer and stream with the same content share a key
+        """
+        input_path = tmp_path / "input.pdf"
+        input_path.write_bytes(b"%PDF-input")
+        key = ConversionCache.key_for_input(str(input_path), direction="pdf_to_json")
+
+        with open(input_path, "rb") as input_file:
+            input_file.seek(4)
+            assert ConversionCache.key_for_input(input_file, direction="pdf_to_json") != key
+            assert input_file.tell() == 4
+        assert ConversionCache.key_for_input(memoryview(b"%PDF-input"), direction="pdf_to_json") == key
+        assert ConversionCache.key_for_input(io.BytesIO(b"%PDF-input"), direction="pdf_to_json") == key
+
+    def test_hit_and_miss_counters(self, cache, tmp_path):
+        """
+        Test a stored artifact is returned and counted as a hit
+        """
+        artifact = tmp_path / "artifact.pdf"
+        artifact.write_bytes(b"%PDF-artifact")
+        destination = tmp_path / "restored.pdf"
+
+        assert cache.get("ab" * 32, destination) is False
+        cache.put("ab" * 32, artifact)
+        assert cache.get("ab" * 32, destination) is True
+
+        assert destination.read_bytes() == b"%PDF-artifact"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self, cache, tmp_path):
+        """
+        Test the least recently used entry is evicted past the size cap
+        """
+        artifact = tmp_path / "artifact.bin"
+        artifact.write_bytes(b"x" * 400 * 1024)
+        keys = ["aa" * 32, "bb" * 32, "cc" * 32]
+
+        cache.put(keys[0], artifact)
+        cache.put(keys[1], artifact)
+        # Make the first entry the most recently used one
+        os.utime(cache._entry_path(keys[1]), (0, 0))
+        cache.get(keys[0], tmp_path / "restored.bin")
+        cache.put(keys[2], artifact)
+
+        assert cache._entry_path(keys[0]).exists()
+        assert not cache._entry_path(keys[1]).exists()
+        assert cache._entry_path(keys[2]).exists()
+
+    def test_converter_hit_skips_rendering(self, cache, tmp_path, monkeypatch):
+        """
+        Test a cache hit returns the stored PDF without rendering
+        """
+        data = {"name": "DocuBridge Test"}
+        assert JsonToPdfConverter.convert(data, str(tmp_path / "first.pdf"), cache=cache)
+
+        def fail_flatten(*args, **kwargs):
+            raise AssertionError("cache hit should not render")
+
+        monkeypatch.setattr(JsonToPdfConverter, "_iter_flattened", fail_flatten)
+        second = tmp_path / "second.pdf"
+
+        assert JsonToPdfConverter.convert(data, str(second), cache=cache)
+        assert second.read_bytes() == (tmp_path / "first.pdf").read_bytes()
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_pdf_conversion_hit(self, cache, make_pdf, tmp_path, stream):
+        """
+        Test PDF to JSON conversions miss, then hit, the cache
+        """
+        pdf_path = str(make_pdf(page_count=2))
+        first = tmp_path / "first.json"
+        second = tmp_path / "second.json"
+
+        assert PdfToJsonConverter.convert(pdf_path, str(first), cache=cache, stream=stream)
+        assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 0
+        assert PdfToJsonConverter.convert(pdf_path, str(second), cache=cache, stream=stream)
+        assert cache.stats()["hits"] == 1
+        assert second.read_bytes() == first.read_bytes()
+
+    def test_json_key_follows_document_order(self, cache, tmp_path):
+        """
+        Test documents differing only in key order do not share a rendered PDF
+        """
+        assert JsonToPdfConverter.convert({"b": 1, "a": 2}, str(tmp_path / "first.pdf"), cache=cache)
+        assert JsonToPdfConverter.convert({"a": 2, "b": 1}, str(tmp_path / "second.pdf"), cache=cache)
+
+        assert cache.stats()["hits"] == 0
+
+    def test_unserializable_values_do_not_fail_conversion(self, cache, tmp_path):
+        """
+        Test values json cannot encode are keyed by their rendered text
+        """
+        data = {"day": date(2024, 1, 2)}
+
+        assert JsonToPdfConverter.convert(data, str(tmp_path / "first.pdf"), cache=cache)
+        assert JsonToPdfConverter.convert(data, str(tmp_path / "second.pdf"), cache=cache)
+        assert cache.stats()["hits"] == 1
+
+    def test_pdf_artifacts_keep_their_file_path(self, cache, make_pdf, tmp_path):
+        """
+        Test byte-identical PDFs at different paths report their own path
+        """
+        first_pdf = str(make_pdf(page_count=1, name="a.pdf"))
+        second_pdf = str(tmp_path / "b.pdf")
+        Path(second_pdf).write_bytes(Path(first_pdf).read_bytes())
+
+        assert PdfToJsonConverter.convert(first_pdf, str(tmp_path / "a.json"), cache=cache)
+        assert PdfToJsonConverter.convert(second_pdf, str(tmp_path / "b.json"), cache=cache)
+
+        assert json.loads((tmp_path / "b.json").read_text())["metadata"]["file_path"] == second_pdf
@@ -0,0 +1,122 @@
+import io
+import json
+import threading
+import time
+import pytest
+from pathlib import Path
+from app.cli import BatchConverter, main
+from app.config import AppConfig
+from app.utils.logging_config import LoggingConfig
+
+class TestBatchCli:
+    """
+    Test suite for headless batch conversion
+    """
+    @pytest.fixture(autouse=True)
+    def isolated_config(self, tmp_path, monkeypatch):
+        # main() builds its own AppConfig; keep its logs and outputs out of the repo
+        monkeypatch.setattr("app.cli.AppConfig", lambda: AppConfig(base_dir=tmp_path))
+        yield
+        LoggingConfig.shutdown()
+
+    @pytest.fixture
+    def input_dir(self, tmp_path, make_pdf):
+        input_dir = tmp_path / "inputs"
+        input_dir.mkdir()
+        (input_dir / "data.json").write_text(json.dumps({"name": "DocuBridge"}))
+        make_pdf(page_count=2).rename(input_dir / "report.pdf")
+        (input_dir / "notes.txt").write_text("ignored")
+        return input_dir
+
+    def test_converts_directory(self, input_dir, tmp_path):
+        """
+        Test every supported file is converted and recorded in the manifest
+        """
+        output_dir = tmp_path / "outputs"
+        exit_code = main([str(input_dir), "-o", str(output_dir), "-w", "2"])
+
+        assert exit_code == 0
+        assert (output_dir / "data.pdf").stat().st_size > 0
+        assert json.loads((output_dir / "report.json").read_text())["metadata"]["total_pages"] == 2
+
+        manifest = [json.loads(line) for line in (output_dir / "manifest.jsonl").read_text().splitlines()]
+        assert sorted(entry["status"] for entry in manifest) == ["done", "done"]
+
+    def test_resume_skips_completed_files(self, input_dir, tmp_path):
+        """
+        Test a rerun only converts files missing from the manifest
+        """
+        output_dir = tmp_path / "outputs"
+        manifest_path = output_dir / "manifest.jsonl"
+        assert main([str(input_dir), "-o", str(output_dir), "-w", "1"]) == 0
+
+        (input_dir / "extra.json").write_text(json.dumps({"extra": True}))
+        batch = BatchConverter(AppConfig(base_dir=tmp_path), output_dir, manifest_path, 1, "pdfplumber")
+        batch.manifest.load()
+
+        assert [job[0].name for job in batch.plan(input_dir)] == ["extra.json"]
+
+    def test_recursive_outputs_mirror_input_tree(self, input_dir, tmp_path):
+        """
+        Test recursive runs convert nested inputs into matching subdirectories
+        """
+        (input_dir / "nested").mkdir()
+        (input_dir / "nested" / "data.json").write_text(json.dumps({"nested": True}))
+        output_dir = tmp_path / "outputs"
+
+        assert main([str(input_dir), "-o", str(output_dir), "-w", "1", "--recursive"]) == 0
+
+        assert (output_dir / "data.pdf").exists()
+        assert (output_dir / "nested" / "data.pdf").exists()
+
+    def test_watch_converts_new_files(self, input_dir, tmp_path):
+        """
+        Test watch mode converts existing files, then files dropped in later
+        """
+        output_dir = tmp_path / "outputs"
+        batch = BatchConverter(
+            AppConfig(base_dir=tmp_path), output_dir, output_dir / "manifest.jsonl", 1, "pdfplumber"
+        )
+        stop_event = threading.Event()
+        watcher = threading.Thread(
+            target=batch.watch,
+            args=(input_dir, 0.05, stop_event, io.StringIO())
+        )
+        watcher.start()
+        try:
+            deadline = time.monotonic() + 30
+            while not (output_dir / "report.json").exists():
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+            (input_dir / "late.json").write_text(json.dumps({"late": True}))
+            while not (output_dir / "late.pdf").exists():
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+        finally:
+            stop_event.set()
+            watcher.join(30)
+
+        assert (output_dir / "data.pdf").exists()
+        manifest = [json.loads(line) for line in (output_dir / "manifest.jsonl").read_text().splitlines()]
+        assert len(manifest) == 3
+
+    def test_manifest_records_scanned_signature(self, input_dir, tmp_path):
+        """
+        Test inputs changed or deleted during a conversion neither abort the batch nor count as done
+        """
+        output_dir = tmp_path / "outputs"
+        batch = BatchConverter(
+            AppConfig(base_dir=tmp_path), output_dir, output_dir / "manifest.jsonl", 1, "pdfplumber"
+        )
+        batch.manifest.load()
+        jobs = batch.plan(input_dir)
+        data_path = input_dir / "data.json"
+        data_path.write_text(json.dumps({"name": "DocuBridge", "changed": True}))
+        (input_dir / "report.pdf").unlink()
+
+        for input_path, output_path, _, signature in jobs:
+            batch.manifest.record(input_path, output_path, True, signature)
+        batch.manifest.close()
+        batch.manifest.load()
+
+        assert [job[0] for job in batch.plan(input_dir)] == [data_path]
@@ -0,0 +1,160 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from app.config import AppConfig
+from app.core.json_to_pdf import JsonToPdfConverter
+from app.utils.file_utils import FileUtils, FolderWatcher, OutputAllocator
+
+class TestOutputAllocation:
+    """
+    Test suite for output naming and atomic writes
+    """
+    def test_allocator_names_are_unique(self, tmp_path):
+        """
+        Test concurrent allocations never return the same path
+        """
+        allocator = OutputAllocator(tmp_path)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            paths = list(executor.map(lambda _: allocator.allocate("pdf"), range(1000)))
+
+        assert len(set(paths)) == 1000
+        assert all(path.parent == tmp_path and path.suffix == ".pdf" for path in paths)
+        assert not any(tmp_path.iterdir())
+
+    def test_separate_allocators_do_not_collide(self, tmp_path):
+        """
+        Test two allocators for one directory in one process hand out distinct names
+        """
+        first = OutputAllocator(tmp_path)
+        second = OutputAllocator(tmp_path)
+
+        paths = [allocator.allocate("pdf") for _ in range(50) for allocator in (first, second)]
+
+        assert len(set(paths)) == 100
+
+    def test_config_output_path_does_not_probe(self, tmp_path, monkeypatch):
+        """
+        Test AppConfig allocates names without checking existing files
+        """
+        config = AppConfig(base_dir=tmp_path)
+        monkeypatch.setattr("pathlib.Path.exists", lambda self: pytest.fail("probed the output directory"))
+
+        first = config.get_unique_output_path("converted_file", "json")
+        second = config.get_unique_output_path("converted_file", "json")
+
+        assert first != second
+        assert first.name.startswith("converted_file_")
+
+    def test_atomic_output_replaces_on_success(self, tmp_path):
+        """
+        Test the final file appears only once the block completes
+        """
+        output_path = tmp_path / "result.json"
+        output_path.write_bytes(b"old")
+
+        with FileUtils.atomic_write(output_path) as output_file:
+            output_file.write(b"new")
+            assert output_path.read_bytes() == b"old"
+
+        assert output_path.read_bytes() == b"new"
+        assert os.listdir(tmp_path) == ["result.json"]
+
+    def test_atomic_output_discards_on_failure(self, tmp_path):
+        """
+        Test a failed write keeps the previous file and leaves no temporary
+        """
+        output_path = tmp_path / "result.json"
+        output_path.write_bytes(b"old")
+
+        with pytest.raises(RuntimeError):
+            with FileUtils.atomic_write(output_path) as output_file:
+                output_file.write(b"partial")
+                raise RuntimeError("conversion failed")
+
+        assert output_path.read_bytes() == b"old"
+        assert os.listdir(tmp_path) == ["result.json"]
+
+    def test_failed_conversion_leaves_no_output(self, tmp_path):
+        """
+        Test converters do not leave partial files behind
+        """
+        output_path = tmp_path / "empty.pdf"
+
+        assert JsonToPdfConverter.convert({}, str(output_path), long_table=True) is False
+        assert os.listdir(tmp_path) == []
+
+
+class TestDirectoryScanning:
+    """
+    Test suite for recursive scanning and folder watching
+    """
+    @pytest.fixture
+    def tree(self, tmp_path):
+        root = tmp_path / "drop"
+        (root / "nested" / "deeper").mkdir(parents=True)
+        (root / ".hidden").mkdir()
+        (root / "top.json").write_text("{}")
+        (root / "nested" / "middle.pdf").write_bytes(b"%PDF")
+        (root / "nested" / "deeper" / "bottom.jsonl").write_text("{}\n")
+        (root / "nested" / "notes.txt").write_text("ignored")
+        (root / "nested" / "json").write_text("{}")
+        (root / "nested" / "UPPER.PDF").write_bytes(b"%PDF")
+        (root / "empty.json").write_text("")
+        (root / "large.json").write_bytes(b"x" * 2 * 1024 * 1024)
+        (root / ".hidden" / "secret.json").write_text("{}")
+        (root / ".top.json.1.1.tmp").write_text("{}")
+        return root
+
+    def test_scan_is_recursive_and_filtered(self, tree):
+        """
+        Test the scan descends, filters by extension and size and skips hidden entries
+        """
+        found = FileUtils.scan_files(tree, ["json", "jsonl", "pdf"], max_size_mb=1)
+
+        assert not isinstance(found, list)
+        names = [scanned.path.relative_to(tree).as_posix() for scanned in found]
+        assert names == ["top.json", "nested/UPPER.PDF", "nested/middle.pdf", "nested/deeper/bottom.jsonl"]
+
+    def test_scan_single_level_with_exclusions(self, tree):
+        """
+        Test non-recursive scans and excluded directories
+        """
+        top_level = FileUtils.scan_files(tree, ["json", "pdf"], max_size_mb=1, recursive=False)
+        excluded = FileUtils.scan_files(tree, ["json", "pdf"], max_size_mb=1, exclude=[tree / "nested"])
+
+        assert [scanned.path.name for scanned in top_level] == ["top.json"]
+        assert [scanned.path.name for scanned in excluded] == ["top.json"]
+
+    def test_get_valid_files_keeps_hidden_and_empty_files(self, tree):
+        """
+        Test the single-level helper only filters by extension
+        """
+        (tree / ".dotted.json").write_text("{}")
+        names = [path.name for path in FileUtils.get_valid_files(tree, ["json"])]
+
+        assert names == [".dotted.json", "empty.json", "large.json", "top.json"]
+
+    def test_watcher_reports_settled_new_and_changed_files(self, tree):
+        """
+        Test files are reported once stable, and again only after a change
+        """
+        watcher = FolderWatcher(tree, ["json", "jsonl", "pdf"], max_size_mb=1, full_scan_every=100)
+
+        assert watcher.poll() == []
+        assert len(watcher.poll()) == 4
+        assert watcher.poll() == []
+
+        added = tree / "nested" / "added.json"
+        added.write_text('{"a": 1}')
+        assert watcher.poll() == []
+        assert [scanned.path for scanned in watcher.poll()] == [added]
+
+        # Rewriting a file in place leaves its directory's mtime alone
+        added.write_text('{"a": 2, "b": 3}')
+        watcher.poll()
+        watcher.poll()
+        assert watcher.poll() == []
+        watcher.full_scan_every = 1
+        watcher.poll()
+        assert [scanned.path for scanned in watcher.poll()] == [added]
@@ -1,6 +1,11 @@
+import io
+import json
+import threading
+import pdfplumber
 import pytest
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from pathlib import Path
-from app.core.json_to_pdf import JsonToPdfConverter
+from app.core.json_to_pdf import JsonToPdfConverter, RenderTemplate
 
 class TestJsonToPdfConverter:
     """
@@ -31,5 +36,208 @@ class TestJsonToPdfConverter:
         """
         output_path = tmp_path / "empty_output.pdf"
         result = JsonToPdfConverter.convert({}, str(output_path))
-        
-        assert result is False
\ No newline at end of file
+
+        assert result is False
+
+    def test_flatten_json_order_and_keys(self):
+        """
+        Test flattening keeps document order and dotted key paths
+        """
+        data = {"a": {"b": 1, "c": [True, None]}, "d": "x", "e": {}}
+
+        assert list(JsonToPdfConverter._iter_flattened(data)) == [
+            ("a.b", "1"),
+            ("a.c.0", "True"),
+            ("a.c.1", "None"),
+            ("d", "x")
+        ]
+
+    def test_flatten_deeply_nested_json(self):
+        """
+        Test nesting far beyond the recursion limit flattens iteratively
+        """
+        data = leaf = {}
+        for _ in range(5000):
+            leaf["n"] = {}
+            leaf = leaf["n"]
+        leaf["value"] = 1
+
+        rows = list(JsonToPdfConverter._iter_flattened(data))
+
+        assert len(rows) == 1
+        assert rows[0] == ("n." * 5000 + "value", "1")
+
+    def test_flatten_json_limits(self):
+        """
+        Test max depth serializes deep containers and max items truncates
+        """
+        data = {"deep": {"inner": {"x": 1}}, "items": list(range(5))}
+        rows = dict(JsonToPdfConverter._iter_flattened(data, max_depth=2, max_items=2))
+
+        assert rows["deep.inner"] == '{"x": 1}'
+        assert rows["items.0"] == "0"
+        assert "items.2" not in rows
+        assert rows["items.…"] == "<3 more items>"
+
+    def test_long_table_conversion(self, tmp_path):
+        """
+        Test long-table mode splits rows into fitted page-sized tables
+        """
+        data = {"rows": [{"id": index, "text": "word " * 200} for index in range(60)]}
+        output_path = tmp_path / "long_table.pdf"
+
+        result = JsonToPdfConverter.convert(data, str(output_path), long_table=True)
+
+        assert result is True
+        with pdfplumber.open(output_path) as pdf:
+            assert len(pdf.pages) == 4
+            texts = [page.extract_text() for page in pdf.pages]
+        assert all(text.startswith("Key Value") for text in texts)
+        assert "rows.0.text word" in texts[0]
+        assert "…" in texts[0]
+
+    def test_fit_cell_truncates_to_width(self):
+        """
+        Test cell text is cut to a single line within the column width
+        """
+        assert JsonToPdfConverter._fit_cell("short", 100) == "short"
+
+        fitted = JsonToPdfConverter._fit_cell("line one\nline two " * 50, 100)
+        assert fitted.endswith("…")
+        assert "\n" not in fitted
+        assert stringWidth(fitted, "Helvetica", 10) <= 100
+
+    def test_shared_render_template(self, tmp_path):
+        """
+        Test one template serves many conversions with its page setup
+        """
+        template = RenderTemplate(page_size=(400.0, 400.0), margin=36, column_ratios=(0.5, 0.5))
+        data = {"rows": list(range(100))}
+
+        for index in range(3):
+            output_path = tmp_path / f"shared_{index}.pdf"
+            assert JsonToPdfConverter.convert(data, str(output_path), long_table=True, template=template)
+            with pdfplumber.open(output_path) as pdf:
+                assert pdf.pages[0].width == 400
+                assert len(pdf.pages) == -(-100 // template.rows_per_page)
+        assert JsonToPdfConverter.convert(data, str(tmp_path / "plain.pdf"), template=template)
+        assert template.column_layout((0.5, 0.5))[0] == [164.0, 164.0]
+
+    @pytest.mark.parametrize("source", [b'{"name": "DocuBridge"}', bytearray(b'{"name": "DocuBridge"}')])
+    def test_in_memory_conversion(self, tmp_path, source):
+        """
+        Test encoded JSON buffers and streams render to a writable stream
+        """
+        for data in (source, memoryview(source), io.BytesIO(source)):
+            output = io.BytesIO()
+
+            assert JsonToPdfConverter.convert(data, output) is True
+            with pdfplumber.open(output) as pdf:
+                assert "name DocuBridge" in pdf.pages[0].extract_text()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_path_like_input(self, tmp_path):
+        """
+        Test a Path input is read as a JSON file
+        """
+        input_path = tmp_path / "data.json"
+        input_path.write_text(json.dumps({"name": "DocuBridge"}))
+        output = io.BytesIO()
+
+        assert JsonToPdfConverter.convert(input_path, output) is True
+        with pdfplumber.open(output) as pdf:
+            assert "name DocuBridge" in pdf.pages[0].extract_text()
+
+
+class TestJsonlToPdfConverter:
+    """
+    Test suite for streaming JSONL to PDF conversion
+    """
+    def test_streams_records_across_pages(self, tmp_path):
+        """
+        Test records are rendered as page-sized table chunks
+        """
+        input_path = tmp_path / "records.jsonl"
+        with open(input_path, "w", encoding="utf-8") as jsonl_file:
+            for index in range(200):
+                jsonl_file.write(json.dumps({"id": index, "tags": ["a", "b"]}) + "\n")
+            jsonl_file.write("\n")
+        output_path = tmp_path / "records.pdf"
+
+        result = JsonToPdfConverter.convert_jsonl(str(input_path), str(output_path), rows_per_page=100)
+
+        assert result is True
+        with pdfplumber.open(output_path) as pdf:
+            assert len(pdf.pages) == 6
+            first_page = pdf.pages[0].extract_text()
+        assert first_page.startswith("Key Value")
+        assert "1.tags.0 a" in first_page
+
+    def test_sanitized_conversion(self, tmp_path):
+        """
+        Test sanitize drops redacted keys from the rendered records
+        """
+        input_path = tmp_path / "records.jsonl"
+        input_path.write_text('{"id": 1, "user": {"token": "s3cr3t", "name": "ann"}}\n', encoding="utf-8")
+        output_path = tmp_path / "records.pdf"
+
+        result = JsonToPdfConverter.convert_jsonl(str(input_path), str(output_path), sanitize=True)
+
+        assert result is True
+        with pdfplumber.open(output_path) as pdf:
+            text = pdf.pages[0].extract_text()
+        assert "1.user.name ann" in text
+        assert "s3cr3t" not in text
+
+    def test_empty_jsonl_conversion(self, tmp_path):
+        """
+        Test conversion of a JSONL file without records
+        """
+        input_path = tmp_path / "empty.jsonl"
+        input_path.write_text("\n")
+        output_path = tmp_path / "empty.pdf"
+
+        assert JsonToPdfConverter.convert_jsonl(str(input_path), str(output_path)) is False
+        assert not output_path.exists()
+
+    def test_progress_and_cancellation(self, tmp_path):
+        """
+        Test byte progress is reported and a set cancel event stops rendering
+        """
+        input_path = tmp_path / "records.jsonl"
+        input_path.write_text("".join(json.dumps({"id": index}) + "\n" for index in range(100)))
+        file_size = input_path.stat().st_size
+
+        progress = []
+        assert JsonToPdfConverter.convert_jsonl(
+            str(input_path),
+            str(tmp_path / "progress.pdf"),
+            rows_per_page=40,
+            progress_callback=lambda done, total: progress.append((done, total))
+        )
+        assert progress[-1] == (file_size, file_size)
+        assert len(progress) == 3
+
+        cancel_event = threading.Event()
+        cancel_event.set()
+        output_path = tmp_path / "cancelled.pdf"
+
+        assert JsonToPdfConverter.convert_jsonl(
+            str(input_path),
+            str(output_path),
+            cancel_event=cancel_event
+        ) is False
+        assert not output_path.exists()
+
+    def test_in_memory_conversion(self):
+        """
+        Test JSONL buffers and streams convert to PDF bytes
+        """
+        records = b"".join(json.dumps({"id": index}).encode() + b"\n" for index in range(50))
+
+        for data in (records, memoryview(records), io.BytesIO(records)):
+            output = JsonToPdfConverter.convert_to_bytes(data, jsonl=True, rows_per_page=20)
+
+            with pdfplumber.open(io.BytesIO(output)) as pdf:
+                assert len(pdf.pages) == 3
+        assert JsonToPdfConverter.convert_to_bytes(b"\n", jsonl=True) is None
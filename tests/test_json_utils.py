@@ -0,0 +1,129 @@
+import pytest
+from app.utils.json_utils import JsonUtils
+
+RECORD_SCHEMA = {
+    "type": "object",
+    "required": ["id"],
+    "properties": {"id": {"type": "integer"}}
+}
+
+class TestJsonUtils:
+    """
+    Test suite for JSON validation utilities
+    """
+    @pytest.fixture
+    def jsonl_path(self, tmp_path):
+        """
+        JSONL file with a bad record, a blank line and a malformed line
+        """
+        lines = ['{"id": %d}' % index for index in range(1, 11)]
+        lines[3] = '{"id": "four"}'
+        lines[6] = ""
+        lines[8] = '{"id": 9'
+        jsonl_path = tmp_path / "records.jsonl"
+        jsonl_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return jsonl_path
+
+    def test_validate_json(self):
+        """
+        Test validation against the default and a custom schema
+        """
+        assert JsonUtils.validate_json('{"data": [], "metadata": {}}')
+        assert not JsonUtils.validate_json({"data": "not a list"})
+        assert not JsonUtils.validate_json({"name": "x"}, RECORD_SCHEMA)
+
+    def test_validator_is_cached_per_schema(self):
+        """
+        Test equal schemas share one compiled validator regardless of key order
+        """
+        reordered = {
+            "properties": {"id": {"type": "integer"}},
+            "required": ["id"],
+            "type": "object"
+        }
+
+        assert JsonUtils.get_validator(RECORD_SCHEMA) is JsonUtils.get_validator(reordered)
+        assert JsonUtils.get_validator(RECORD_SCHEMA) is not JsonUtils.get_validator()
+
+    def test_validate_jsonl_reports_per_line(self, jsonl_path):
+        """
+        Test invalid records are reported with their line numbers
+        """
+        reports = list(JsonUtils.validate_jsonl(jsonl_path, RECORD_SCHEMA))
+
+        assert [report["line_number"] for report in reports] == [4, 9]
+        assert reports[0]["errors"][0]["path"] == "$.id"
+        assert reports[1]["errors"][0]["message"].startswith("Invalid JSON")
+
+    def test_parallel_validate_jsonl_matches_sequential(self, jsonl_path):
+        """
+        Test chunked validation on a process pool keeps line order
+        """
+        sequential = list(JsonUtils.validate_jsonl(jsonl_path, RECORD_SCHEMA))
+        parallel = list(JsonUtils.validate_jsonl(
+            jsonl_path,
+            RECORD_SCHEMA,
+            workers=2,
+            chunk_size=3
+        ))
+
+        assert parallel == sequential
+
+    def test_sanitize_json(self):
+        """
+        Test redacted keys are dropped case-insensitively and strings truncated
+        """
+        data = {
+            "user": {"Password": "x", "name": "n" * 1500},
+            "items": [{"TOKEN": "t", "id": 1}, "short"],
+            "secret": "s"
+        }
+
+        sanitized = JsonUtils.sanitize_json(data)
+
+        assert sanitized == {
+            "user": {"name": "n" * 1000},
+            "items": [{"id": 1}, "short"]
+        }
+        assert "secret" in data
+
+    def test_sanitize_json_in_place(self):
+        """
+        Test in-place sanitization matches the copy and reuses the input
+        """
+        data = {"a": [{"secret": 1, "b": "x" * 20}], "token": 2}
+        expected = JsonUtils.sanitize_json(data, max_string_length=5)
+
+        result = JsonUtils.sanitize_json(data, max_string_length=5, in_place=True)
+
+        assert result is data
+        assert data == expected == {"a": [{"b": "xxxxx"}]}
+
+    def test_sanitize_deep_document(self):
+        """
+        Test nesting beyond the recursion limit is sanitized
+        """
+        data = node = {}
+        for _ in range(5000):
+            node["child"] = {"password": "x"}
+            node = node["child"]
+
+        sanitized = JsonUtils.sanitize_json(data)
+
+        depth = 0
+        while "child" in sanitized:
+            sanitized = sanitized["child"]
+            depth += 1
+        assert depth == 5000
+        assert sanitized == {}
+
+    def test_sanitize_jsonl(self, tmp_path):
+        """
+        Test JSONL records are sanitized one at a time
+        """
+        input_path = tmp_path / "input.jsonl"
+        input_path.write_text('{"id": 1, "token": "a"}\n\n{"id": 2, "Secret": "b"}\n', encoding="utf-8")
+        output_path = tmp_path / "output.jsonl"
+
+        assert JsonUtils.sanitize_jsonl(input_path, output_path) == 2
+        assert output_path.read_text(encoding="utf-8") == '{"id": 1}\n{"id": 2}\n'
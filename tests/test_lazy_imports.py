@@ -0,0 +1,22 @@
+import pytest
+from benchmarks.bench_import_time import measure_import
+
+class TestLazyImports:
+    """
+    Test suite for startup import cost
+    """
+    @pytest.mark.parametrize("module", [
+        "main",
+        "app.cli",
+        "app.core.json_to_pdf",
+        "app.core.pdf_to_json",
+        "app.core.async_api",
+        "app.utils.json_utils",
+    ])
+    def test_no_heavy_packages_at_import(self, module):
+        """
+        Test entry points defer reportlab, pdfplumber, jsonschema and Tk
+        """
+        result = measure_import(module)
+
+        assert result["loaded"] == []
@@ -0,0 +1,96 @@
+import json
+import logging
+import pytest
+import structlog
+from app.utils.logging_config import PAGE_LOGGER_NAME, LoggingConfig
+from app.utils.pdf_utils import PdfUtils
+
+class TestLoggingConfig:
+    """
+    Test suite for queued logging
+    """
+    @pytest.fixture(autouse=True)
+    def restore_logging(self):
+        root_level = logging.getLogger().level
+        yield
+        LoggingConfig.shutdown()
+        structlog.reset_defaults()
+        page_logger = logging.getLogger(PAGE_LOGGER_NAME)
+        page_logger.setLevel(logging.NOTSET)
+        for page_filter in list(page_logger.filters):
+            page_logger.removeFilter(page_filter)
+        logging.getLogger().setLevel(root_level)
+
+    @staticmethod
+    def _page_events(log_path):
+        events = [json.loads(line) for line in log_path.read_text().splitlines() if line.startswith("{")]
+        return [event for event in events if event.get("logger") == PAGE_LOGGER_NAME]
+
+    def test_queued_records_reach_log_dir(self, tmp_path):
+        """
+        Test queued records are written to log_dir by the listener
+        """
+        logger = LoggingConfig.configure_logging(tmp_path)
+        logger.info("queued_event", answer=42)
+        logging.warning("plain stdlib record")
+        LoggingConfig.shutdown()
+
+        log_text = (tmp_path / "docubridge.log").read_text()
+        assert '"event": "queued_event"' in log_text
+        assert "plain stdlib record" in log_text
+
+    def test_page_events_are_off_by_default(self, tmp_path, make_pdf):
+        """
+        Test per-page debug events are dropped at the default page level
+        """
+        LoggingConfig.configure_logging(tmp_path, logging.DEBUG)
+        list(PdfUtils.iter_pages(str(make_pdf(page_count=3))))
+        LoggingConfig.shutdown()
+
+        assert self._page_events(tmp_path / "docubridge.log") == []
+
+    def test_document_spans_are_logged_by_default(self, tmp_path, make_pdf):
+        """
+        Test whole-document stage events are emitted at the default levels
+        """
+        LoggingConfig.configure_logging(tmp_path)
+        PdfUtils.get_pdf_page_count(str(make_pdf(page_count=2)))
+        LoggingConfig.shutdown()
+
+        events = [
+            json.loads(line)
+            for line in (tmp_path / "docubridge.log").read_text().splitlines()
+            if line.startswith("{")
+        ]
+        assert any(event.get("stage") == "pdf.metadata" and event["level"] == "info" for event in events)
+
+    def test_page_events_are_sampled(self, tmp_path, make_pdf):
+        """
+        Test per-page events honour the sampling rate
+        """
+        LoggingConfig.configure_logging(
+            tmp_path,
+            page_log_level=logging.DEBUG,
+            page_log_sample_every=2
+        )
+        list(PdfUtils.iter_pages(str(make_pdf(page_count=4))))
+        LoggingConfig.shutdown()
+
+        events = self._page_events(tmp_path / "docubridge.log")
+        assert [event["page"] for event in events] == [1, 3]
+
+    def test_pool_workers_log_through_listener(self, tmp_path, make_pdf):
+        """
+        Test records from extraction worker processes reach the parent's log
+        """
+        LoggingConfig.configure_logging(tmp_path, page_log_level=logging.DEBUG)
+        pages = list(PdfUtils.iter_pages(
+            str(make_pdf(page_count=4)),
+            workers=2,
+            pages_per_shard=1
+        ))
+        LoggingConfig.shutdown()
+
+        events = self._page_events(tmp_path / "docubridge.log")
+        assert len(pages) == 4
+        assert sorted(event["page"] for event in events) == [1, 2, 3, 4]
@@ -0,0 +1,71 @@
+import json
+import pytest
+from app.core.json_to_pdf import JsonToPdfConverter
+from app.core.pdf_to_json import PdfToJsonConverter
+from app.utils.metrics import METRICS, Metrics
+
+class TestMetrics:
+    """
+    Test suite for stage timing and counters
+    """
+    @pytest.fixture(autouse=True)
+    def reset_metrics(self):
+        METRICS.reset()
+        yield
+        METRICS.reset()
+
+    def test_span_records_duration_and_units(self):
+        """
+        Test spans accumulate counts, durations and counted fields
+        """
+        metrics = Metrics()
+        with metrics.span("stage", rows=3) as span:
+            span["bytes"] = 10
+        with metrics.span("stage", rows=2, page=7):
+            pass
+
+        stage = metrics.snapshot()["stages"]["stage"]
+        assert stage["count"] == 2
+        assert stage["total_seconds"] >= stage["max_seconds"] > 0
+        assert stage["units"] == {"rows": 5, "bytes": 10}
+
+    def test_merge_adds_other_snapshots(self):
+        """
+        Test merging a worker snapshot sums counts and units and keeps the max
+        """
+        metrics, worker = Metrics(), Metrics()
+        metrics.observe("stage", 1.0, rows=2)
+        worker.observe("stage", 3.0, rows=5)
+        worker.observe("other", 0.5)
+
+        metrics.merge(worker.snapshot())
+
+        stages = metrics.snapshot()["stages"]
+        assert stages["stage"] == {"count": 2, "total_seconds": 4.0, "max_seconds": 3.0, "units": {"rows": 7}}
+        assert stages["other"]["count"] == 1
+
+    def test_prometheus_format(self):
+        """
+        Test the Prometheus text exposition output
+        """
+        metrics = Metrics()
+        with metrics.span("pdf.extract_text", pages=1):
+            pass
+
+        text = metrics.to_prometheus()
+        assert 'docubridge_stage_duration_seconds_count{stage="pdf.extract_text"} 1' in text
+        assert 'docubridge_stage_units_total{stage="pdf.extract_text",unit="pages"} 1' in text
+
+    def test_converters_are_instrumented(self, make_pdf, tmp_path):
+        """
+        Test both converters report their stages
+        """
+        assert JsonToPdfConverter.convert('{"a": 1}', str(tmp_path / "out.pdf"))
+        assert PdfToJsonConverter.convert(str(make_pdf(page_count=2)), str(tmp_path / "out.json"))
+
+        stages = json.loads(METRICS.to_json())["stages"]
+        for stage in ("json_to_pdf.parse", "json_to_pdf.flatten", "json_to_pdf.table_build",
+                      "json_to_pdf.doc_build", "pdf.extract_text", "pdf_to_json.write"):
+            assert stage in stages
+        assert stages["pdf.extract_text"]["units"]["pages"] == 2
+        assert stages["json_to_pdf.doc_build"]["units"]["bytes"] > 0
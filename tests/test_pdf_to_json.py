@@ -1,3 +1,7 @@
+import io
+import json
+import mmap
+import threading
 import pytest
 from pathlib import Path
 from app.core.pdf_to_json import PdfToJsonConverter
@@ -7,13 +11,11 @@ class TestPdfToJsonConverter:
     Comprehensive test suite for PDF to JSON conversion
     """
     @pytest.fixture
-    def sample_pdf_path(self, tmp_path):
+    def sample_pdf_path(self, make_pdf):
         """
         Create a sample PDF for testing
         """
-        sample_pdf = tmp_path / "sample.pdf"
-        # Implement PDF creation logic
-        return sample_pdf
+        return make_pdf(page_count=2)
 
     def test_successful_conversion(self, sample_pdf_path, tmp_path):
         """
@@ -39,4 +41,182 @@ class TestPdfToJsonConverter:
             str(output_path)
         )
         
-        assert result is False
\ No newline at end of file
+        assert result is False
+
+    def test_streaming_conversion_matches_in_memory(self, make_pdf, tmp_path):
+        """
+        Test streaming mode writes the same document as the in-memory path
+        """
+        pdf_path = make_pdf(page_count=4)
+        buffered_path = tmp_path / "buffered.json"
+        streamed_path = tmp_path / "streamed.json"
+
+        assert PdfToJsonConverter.convert(str(pdf_path), str(buffered_path))
+        assert PdfToJsonConverter.convert(str(pdf_path), str(streamed_path), stream=True)
+
+        buffered = json.loads(buffered_path.read_text(encoding="utf-8"))
+        streamed = json.loads(streamed_path.read_text(encoding="utf-8"))
+        assert streamed == buffered
+        assert len(streamed["pages"]) == 4
+
+    def test_streaming_invalid_pdf_conversion(self, tmp_path):
+        """
+        Test streaming mode reports extraction failures
+        """
+        output_path = tmp_path / "invalid_stream.json"
+        result = PdfToJsonConverter.convert(
+            "/path/to/non/existent/file.pdf",
+            str(output_path),
+            stream=True
+        )
+
+        assert result is False
+
+    def test_progress_and_cancellation(self, make_pdf, tmp_path):
+        """
+        Test page progress is reported and a set cancel event stops conversion
+        """
+        pdf_path = make_pdf(page_count=3)
+        progress = []
+        assert PdfToJsonConverter.convert(
+            str(pdf_path),
+            str(tmp_path / "progress.json"),
+            progress_callback=lambda done, total: progress.append((done, total))
+        )
+        assert progress == [(0, 3), (1, 3), (2, 3), (3, 3)]
+
+        cancel_event = threading.Event()
+        output_path = tmp_path / "cancelled.json"
+
+        def cancel_after_first_page(done, total):
+            if done == 1:
+                cancel_event.set()
+
+        result = PdfToJsonConverter.convert(
+            str(pdf_path),
+            str(output_path),
+            stream=True,
+            progress_callback=cancel_after_first_page,
+            cancel_event=cancel_event
+        )
+
+        assert result is False
+        assert not output_path.exists()
+
+
+    def test_max_pages_conversion(self, make_pdf, tmp_path):
+        """
+        Test max_pages limits extraction and is recorded in the metadata
+        """
+        pdf_path = make_pdf(page_count=5)
+        output_path = tmp_path / "first_pages.json"
+        progress = []
+
+        assert PdfToJsonConverter.convert(
+            str(pdf_path),
+            str(output_path),
+            max_pages=2,
+            progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        result = json.loads(output_path.read_text(encoding="utf-8"))
+        assert result["metadata"]["total_pages"] == 5
+        assert result["metadata"]["page_range"] == [1, 2]
+        assert [page["page_number"] for page in result["pages"]] == [1, 2]
+        assert progress[-1] == (2, 2)
+
+    def test_multiple_artifacts(self, tmp_path):
+        """
+        Test text, tables and words are extracted together for each page
+        """
+        from reportlab.pdfgen import canvas
+
+        pdf_path = tmp_path / "table.pdf"
+        pdf = canvas.Canvas(str(pdf_path))
+        pdf.drawString(72, 720, "Quarterly report")
+        pdf.rect(72, 500, 200, 100)
+        pdf.line(172, 500, 172, 600)
+        pdf.line(72, 550, 272, 550)
+        for x, y, text in [(80, 570, "A"), (180, 570, "B"), (80, 520, "1"), (180, 520, "2")]:
+            pdf.drawString(x, y, text)
+        pdf.showPage()
+        pdf.save()
+        output_path = tmp_path / "artifacts.json"
+
+        assert PdfToJsonConverter.convert(
+            str(pdf_path),
+            str(output_path),
+            artifacts=["words", "tables", "text", "images"]
+        )
+
+        page = json.loads(output_path.read_text(encoding="utf-8"))["pages"][0]
+        assert list(page) == ["page_number", "context", "tables", "words", "images"]
+        assert page["context"].startswith("Quarterly report")
+        assert page["tables"] == [[["A", "B"], ["1", "2"]]]
+        assert page["words"][0]["text"] == "Quarterly"
+        assert set(page["words"][0]) == {"text", "x0", "top", "x1", "bottom"}
+        assert page["images"] == []
+
+    def test_unknown_artifact(self, sample_pdf_path, tmp_path):
+        """
+        Test an unknown artifact name fails the conversion
+        """
+        assert PdfToJsonConverter.convert(
+            str(sample_pdf_path),
+            str(tmp_path / "unknown.json"),
+            artifacts=["text", "sounds"]
+        ) is False
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_output_formats(self, make_pdf, tmp_path, stream):
+        """
+        Test compact and ndjson outputs carry the same content as pretty json
+        """
+        pdf_path = str(make_pdf(page_count=3))
+        outputs = {}
+        for output_format in ("json", "compact", "ndjson"):
+            output_path = tmp_path / f"{output_format}.out"
+            assert PdfToJsonConverter.convert(
+                pdf_path,
+                str(output_path),
+                stream=stream,
+                output_format=output_format
+            )
+            outputs[output_format] = output_path.read_bytes()
+
+        document = json.loads(outputs["json"])
+        assert json.loads(outputs["compact"]) == document
+        assert len(outputs["compact"]) < len(outputs["json"])
+
+        lines = [json.loads(line) for line in outputs["ndjson"].splitlines()]
+        assert lines[0] == {"metadata": document["metadata"]}
+        assert lines[1:] == document["pages"]
+
+    @pytest.mark.parametrize("source", ["bytes", "memoryview", "mmap", "stream"])
+    def test_in_memory_conversion(self, make_pdf, tmp_path, source):
+        """
+        Test buffers and file-like inputs convert without touching the disk
+        """
+        pdf_path = make_pdf(page_count=3)
+        expected_path = tmp_path / "expected.json"
+        assert PdfToJsonConverter.convert(str(pdf_path), str(expected_path), output_format="compact")
+        expected = json.loads(expected_path.read_bytes())
+
+        with open(pdf_path, "rb") as pdf_file:
+            data = pdf_file.read()
+            pdf_file.seek(0)
+            inputs = {
+                "bytes": lambda: data,
+                "memoryview": lambda: memoryview(data),
+                "mmap": lambda: mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ),
+                "stream": lambda: io.BytesIO(data),
+            }
+            source_data = inputs[source]()
+            output = PdfToJsonConverter.convert_to_bytes(source_data, stream=True, output_format="compact")
+            if source == "mmap":
+                source_data.close()
+
+        document = json.loads(output)
+        assert document["pages"] == expected["pages"]
+        assert document["metadata"]["file_path"] is None
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["expected.json", pdf_path.name]
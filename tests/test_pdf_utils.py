@@ -0,0 +1,197 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import pytest
+from app.utils.pdf_utils import PdfUtils, PdfiumBackend
+
+class TestPdfUtils:
+    """
+    Test suite for PDF parsing utilities
+    """
+    def test_extract_text_from_pdf(self, make_pdf):
+        """
+        Test sequential extraction keeps metadata and page order
+        """
+        pdf_path = make_pdf(page_count=3)
+        result = PdfUtils.extract_text_from_pdf(str(pdf_path))
+
+        assert result["metadata"]["total_pages"] == 3
+        assert [page["page_number"] for page in result["pages"]] == [1, 2, 3]
+        assert result["pages"][1]["context"] == "Page 2 content"
+
+    def test_parallel_extraction_matches_sequential(self, make_pdf):
+        """
+        Test sharded extraction merges back into the sequential result
+        """
+        pdf_path = make_pdf(page_count=7)
+        sequential = PdfUtils.extract_text_from_pdf(str(pdf_path))
+        parallel = PdfUtils.extract_text_from_pdf(
+            str(pdf_path),
+            workers=3,
+            pages_per_shard=2
+        )
+
+        assert parallel == sequential
+
+    def test_pdfium_engine_matches_pdfplumber_text(self, make_pdf):
+        """
+        Test the pdfium fast path extracts the same plain text
+        """
+        pdf_path = make_pdf(page_count=2)
+        pdfium = list(PdfUtils.iter_pages(str(pdf_path), engine="pdfium"))
+
+        assert [page["context"] for page in pdfium] == ["Page 1 content", "Page 2 content"]
+
+    def test_pdfium_engine_falls_back_to_pdfplumber(self, make_pdf, monkeypatch):
+        """
+        Test a pdfium failure hands the remaining pages to pdfplumber
+        """
+        def failing_iter_pages(self, pdf_path, first_page, last_page, *args):
+            yield {"page_number": first_page, "context": "from pdfium"}
+            raise RuntimeError("pdfium failure")
+
+        monkeypatch.setattr(PdfiumBackend, "iter_pages", failing_iter_pages)
+        pdf_path = make_pdf(page_count=3)
+        pages = list(PdfUtils.iter_pages(str(pdf_path), engine="pdfium"))
+
+        assert [page["page_number"] for page in pages] == [1, 2, 3]
+        assert pages[0]["context"] == "from pdfium"
+        assert pages[2]["context"] == "Page 3 content"
+
+    def test_unknown_engine(self, make_pdf):
+        """
+        Test an unknown engine name is rejected
+        """
+        with pytest.raises(ValueError):
+            list(PdfUtils.iter_pages(str(make_pdf()), engine="missing"))
+
+    def test_get_pdf_metadata(self, make_pdf):
+        """
+        Test the metadata fast path reads page count and document info
+        """
+        metadata = PdfUtils.get_pdf_metadata(str(make_pdf(page_count=4)))
+
+        assert metadata["total_pages"] == 4
+        assert "Producer" in metadata["info"]
+        assert PdfUtils.get_pdf_metadata("/path/to/non/existent/file.pdf") == {}
+
+    def test_resolve_page_range(self):
+        """
+        Test page selections are clamped to the document
+        """
+        assert PdfUtils.resolve_page_range(10) == (1, 10)
+        assert PdfUtils.resolve_page_range(10, (3, 20)) == (3, 10)
+        assert PdfUtils.resolve_page_range(10, (3, 8), max_pages=2) == (3, 4)
+        with pytest.raises(ValueError):
+            PdfUtils.resolve_page_range(10, (5, 2))
+
+    def test_page_range_extraction(self, make_pdf):
+        """
+        Test only the selected pages are extracted, sequentially and in parallel
+        """
+        pdf_path = str(make_pdf(page_count=9))
+        sequential = list(PdfUtils.iter_pages(pdf_path, page_range=(2, 8), max_pages=5))
+        parallel = list(PdfUtils.iter_pages(
+            pdf_path,
+            workers=2,
+            pages_per_shard=2,
+            page_range=(2, 8),
+            max_pages=5
+        ))
+
+        assert [page["page_number"] for page in sequential] == [2, 3, 4, 5, 6]
+        assert parallel == sequential
+
+    def test_pdfium_defers_to_pdfplumber_for_layout_artifacts(self, make_pdf):
+        """
+        Test artifacts pdfium cannot produce are extracted with pdfplumber
+        """
+        pdf_path = str(make_pdf(page_count=2))
+        pages = list(PdfUtils.iter_pages(pdf_path, engine="pdfium", artifacts=["text", "words"]))
+
+        assert [page["context"] for page in pages] == ["Page 1 content", "Page 2 content"]
+        assert [word["text"] for word in pages[1]["words"]] == ["Page", "2", "content"]
+
+    def test_rss_ceiling_keeps_results(self, make_pdf):
+        """
+        Test flushing and backpressure under an RSS ceiling do not change output
+        """
+        pdf_path = str(make_pdf(page_count=5))
+        expected = list(PdfUtils.iter_pages(pdf_path))
+
+        assert list(PdfUtils.iter_pages(pdf_path, max_rss_mb=1)) == expected
+        assert list(PdfUtils.iter_pages(
+            pdf_path,
+            workers=2,
+            pages_per_shard=2,
+            max_rss_mb=1
+        )) == expected
+
+    def test_pages_are_released_after_extraction(self, make_pdf, monkeypatch):
+        """
+        Test each pdfplumber page is closed once its record is built
+        """
+        import pdfplumber.page
+
+        closed = []
+        original_close = pdfplumber.page.Page.close
+
+        def tracking_close(page):
+            closed.append(page.page_number)
+            original_close(page)
+
+        monkeypatch.setattr(pdfplumber.page.Page, "close", tracking_close)
+        pages = PdfUtils.iter_pages(str(make_pdf(page_count=3)))
+
+        assert next(pages)["page_number"] == 1
+        assert closed == [1]
+        pages.close()
+
+    def test_pdfium_is_safe_across_threads(self, make_pdf):
+        """
+        Test concurrent pdfium conversions serialize their pdfium calls
+        """
+        pdf_paths = [str(make_pdf(page_count=5, name=f"{index}.pdf")) for index in range(4)]
+        expected = [f"Page {number} content" for number in range(1, 6)]
+
+        def extract(pdf_path):
+            assert PdfUtils.get_pdf_page_count(pdf_path, raise_errors=True) == 5
+            return [page["context"] for page in PdfUtils.iter_pages(pdf_path, engine="pdfium")]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(extract, pdf_paths * 20))
+
+        assert all(result == expected for result in results)
+
+        # The lock is released between pages, so open documents interleave
+        first = PdfUtils.iter_pages(pdf_paths[0], engine="pdfium")
+        second = PdfUtils.iter_pages(pdf_paths[1], engine="pdfium")
+        assert next(first)["page_number"] == next(second)["page_number"] == 1
+        first.close()
+        second.close()
+
+    def test_forked_workers_do_not_inherit_a_held_pdfium_lock(self, make_pdf):
+        """
+        Test pool workers start while another thread is inside pdfium
+        """
+        from app.utils import pdf_utils
+
+        pdf_path = str(make_pdf(page_count=4))
+        holding, release = threading.Event(), threading.Event()
+
+        def hold_lock():
+            with pdf_utils._PDFIUM_LOCK:
+                holding.set()
+                release.wait(10)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        holding.wait(10)
+        threading.Timer(0.2, release.set).start()
+        try:
+            # Forks right away, while the other thread still holds the lock
+            shards = list(PdfUtils._iter_shards_parallel(pdf_path, 1, 4, 2, 1, "pdfium"))
+        finally:
+            release.set()
+            holder.join(10)
+
+        assert [page["page_number"] for shard in shards for page in shard] == [1, 2, 3, 4]
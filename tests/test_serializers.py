@@ -0,0 +1,42 @@
+import json
+import sys
+import pytest
+from app.utils.serializers import JsonSerializer, OrjsonSerializer, get_serializer
+
+class TestSerializers:
+    """
+    Test suite for JSON serializer backends
+    """
+    @pytest.fixture
+    def document(self):
+        return {"metadata": {"total_pages": 2}, "pages": [{"page_number": 1, "context": "héllo"}]}
+
+    def test_stdlib_formats(self, document):
+        """
+        Test pretty output matches json.dumps and compact output has no whitespace
+        """
+        serializer = JsonSerializer()
+
+        assert serializer.dumps(document, pretty=True).decode("utf-8") == json.dumps(document, indent=2, ensure_ascii=False)
+        assert serializer.dumps(document) == '{"metadata":{"total_pages":2},"pages":[{"page_number":1,"context":"héllo"}]}'.encode("utf-8")
+
+    def test_orjson_matches_stdlib(self, document):
+        """
+        Test the orjson backend produces byte-identical output
+        """
+        pytest.importorskip("orjson")
+        fast, stdlib = OrjsonSerializer(), JsonSerializer()
+
+        assert fast.dumps(document) == stdlib.dumps(document)
+        assert fast.dumps(document, pretty=True) == stdlib.dumps(document, pretty=True)
+
+    def test_falls_back_to_stdlib(self, monkeypatch):
+        """
+        Test a missing orjson falls back to the standard library
+        """
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        assert get_serializer("auto").name == "stdlib"
+        assert get_serializer("orjson").name == "stdlib"
+        with pytest.raises(ValueError):
+            get_serializer("msgpack")
@@ -0,0 +1,164 @@
+import http.client
+import json
+import socket
+import threading
+import time
+import pytest
+from app.config import AppConfig
+from app.server import ConversionService, QueueFullError, create_server
+from app.utils.metrics import METRICS
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """
+    HTTPConnection over a Unix domain socket
+    """
+    def __init__(self, socket_path):
+        super().__init__("localhost")
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+class TestConversionService:
+    """
+    Test suite for the local conversion service
+    """
+    @pytest.fixture(params=[True, False], ids=["processes", "threads"])
+    def service(self, request, tmp_path):
+        config = AppConfig(base_dir=tmp_path)
+        config.cache_enabled = False
+        service = ConversionService(config, workers=1, queue_size=1, retention=2, use_processes=request.param)
+        yield service
+        service.shutdown()
+
+    @staticmethod
+    def _wait(service, job_id, timeout=30):
+        deadline = time.monotonic() + timeout
+        while service.get(job_id).status in ("queued", "running"):
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+        return service.get(job_id)
+
+    def test_converts_both_directions(self, service, make_pdf):
+        """
+        Test JSON and PDF jobs finish with their results on disk
+        """
+        json_job = service.submit("json", json.dumps({"name": "DocuBridge"}).encode())
+        pdf_job = service.submit("pdf", make_pdf(page_count=2).read_bytes(), {"output_format": "ndjson"})
+
+        assert self._wait(service, json_job.job_id).status == "done"
+        assert json_job.output_path.read_bytes().startswith(b"%PDF")
+        assert self._wait(service, pdf_job.job_id).status == "done"
+        assert len(pdf_job.output_path.read_text().splitlines()) == 3
+        assert pdf_job.payload is None
+        assert sorted(path.name for path in pdf_job.output_path.parent.iterdir()) == ["output.jsonl"]
+
+    def test_worker_metrics_and_progress_reach_the_service(self, service, make_pdf):
+        """
+        Test stage metrics and progress are reported from either job runner
+        """
+        METRICS.reset()
+        job = service.submit("pdf", make_pdf(page_count=3).read_bytes())
+
+        assert self._wait(service, job.job_id).status == "done"
+        assert job.progress == 1.0
+        assert METRICS.snapshot()["stages"]["pdf_to_json.stream"]["units"]["pages"] == 3
+
+    def test_cancel_running_job(self, service):
+        """
+        Test cancelling a running job stops the converter
+        """
+        records = b"".join(json.dumps({"id": index, "tags": ["a", "b"]}).encode() + b"\n" for index in range(200_000))
+        job = service.submit("jsonl", records)
+        deadline = time.monotonic() + 30
+        while job.progress == 0.0:
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+        service.cancel(job.job_id)
+
+        assert self._wait(service, job.job_id).status == "cancelled"
+        assert not job.output_path.exists()
+
+    def test_rejects_jobs_beyond_queue(self, service, monkeypatch):
+        """
+        Test submissions beyond workers + queue_size raise QueueFullError
+        """
+        release = threading.Event()
+        monkeypatch.setattr(service, "_run_job", lambda job: release.wait(10))
+
+        service.submit("json", b"{}")
+        service.submit("json", b"{}")
+        with pytest.raises(QueueFullError):
+            service.submit("json", b"{}")
+        release.set()
+
+    def test_cancel_queued_job(self, service, monkeypatch):
+        """
+        Test a job still waiting in the queue can be cancelled
+        """
+        release = threading.Event()
+        monkeypatch.setattr(service, "_run_job", lambda job: release.wait(10))
+
+        service.submit("json", b"{}")
+        queued = service.submit("json", b"{}")
+        service.cancel(queued.job_id)
+        release.set()
+
+        assert self._wait(service, queued.job_id).status == "cancelled"
+
+    def test_retention_evicts_old_jobs(self, service):
+        """
+        Test only the most recent finished jobs are kept
+        """
+        job_ids = []
+        for index in range(3):
+            job = service.submit("json", json.dumps({"index": index}).encode())
+            self._wait(service, job.job_id)
+            job_ids.append(job.job_id)
+
+        assert service.get(job_ids[0]) is None
+        assert service.get(job_ids[2]).status == "done"
+
+    @pytest.mark.parametrize("transport", ["tcp", "unix"])
+    def test_http_api(self, service, make_pdf, tmp_path, transport):
+        """
+        Test submitting, polling and downloading a result over HTTP
+        """
+        if transport == "unix":
+            socket_path = tmp_path / "docubridge.sock"
+            server = create_server(service, unix_socket=socket_path)
+            connect = lambda: UnixHTTPConnection(str(socket_path))
+        else:
+            server = create_server(service, port=0)
+            connect = lambda: http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        def request(method, path, body=None):
+            connection = connect()
+            connection.request(method, path, body=body)
+            response = connection.getresponse()
+            payload = response.read()
+            connection.close()
+            return response.status, payload
+
+        try:
+            status, body = request("POST", "/jobs?type=pdf&output_format=compact", make_pdf(page_count=2).read_bytes())
+            assert status == 202
+            job_id = json.loads(body)["job_id"]
+
+            self._wait(service, job_id)
+            status, body = request("GET", f"/jobs/{job_id}")
+            assert json.loads(body)["status"] == "done"
+
+            status, body = request("GET", f"/jobs/{job_id}/result")
+            assert status == 200
+            assert json.loads(body)["metadata"]["total_pages"] == 2
+
+            assert request("POST", "/jobs?type=docx", b"")[0] == 400
+            assert request("GET", "/jobs/missing")[0] == 404
+            assert json.loads(request("GET", "/health")[1])["status"] == "ok"
+        finally:
+            server.shutdown()
+            server.server_close()